@@ -87,7 +87,8 @@ Original Text ({len(text)} chars):
                 f.write(log_entry)
     
     def log_response(self, provider: str, translated_text: str, 
-                    success: bool = True, error: Optional[str] = None):
+                    success: bool = True, error: Optional[str] = None,
+                    usage: Optional[Dict[str, Any]] = None):
         """
         Log AI translation response.
         
@@ -96,13 +97,17 @@ Original Text ({len(text)} chars):
             translated_text: Translated text (if successful)
             success: Whether request was successful
             error: Error message (if failed)
+            usage: Token usage reported by the provider (if any)
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        usage_line = ""
+        if isinstance(usage, dict) and usage:
+            usage_line = "Usage: " + ", ".join(f"{k}={v}" for k, v in usage.items() if not isinstance(v, (dict, list))) + "\n"
         
         if success:
             log_entry = f"""[{timestamp}] RESPONSE - SUCCESS
 Provider: {provider}
-Translated Text ({len(translated_text)} chars):
+{usage_line}Translated Text ({len(translated_text)} chars):
 {'-' * 50}
 {translated_text}
 {'-' * 50}
@@ -241,10 +246,11 @@ def log_ai_request(provider: str, model: str, text: str,
 
 
 def log_ai_response(provider: str, translated_text: str = "", 
-                   success: bool = True, error: Optional[str] = None):
+                   success: bool = True, error: Optional[str] = None,
+                   usage: Optional[Dict[str, Any]] = None):
     """Convenience function to log AI response."""
     logger = get_ai_logger()
-    logger.log_response(provider, translated_text, success, error)
+    logger.log_response(provider, translated_text, success, error, usage)
 
 
 def log_character_limit_retry(provider: str, original_length: int, max_length: int):
@@ -8,8 +8,13 @@ Author: Emre Ertunç
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 import requests
+import json
 import os
+import random
+import threading
 import time
+from ratelimit import limiter_for, retry_after_seconds
+from utils import print_warning
 from ai_logger import (
     log_ai_request,
     log_ai_response,
@@ -19,6 +24,10 @@ from ai_logger import (
 )
 
 
+class StructuredReplyError(ValueError):
+    """A JSON-mode reply was cut off at its output limit or is not a JSON object."""
+
+
 class AIProvider(ABC):
     """Abstract base class for AI translation providers."""
     
@@ -47,6 +56,225 @@ class AIProvider(ABC):
         """Get provider name."""
         pass
 
+    def structured_output_cap(self) -> int:
+        """Most answer tokens one translate_json() call may request; 0 when unsupported."""
+        return 0
+
+    def translate_json(self, source: Dict[str, Any], target_language: str, *,
+                       schema: Dict[str, Any],
+                       instructions: str,
+                       max_output_tokens: int,
+                       seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Translate a JSON object of fields using the provider's structured-output mode.
+
+        Args:
+            source: Field key to source text (or list of keywords)
+            target_language: Target language name
+            schema: JSON Schema the reply object must follow
+            instructions: Output contract and guidance for this call
+            max_output_tokens: Answer token budget, at most structured_output_cap()
+            seed: Optional deterministic seed reused across locales
+        Returns:
+            The parsed reply object
+
+        Raises StructuredReplyError when the reply was truncated or is not a
+        JSON object; HTTP failures raise like translate().
+        """
+        raise NotImplementedError(f"{self.get_name()} has no structured output mode")
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session reused across this provider's calls.
+
+        Created on first use; keep-alive connections avoid a TLS handshake
+        per request, and the pool is sized for parallel locale workers.
+        """
+        session = self.__dict__.get("_session")
+        if session is None:
+            with _SESSION_LOCK:
+                session = self.__dict__.get("_session")
+                if session is None:
+                    session = requests.Session()
+                    # Never smaller than the limiter's in-flight cap, so no request opens a throwaway connection
+                    limiter = getattr(self, "limiter", None)
+                    pool_size = max(20, getattr(limiter, "max_concurrency", 0) or 0)
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        session = self.__dict__.pop("_session", None)
+        if session is not None:
+            session.close()
+
+    def _post(self, url: str, **kwargs):
+        """POST through this provider's rate limiter (see ratelimit.py).
+
+        Paces requests proactively and reports status and token usage back so
+        the limiter can tune its concurrency. Without a limiter this is a plain
+        ``session.post``.
+        """
+        limiter = getattr(self, "limiter", None)
+        if limiter is None:
+            return self.session.post(url, **kwargs)
+        payload = kwargs.get("json")
+        estimated_tokens = len(json.dumps(payload, ensure_ascii=False)) // 3 if payload is not None else 0
+        with limiter.slot(estimated_tokens) as ticket:
+            response = self.session.post(url, **kwargs)
+        limiter.update(
+            ticket,
+            used_tokens=_usage_tokens(response),
+            status_code=getattr(response, "status_code", None),
+        )
+        return response
+
+    def _structured_post(self, url: str, data: Dict[str, Any], *, drop_seed=None, **kwargs) -> Dict[str, Any]:
+        """POST a translate_json() request and return the decoded body.
+
+        Retries once without the seed when the model rejects it (``drop_seed``
+        removes it from ``data``). HTTP failures are logged and raised.
+        """
+        name = self.get_name()
+        response, duration_ms = self._send_with_retries(url, json=data, **kwargs)
+        if response is None:
+            raise Exception(f"{name} request failed: no response")
+        if response.status_code == 400 and drop_seed is not None and "seed" in (response.text or "").lower():
+            log_ai_error(name, "Retrying without seed due to model not supporting it", {"model": self.model})
+            drop_seed()
+            response, duration_ms = self._send_with_retries(url, json=data, **kwargs)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as http_err:
+            log_ai_http_error(
+                provider=name,
+                endpoint=url.split("?", 1)[0],
+                status_code=response.status_code,
+                response_excerpt=(response.text or "")[:1000],
+                duration_ms=duration_ms,
+                model=self.model,
+            )
+            log_ai_response(name, "", success=False, error=str(http_err))
+            raise Exception(f"{name} API error {response.status_code}: {http_err}")
+        return response.json()
+
+    def _send_with_retries(self, url: str, *, method: str = "POST", max_attempts: Optional[int] = None, **kwargs):
+        """POST (or GET) with retries on rate limits, overloads, and transient network errors.
+
+        Retries HTTP 429/500/502/503/504/529 and timeouts/connection errors,
+        honoring ``Retry-After`` (or ``retry-after-ms``) when the provider sends
+        it and otherwise backing off exponentially with full jitter. The last
+        retryable response is returned as-is so callers report it like any other
+        HTTP error. Returns ``(response, duration_ms)``.
+        """
+        if max_attempts is None:
+            max_attempts = _env_int("TRANSLATER_AI_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)
+        max_attempts = max(1, max_attempts)
+        name = self.get_name()
+        response = None
+        duration_ms = 0
+        for attempt in range(1, max_attempts + 1):
+            try:
+                start = time.monotonic()
+                response = self._post(url, **kwargs) if method == "POST" else self.session.get(url, **kwargs)
+                duration_ms = int((time.monotonic() - start) * 1000)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as err:
+                log_ai_error(
+                    name,
+                    "Transient network error",
+                    {"attempt": attempt, "max_attempts": max_attempts, "error": str(err), "model": getattr(self, "model", None)},
+                )
+                if attempt >= max_attempts:
+                    raise
+                wait = _backoff_delay(attempt)
+                reason = type(err).__name__
+            else:
+                status = getattr(response, "status_code", None)
+                if status not in RETRYABLE_STATUS_CODES:
+                    return response, duration_ms
+                headers = getattr(response, "headers", None) or {}
+                log_ai_error(
+                    name,
+                    "Retryable HTTP status",
+                    {
+                        "attempt": attempt,
+                        "max_attempts": max_attempts,
+                        "status": status,
+                        "request_id": headers.get("x-request-id") or headers.get("request-id"),
+                        "model": getattr(self, "model", None),
+                    },
+                )
+                if attempt >= max_attempts:
+                    return response, duration_ms
+                retry_after = retry_after_seconds(response)
+                wait = retry_after if retry_after is not None else _backoff_delay(attempt)
+                reason = f"HTTP {status}"
+            print_warning(f"{name}: {reason}, retry {attempt}/{max_attempts - 1} in {wait:.1f}s")
+            try:
+                time.sleep(wait)
+            except Exception:
+                pass
+        return response, duration_ms
+
+
+def _reply_object(text: Optional[str]) -> Dict[str, Any]:
+    """Parse a JSON-mode reply, which must be a single JSON object."""
+    try:
+        parsed = json.loads(text or "")
+    except ValueError as err:
+        raise StructuredReplyError(f"reply is not valid JSON: {err}")
+    if not isinstance(parsed, dict):
+        raise StructuredReplyError("reply is not a JSON object")
+    return parsed
+
+
+# Extra output tokens for models whose output limit also covers reasoning/thinking
+REASONING_TOKEN_ALLOWANCE = 8192
+
+# Guards lazy creation of AIProvider.session across worker threads
+_SESSION_LOCK = threading.Lock()
+
+# HTTP statuses worth retrying: rate limits, server errors, Anthropic "overloaded"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+DEFAULT_MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter: uniform(0, min(cap, base * 2**(attempt-1)))."""
+    ceiling = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling)
+
+
+def _usage_tokens(response) -> Optional[int]:
+    """Total tokens reported by Anthropic, OpenAI, or Gemini responses, if any."""
+    try:
+        body = response.json()
+    except Exception:
+        return None
+    if not isinstance(body, dict):
+        return None
+    usage = body.get("usage") or {}
+    if isinstance(usage, dict):
+        if usage.get("total_tokens") is not None:
+            return int(usage["total_tokens"])
+        if usage.get("input_tokens") is not None or usage.get("output_tokens") is not None:
+            return int(usage.get("input_tokens") or 0) + int(usage.get("output_tokens") or 0)
+    meta = body.get("usageMetadata") or {}
+    if isinstance(meta, dict) and meta.get("totalTokenCount") is not None:
+        return int(meta["totalTokenCount"])
+    return None
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic Claude AI provider."""
@@ -54,6 +282,7 @@ class AnthropicProvider(AIProvider):
     def __init__(self, api_key: str, model: str = None):
         self.api_key = api_key
         self.model = model
+        self.limiter = limiter_for("anthropic")
     
     def translate(self, text: str, target_language: str,
                   max_length: Optional[int] = None,
@@ -66,47 +295,10 @@ class AnthropicProvider(AIProvider):
         
         try:
             url = "https://api.anthropic.com/v1/messages"
-            headers = {
-                "Content-Type": "application/json",
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01"
-            }
-            
-            # Build system message
-            system_message = (
-                f"You are a professional translator specializing in App Store metadata translation. "
-                f"Translate the following text to {target_language}. "
-                f"Maintain the marketing tone and style of the original text."
-            )
-            
-            if is_keywords:
-                system_message += " For keywords, provide a comma-separated list and keep it concise."
+            headers = self._headers()
+            data = self._build_request_body(text, target_language, max_length, is_keywords, seed, refinement)
             
-            if max_length:
-                system_message += (
-                    f" CRITICAL: Your translation MUST be EXACTLY {max_length} characters or fewer "
-                    f"INCLUDING ALL SPACES, PUNCTUATION, AND SPECIAL CHARACTERS. Count every single "
-                    f"character including spaces between words. Do not add ellipsis (...) at the end. "
-                    f"Create a concise but meaningful translation that captures the essence of the "
-                    f"original message while staying within the character limit."
-                )
-            if refinement:
-                system_message += f" Additional guidance: {refinement}"
-            
-            data = {
-                "model": self.model,
-                "system": system_message,
-                "max_tokens": 1000,
-                "messages": [
-                    {"role": "user", "content": text}
-                ]
-            }
-            if seed is not None:
-                data["metadata"] = {"seed": str(seed)}
-            
-            start = time.monotonic()
-            response = requests.post(url, headers=headers, json=data)
-            duration_ms = int((time.monotonic() - start) * 1000)
+            response, duration_ms = self._send_with_retries(url, headers=headers, json=data)
             try:
                 response.raise_for_status()
             except requests.exceptions.HTTPError as http_err:
@@ -153,16 +345,15 @@ class AnthropicProvider(AIProvider):
                 log_character_limit_retry("Anthropic Claude", len(translated_text), max_length)
                 
                 # Try again with even stricter instructions
-                system_message += f" The text MUST be under {max_length} characters INCLUDING SPACES AND PUNCTUATION. Count every character. Prioritize brevity."
-                data["system"] = system_message
+                data["system"] += f" The text MUST be under {max_length} characters INCLUDING SPACES AND PUNCTUATION. Count every character. Prioritize brevity."
                 
-                response = requests.post(url, headers=headers, json=data)
+                response, _ = self._send_with_retries(url, headers=headers, json=data)
                 response.raise_for_status()
                 response_data = response.json()
                 translated_text = response_data["content"][0]["text"]
             
-            # Log successful response
-            log_ai_response("Anthropic Claude", translated_text, success=True)
+            # Log successful response (with token usage)
+            log_ai_response("Anthropic Claude", translated_text, success=True, usage=response_data.get("usage"))
             return translated_text.strip()
             
         except requests.exceptions.HTTPError as e:
@@ -173,6 +364,146 @@ class AnthropicProvider(AIProvider):
             log_ai_response("Anthropic Claude", "", success=False, error=str(e))
             raise Exception(f"Anthropic translation failed: {str(e)}")
     
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
+
+    def _build_request_body(self, text: str, target_language: str,
+                            max_length: Optional[int] = None,
+                            is_keywords: bool = False,
+                            seed: Optional[int] = None,
+                            refinement: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Messages API payload shared by translate() and batches."""
+        system_message = (
+            f"You are a professional translator specializing in App Store metadata translation. "
+            f"Translate the following text to {target_language}. "
+            f"Maintain the marketing tone and style of the original text."
+        )
+        
+        if is_keywords:
+            system_message += " For keywords, provide a comma-separated list and keep it concise."
+        
+        if max_length:
+            system_message += (
+                f" CRITICAL: Your translation MUST be EXACTLY {max_length} characters or fewer "
+                f"INCLUDING ALL SPACES, PUNCTUATION, AND SPECIAL CHARACTERS. Count every single "
+                f"character including spaces between words. Do not add ellipsis (...) at the end. "
+                f"Create a concise but meaningful translation that captures the essence of the "
+                f"original message while staying within the character limit."
+            )
+        if refinement:
+            system_message += f" Additional guidance: {refinement}"
+        
+        data = {
+            "model": self.model,
+            "system": system_message,
+            "max_tokens": 1000,
+            "messages": [
+                {"role": "user", "content": text}
+            ]
+        }
+        if seed is not None:
+            data["metadata"] = {"seed": str(seed)}
+        return data
+
+    def submit_batch(self, jobs: List[Dict[str, Any]]) -> str:
+        """Submit translation jobs to the Message Batches API and return the batch id.
+
+        Each job holds a ``custom_id`` plus the keyword arguments of translate().
+        """
+        requests_payload = []
+        for job in jobs:
+            params = self._build_request_body(
+                job["text"], job["target_language"], job.get("max_length"),
+                job.get("is_keywords", False), job.get("seed"), job.get("refinement"),
+            )
+            requests_payload.append({"custom_id": job["custom_id"], "params": params})
+        response, _ = self._send_with_retries(
+            "https://api.anthropic.com/v1/messages/batches",
+            headers=self._headers(),
+            json={"requests": requests_payload},
+        )
+        response.raise_for_status()
+        return response.json()["id"]
+
+    def poll_batch(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Return ``{custom_id: text}`` once the batch has ended, else None.
+
+        Failed or expired entries are left out so callers can retry them directly.
+        """
+        response, _ = self._send_with_retries(
+            f"https://api.anthropic.com/v1/messages/batches/{batch_id}",
+            method="GET",
+            headers=self._headers(),
+        )
+        response.raise_for_status()
+        batch = response.json()
+        if batch.get("processing_status") != "ended":
+            return None
+        results_url = batch.get("results_url")
+        if not results_url:
+            return {}
+        response, _ = self._send_with_retries(results_url, method="GET", headers=self._headers())
+        response.raise_for_status()
+        outputs: Dict[str, str] = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            result = entry.get("result") or {}
+            if result.get("type") != "succeeded":
+                continue
+            content = (result.get("message") or {}).get("content") or []
+            if content and isinstance(content[0], dict) and content[0].get("text") is not None:
+                outputs[entry["custom_id"]] = content[0]["text"].strip()
+        return outputs
+    
+    def structured_output_cap(self) -> int:
+        model = self.model or ""
+        if model.startswith("claude-3-5"):
+            return 8192
+        if model.startswith("claude-3-") and not model.startswith("claude-3-7"):
+            return 4096
+        return 32000
+
+    def translate_json(self, source: Dict[str, Any], target_language: str, *,
+                       schema: Dict[str, Any],
+                       instructions: str,
+                       max_output_tokens: int,
+                       seed: Optional[int] = None) -> Dict[str, Any]:
+        """Translate a JSON object of fields via a forced tool call whose input follows `schema`."""
+        text = json.dumps(source, ensure_ascii=False)
+        log_ai_request("Anthropic Claude", self.model, text, target_language, None, False, seed, instructions)
+        data = {
+            "model": self.model,
+            "system": (
+                f"You are a professional translator specializing in App Store metadata translation. "
+                f"{instructions}"
+            ),
+            "max_tokens": min(max_output_tokens, self.structured_output_cap()),
+            "tools": [{
+                "name": "submit_translation",
+                "description": f"Submit the {target_language} translation of every field.",
+                "input_schema": schema,
+            }],
+            "tool_choice": {"type": "tool", "name": "submit_translation"},
+            "messages": [{"role": "user", "content": text}],
+        }
+        if seed is not None:
+            data["metadata"] = {"seed": str(seed)}
+        body = self._structured_post("https://api.anthropic.com/v1/messages", data, headers=self._headers())
+        if body.get("stop_reason") == "max_tokens":
+            raise StructuredReplyError(f"reply stopped at max_tokens ({data['max_tokens']})")
+        for block in body.get("content") or []:
+            if isinstance(block, dict) and block.get("type") == "tool_use" and isinstance(block.get("input"), dict):
+                log_ai_response("Anthropic Claude", json.dumps(block["input"], ensure_ascii=False),
+                                success=True, usage=body.get("usage"))
+                return block["input"]
+        raise StructuredReplyError("reply has no tool_use block")
+
     def get_name(self) -> str:
         return "Anthropic Claude"
 
@@ -202,6 +533,7 @@ class OpenAIProvider(AIProvider):
         else:
             read_timeout = 60
         self.timeout = (connect_timeout, read_timeout)
+        self.limiter = limiter_for("openai")
     
     def translate(self, text: str, target_language: str,
                   max_length: Optional[int] = None,
@@ -212,49 +544,11 @@ class OpenAIProvider(AIProvider):
         # Log the request
         log_ai_request("OpenAI GPT", self.model, text, target_language, max_length, is_keywords, seed, refinement)
 
-        is_gpt_5 = self.model.startswith("gpt-5")
-
         try:
             url = "https://api.openai.com/v1/chat/completions"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Build system message
-            system_message = (
-                f"You are a professional translator specializing in App Store metadata translation.\n\n"
-                f"# Core Instructions\n"
-                f"- Translate the following text to {target_language}.\n"
-                f"- Maintain the marketing tone, formatting and style of the original text.\n"
-            )
-            
-            if is_keywords:
-                system_message += "- For keywords, provide a comma-separated list and keep it concise.\n"
-            
-            if max_length:
-                system_message += (
-                    f"- Create a concise but meaningful translation that captures the essence of the original message.\n"
-                )
-            if refinement:
-                system_message += f"- Additional guidance: {refinement}\n"
-
-            if is_gpt_5:
-                system_message += (
-                    f"\n# Reasoning Instructions\n"
-                    f"- - After completing the translation, review your output to confirm all content is accurately and fully translated and meets stylistic and tone requirements.\n"
-                    f"- If any issues are detected, self-correct before finalizing.\n"
-                )
-            
-            data = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": text}
-                ],
-                "max_completion_tokens" if is_gpt_5 else "max_tokens": 2000,
-                "temperature": 1.0 if is_gpt_5 else 0.7
-            }
+            headers = self._headers()
+            data = self._build_request_body(text, target_language, max_length, is_keywords, seed, refinement)
+            system_message = data["messages"][0]["content"]
             if self.service_tier:
                 # OpenAI processing tier (e.g., "flex") for chat completions.
                 data["service_tier"] = self.service_tier
@@ -262,57 +556,7 @@ class OpenAIProvider(AIProvider):
                 # Some models may reject seed; we'll retry without it if needed
                 data["seed"] = seed
 
-            def _send_once(current_data):
-                start = time.monotonic()
-                resp = requests.post(url, headers=headers, json=current_data, timeout=self.timeout)
-                dur = int((time.monotonic() - start) * 1000)
-                return resp, dur
-
-            def _is_retryable_http(resp) -> bool:
-                try:
-                    return int(getattr(resp, "status_code", 0)) in {429, 500, 502, 503, 504}
-                except Exception:
-                    return False
-
-            def _send_with_retries(current_data):
-                max_attempts = 5
-                response = None
-                duration_ms = 0
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        response, duration_ms = _send_once(current_data)
-                    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as err:
-                        log_ai_error(
-                            "OpenAI GPT",
-                            "Transient network error",
-                            {"attempt": attempt, "max_attempts": max_attempts, "error": str(err), "model": self.model},
-                        )
-                        if attempt >= max_attempts:
-                            raise
-                    else:
-                        if response is not None and not _is_retryable_http(response):
-                            return response, duration_ms
-                        rid = None
-                        try:
-                            rid = response.headers.get("x-request-id") or response.headers.get("request-id") or response.headers.get("X-Request-Id")
-                        except Exception:
-                            pass
-                        log_ai_error(
-                            "OpenAI GPT",
-                            "Retryable HTTP status from OpenAI",
-                            {"attempt": attempt, "max_attempts": max_attempts, "status": getattr(response, "status_code", None), "request_id": rid, "model": self.model},
-                        )
-                        if attempt >= max_attempts:
-                            return response, duration_ms
-
-                    backoff = min(20.0, 0.8 * (2 ** (attempt - 1)))
-                    try:
-                        time.sleep(backoff + (0.05 * attempt))
-                    except Exception:
-                        pass
-                return response, duration_ms
-
-            response, duration_ms = _send_with_retries(data)
+            response, duration_ms = self._send_with_retries(url, headers=headers, json=data, timeout=self.timeout)
 
             if response is None:
                 raise Exception("OpenAI request failed: no response")
@@ -328,7 +572,7 @@ class OpenAIProvider(AIProvider):
                     # Log and retry without seed
                     log_ai_error("OpenAI GPT", "Retrying without seed due to model not supporting it", {"model": self.model, "status": response.status_code, "message": msg})
                     data.pop("seed", None)
-                    response, duration_ms = _send_with_retries(data)
+                    response, duration_ms = self._send_with_retries(url, headers=headers, json=data, timeout=self.timeout)
 
             try:
                 response.raise_for_status()
@@ -379,7 +623,7 @@ class OpenAIProvider(AIProvider):
                 system_message += f" The text MUST be under {max_length} characters INCLUDING SPACES AND PUNCTUATION. Count every character. Prioritize brevity."
                 data["messages"][0]["content"] = system_message
                 
-                response, duration_ms = _send_with_retries(data)
+                response, duration_ms = self._send_with_retries(url, headers=headers, json=data, timeout=self.timeout)
                 response.raise_for_status()
                 response_data = response.json()
                 translated_text = response_data["choices"][0]["message"]["content"]
@@ -395,6 +639,199 @@ class OpenAIProvider(AIProvider):
             log_ai_response("OpenAI GPT", "", success=False, error=str(e))
             raise Exception(f"OpenAI translation failed: {str(e)}")
     
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _build_request_body(self, text: str, target_language: str,
+                            max_length: Optional[int] = None,
+                            is_keywords: bool = False,
+                            seed: Optional[int] = None,
+                            refinement: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Chat Completions payload shared by translate() and batches."""
+        is_gpt_5 = self.model.startswith("gpt-5")
+
+        # Build system message
+        system_message = (
+            f"You are a professional translator specializing in App Store metadata translation.\n\n"
+            f"# Core Instructions\n"
+            f"- Translate the following text to {target_language}.\n"
+            f"- Maintain the marketing tone, formatting and style of the original text.\n"
+        )
+        
+        if is_keywords:
+            system_message += "- For keywords, provide a comma-separated list and keep it concise.\n"
+        
+        if max_length:
+            system_message += (
+                f"- Create a concise but meaningful translation that captures the essence of the original message.\n"
+            )
+        if refinement:
+            system_message += f"- Additional guidance: {refinement}\n"
+
+        if is_gpt_5:
+            system_message += (
+                f"\n# Reasoning Instructions\n"
+                f"- - After completing the translation, review your output to confirm all content is accurately and fully translated and meets stylistic and tone requirements.\n"
+                f"- If any issues are detected, self-correct before finalizing.\n"
+            )
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": text}
+            ],
+            "max_completion_tokens" if is_gpt_5 else "max_tokens": 2000,
+            "temperature": 1.0 if is_gpt_5 else 0.7
+        }
+
+    def submit_batch(self, jobs: List[Dict[str, Any]]) -> str:
+        """Upload translation jobs as JSONL to the Batch API and return the batch id.
+
+        Each job holds a ``custom_id`` plus the keyword arguments of translate().
+        The batch endpoint has its own pricing, so ``service_tier`` is not sent.
+        """
+        lines = []
+        for job in jobs:
+            body = self._build_request_body(
+                job["text"], job["target_language"], job.get("max_length"),
+                job.get("is_keywords", False), job.get("seed"), job.get("refinement"),
+            )
+            if job.get("seed") is not None:
+                body["seed"] = job["seed"]
+            lines.append(json.dumps({
+                "custom_id": job["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }, ensure_ascii=False))
+        auth = {"Authorization": f"Bearer {self.api_key}"}
+        upload, _ = self._send_with_retries(
+            "https://api.openai.com/v1/files",
+            headers=auth,
+            data={"purpose": "batch"},
+            files={"file": ("translater_batch.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl")},
+            timeout=self.timeout,
+        )
+        upload.raise_for_status()
+        response, _ = self._send_with_retries(
+            "https://api.openai.com/v1/batches",
+            headers=self._headers(),
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()["id"]
+
+    def poll_batch(self, batch_id: str) -> Optional[Dict[str, str]]:
+        """Return ``{custom_id: text}`` once the batch has completed, else None.
+
+        Raises if the batch failed, expired, or was cancelled; individual failed
+        requests are left out so callers can retry them directly.
+        """
+        response, _ = self._send_with_retries(
+            f"https://api.openai.com/v1/batches/{batch_id}",
+            method="GET",
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        batch = response.json()
+        status = batch.get("status")
+        if status in ("failed", "expired", "cancelled", "cancelling"):
+            raise Exception(f"OpenAI batch {batch_id} {status}")
+        if status != "completed":
+            return None
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            return {}
+        response, _ = self._send_with_retries(
+            f"https://api.openai.com/v1/files/{output_file_id}/content",
+            method="GET",
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        outputs: Dict[str, str] = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            result = entry.get("response") or {}
+            if result.get("status_code") != 200:
+                continue
+            choices = (result.get("body") or {}).get("choices") or []
+            if choices:
+                outputs[entry["custom_id"]] = (choices[0].get("message", {}).get("content") or "").strip()
+        return outputs
+    
+    def structured_output_cap(self) -> int:
+        # Models without json_schema response_format report 0 (per-field calls only)
+        model = self.model or ""
+        if model.startswith("gpt-5-chat"):
+            return 16384
+        if model.startswith("gpt-5"):
+            return 64000
+        if model.startswith("gpt-4.1"):
+            return 32768
+        if model.startswith("gpt-4o"):
+            return 16384
+        return 0
+
+    def translate_json(self, source: Dict[str, Any], target_language: str, *,
+                       schema: Dict[str, Any],
+                       instructions: str,
+                       max_output_tokens: int,
+                       seed: Optional[int] = None) -> Dict[str, Any]:
+        """Translate a JSON object of fields with a strict json_schema response_format."""
+        text = json.dumps(source, ensure_ascii=False)
+        log_ai_request("OpenAI GPT", self.model, text, target_language, None, False, seed, instructions)
+        is_gpt_5 = self.model.startswith("gpt-5")
+        budget = min(max_output_tokens, self.structured_output_cap())
+        if is_gpt_5 and not self.model.startswith("gpt-5-chat"):
+            # max_completion_tokens also covers reasoning tokens
+            budget += REASONING_TOKEN_ALLOWANCE
+        data = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": (
+                    f"You are a professional translator specializing in App Store metadata translation. "
+                    f"{instructions}"
+                )},
+                {"role": "user", "content": text},
+            ],
+            "max_completion_tokens" if is_gpt_5 else "max_tokens": budget,
+            "temperature": 1.0 if is_gpt_5 else 0.7,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "translation", "strict": True, "schema": schema},
+            },
+        }
+        if self.service_tier:
+            data["service_tier"] = self.service_tier
+        if seed is not None:
+            data["seed"] = seed
+        body = self._structured_post(
+            "https://api.openai.com/v1/chat/completions", data,
+            headers=self._headers(), timeout=self.timeout, drop_seed=lambda: data.pop("seed", None),
+        )
+        choice = (body.get("choices") or [{}])[0]
+        if choice.get("finish_reason") == "length":
+            raise StructuredReplyError(f"reply stopped at the output limit ({budget} tokens)")
+        message = choice.get("message") or {}
+        if message.get("refusal"):
+            raise StructuredReplyError(f"model refused: {message['refusal']}")
+        parsed = _reply_object(message.get("content"))
+        log_ai_response("OpenAI GPT", message.get("content") or "", success=True, usage=body.get("usage"))
+        return parsed
+
     def get_name(self) -> str:
         return "OpenAI GPT"
 
@@ -406,6 +843,7 @@ class GoogleGeminiProvider(AIProvider):
     def __init__(self, api_key: str, model: str = None):
         self.api_key = api_key
         self.model = model
+        self.limiter = limiter_for("google")
     
     def translate(self, text: str, target_language: str,
                   max_length: Optional[int] = None,
@@ -462,13 +900,7 @@ class GoogleGeminiProvider(AIProvider):
                 except Exception:
                     pass
             
-            def _send(current_data):
-                start = time.monotonic()
-                resp = requests.post(url, headers=headers, json=current_data)
-                dur = int((time.monotonic() - start) * 1000)
-                return resp, dur
-
-            response, duration_ms = _send(data)
+            response, duration_ms = self._send_with_retries(url, headers=headers, json=data)
             try:
                 response.raise_for_status()
             except requests.exceptions.HTTPError as http_err:
@@ -495,7 +927,7 @@ class GoogleGeminiProvider(AIProvider):
                         data['generationConfig'].pop('seed', None)
                     except Exception:
                         pass
-                    response, duration_ms = _send(data)
+                    response, duration_ms = self._send_with_retries(url, headers=headers, json=data)
                     try:
                         response.raise_for_status()
                     except requests.exceptions.HTTPError:
@@ -546,7 +978,7 @@ class GoogleGeminiProvider(AIProvider):
                 prompt += f" The text MUST be under {max_length} characters INCLUDING SPACES AND PUNCTUATION. Count every character. Prioritize brevity."
                 data["contents"][0]["parts"][0]["text"] = prompt
                 
-                response = requests.post(url, headers=headers, json=data)
+                response, _ = self._send_with_retries(url, headers=headers, json=data)
                 response.raise_for_status()
                 response_data = response.json()
                 translated_text = response_data["candidates"][0]["content"]["parts"][0]["text"]
@@ -562,10 +994,72 @@ class GoogleGeminiProvider(AIProvider):
             log_ai_response("Google Gemini", "", success=False, error=str(e))
             raise Exception(f"Google Gemini translation failed: {str(e)}")
     
+    def structured_output_cap(self) -> int:
+        return 32768
+
+    def translate_json(self, source: Dict[str, Any], target_language: str, *,
+                       schema: Dict[str, Any],
+                       instructions: str,
+                       max_output_tokens: int,
+                       seed: Optional[int] = None) -> Dict[str, Any]:
+        """Translate a JSON object of fields with responseMimeType application/json and a response schema."""
+        text = json.dumps(source, ensure_ascii=False)
+        log_ai_request("Google Gemini", self.model, text, target_language, None, False, seed, instructions)
+        # maxOutputTokens also covers thinking tokens on 2.5 models
+        budget = min(max_output_tokens, self.structured_output_cap()) + REASONING_TOKEN_ALLOWANCE
+        prompt = (
+            f"You are a professional translator specializing in App Store metadata translation. "
+            f"{instructions}\n\nJSON to translate: {text}"
+        )
+        data = {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": {
+                "temperature": 0.7,
+                "maxOutputTokens": budget,
+                "responseMimeType": "application/json",
+                "responseSchema": _gemini_schema(schema),
+            },
+        }
+        if seed is not None:
+            try:
+                data["generationConfig"]["seed"] = int(seed)
+            except Exception:
+                pass
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
+        body = self._structured_post(
+            url, data, headers={"Content-Type": "application/json"},
+            drop_seed=lambda: data["generationConfig"].pop("seed", None),
+        )
+        candidate = (body.get("candidates") or [{}])[0]
+        if candidate.get("finishReason") == "MAX_TOKENS":
+            raise StructuredReplyError(f"reply stopped at maxOutputTokens ({budget})")
+        parts = (candidate.get("content") or {}).get("parts") or []
+        reply = "".join(part.get("text", "") for part in parts if isinstance(part, dict))
+        parsed = _reply_object(reply)
+        log_ai_response("Google Gemini", reply, success=True, usage=body.get("usageMetadata"))
+        return parsed
+
     def get_name(self) -> str:
         return "Google Gemini"
 
 
+def _gemini_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JSON Schema to Gemini's OpenAPI subset (upper-case types, no additionalProperties)."""
+    converted: Dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "additionalProperties":
+            continue
+        if key == "type" and isinstance(value, str):
+            converted[key] = value.upper()
+        elif key == "properties" and isinstance(value, dict):
+            converted[key] = {name: _gemini_schema(sub) for name, sub in value.items()}
+        elif key == "items" and isinstance(value, dict):
+            converted[key] = _gemini_schema(value)
+        else:
+            converted[key] = value
+    return converted
+
+
 class AIProviderManager:
     """Manages multiple AI providers and handles provider selection."""
     
@@ -583,3 +1077,10 @@ class AIProviderManager:
     def list_providers(self) -> List[str]:
         """List all available provider names."""
         return list(self.providers.keys())
+
+    def close(self) -> None:
+        """Close every provider's pooled connections."""
+        for provider in self.providers.values():
+            close = getattr(provider, "close", None)
+            if callable(close):
+                close()
@@ -13,7 +13,56 @@ from typing import Dict, Any, Optional, List
 import random
 from urllib.parse import urlparse, parse_qs
 
-from utils import get_field_limit
+from ratelimit import asc_bucket, retry_after_seconds
+from utils import get_field_limit, locale_worker_count
+
+try:  # Optional: faster decoding of large localization payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a response body, using orjson when it is installed."""
+    content = getattr(response, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray)) and content:
+        return orjson.loads(content)
+    return response.json()
+
+
+class ASCError(requests.exceptions.HTTPError):
+    """An App Store Connect error response, classified once by HTTP status.
+
+    Subclasses requests' HTTPError, so existing ``except HTTPError`` handlers
+    and ``e.response`` access keep working.
+    """
+
+    def __init__(self, *args, status_code: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status_code = status_code
+
+
+class ASCConflictError(ASCError):
+    """HTTP 409: the resource already exists or is in a conflicting state."""
+
+
+class ASCRateLimitError(ASCError):
+    """HTTP 429 after retries ran out; `retry_after` is the server's hint in seconds, if any."""
+
+    def __init__(self, *args, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+def _typed_http_error(error: requests.exceptions.HTTPError, response: requests.Response) -> ASCError:
+    """Re-wrap a raise_for_status() error as the ASCError subclass for its status."""
+    status = getattr(response, "status_code", None)
+    kwargs: Dict[str, Any] = {"response": response, "request": getattr(error, "request", None), "status_code": status}
+    if status == 409:
+        return ASCConflictError(*error.args, **kwargs)
+    if status == 429:
+        return ASCRateLimitError(*error.args, retry_after=retry_after_seconds(response), **kwargs)
+    return ASCError(*error.args, **kwargs)
 
 
 def _asc_error_context(response: requests.Response, limit: int = 1000) -> str:
@@ -83,6 +132,24 @@ class AppStoreConnectClient:
         self.key_id = key_id
         self.issuer_id = issuer_id
         self.private_key = private_key
+        # One pooled session for the client's lifetime: keep-alive connections
+        # avoid a TLS handshake per call. The pool holds at least one connection
+        # per locale worker, or urllib3 drops the extras and reconnects.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(20, locale_worker_count()))
+        self.session.mount("https://", adapter)
+        # Paces requests to Apple's quota instead of fixed sleeps in workflows
+        self.rate_limiter = asc_bucket()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "AppStoreConnectClient":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
     
     def _generate_token(self) -> str:
         """Generate JWT token for API authentication."""
@@ -135,11 +202,26 @@ class AppStoreConnectClient:
         
         for attempt in range(max_retries + 1):
             try:
-                response = requests.request(method, url, headers=headers, params=params, json=data)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                response = self.session.request(method, url, headers=headers, params=params, json=data)
                 response.raise_for_status()
-                return response.json()
+                if self.rate_limiter is not None:
+                    self.rate_limiter.succeeded()
+                return _decode_json(response)
             except requests.exceptions.HTTPError as e:
                 status = response.status_code
+                if status == 429 and attempt < max_retries:
+                    # Rate limited: the request was rejected, so retrying is safe for
+                    # mutations too. Honor Retry-After, else jittered exponential backoff.
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.throttled()
+                    wait_time = retry_after_seconds(response)
+                    if wait_time is None:
+                        wait_time = min(60.0, 2 ** (attempt + 1)) + random.uniform(0, 1)
+                    print(f"⚠️  Rate limited (429) for {url}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries + 1})...")
+                    time.sleep(wait_time)
+                    continue
                 if status == 409 and method.upper() == "GET" and attempt < max_retries:
                     # A read conflict can be transient. Mutation conflicts are
                     # validation/state errors and retrying the same payload only
@@ -185,7 +267,7 @@ class AppStoreConnectClient:
                         context = _asc_error_context(response)
                         if context:
                             e.args = (f"{str(e)} — ASC {context}",)
-                    raise e
+                    raise _typed_http_error(e, response) from e
     
     def get_apps(self, limit: int = 200) -> Any:
         """Get list of apps.
@@ -571,7 +653,9 @@ class AppStoreConnectClient:
     
     def copy_localization_from_previous_version(self, source_version_id: str, 
                                                target_version_id: str, 
-                                               locale: str) -> bool:
+                                               locale: str,
+                                               source_localizations: Optional[List[Dict]] = None,
+                                               target_localizations: Optional[List[Dict]] = None) -> bool:
         """
         Copy localization data from one version to another.
         
@@ -579,16 +663,19 @@ class AppStoreConnectClient:
             source_version_id: Source App Store version ID
             target_version_id: Target App Store version ID  
             locale: Language locale to copy
+            source_localizations: Prefetched source localizations ("data" list), fetched if omitted
+            target_localizations: Prefetched target localizations ("data" list), fetched if omitted
             
         Returns:
             True if successful, False otherwise
         """
         try:
             # Get source localization
-            source_localizations = self.get_app_store_version_localizations(source_version_id)
+            if source_localizations is None:
+                source_localizations = self.get_app_store_version_localizations(source_version_id).get("data", [])
             source_data = None
             
-            for loc in source_localizations.get("data", []):
+            for loc in source_localizations:
                 if loc["attributes"]["locale"] == locale:
                     source_data = loc["attributes"]
                     break
@@ -597,10 +684,11 @@ class AppStoreConnectClient:
                 return False
             
             # Check if target localization already exists
-            target_localizations = self.get_app_store_version_localizations(target_version_id)
+            if target_localizations is None:
+                target_localizations = self.get_app_store_version_localizations(target_version_id).get("data", [])
             target_localization_id = None
             
-            for loc in target_localizations.get("data", []):
+            for loc in target_localizations:
                 if loc["attributes"]["locale"] == locale:
                     target_localization_id = loc["id"]
                     break
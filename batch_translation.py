@@ -0,0 +1,155 @@
+"""
+Batch API Translation
+
+Routes large translation jobs through a provider's asynchronous batch
+endpoint (Anthropic Message Batches, OpenAI Batch API) instead of one
+synchronous request per locale and field. Batches are billed at a discount
+and do not count against the synchronous rate limits.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Tuple
+
+from translation_cache import get_translation_cache
+from translation_validation import (
+    build_translation_request,
+    clean_translation,
+    field_cache_key,
+    validate_translation,
+)
+from utils import APP_STORE_LOCALES, print_info, print_warning
+
+
+BATCH_THRESHOLD_DEFAULT = 8
+BATCH_TIMEOUT_SECONDS_DEFAULT = 3600
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def batch_api_enabled(provider, locale_count: int) -> bool:
+    """Return True when this run should go through the provider's batch API.
+
+    Opt-in via TRANSLATER_BATCH_API=1; only used for at least
+    TRANSLATER_BATCH_API_THRESHOLD locales (default 8) and providers that
+    implement ``submit_batch``/``poll_batch``.
+    """
+    flag = (os.environ.get("TRANSLATER_BATCH_API", "") or "").strip().lower()
+    if flag not in ("1", "true", "yes", "on"):
+        return False
+    if not (hasattr(provider, "submit_batch") and hasattr(provider, "poll_batch")):
+        return False
+    return locale_count >= _env_int("TRANSLATER_BATCH_API_THRESHOLD", BATCH_THRESHOLD_DEFAULT)
+
+
+def wait_for_batch(
+    provider,
+    batch_id: str,
+    *,
+    timeout_seconds: float = BATCH_TIMEOUT_SECONDS_DEFAULT,
+    initial_delay: float = 5.0,
+    max_delay: float = 60.0,
+) -> Dict[str, str]:
+    """Poll a submitted batch with exponential backoff until results are ready."""
+    deadline = time.monotonic() + timeout_seconds
+    delay = initial_delay
+    while True:
+        outputs = provider.poll_batch(batch_id)
+        if outputs is not None:
+            return outputs
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Batch {batch_id} not finished after {int(timeout_seconds)}s")
+        time.sleep(delay)
+        delay = min(max_delay, delay * 2)
+
+
+def translate_locales_via_batch(
+    provider,
+    fields: Dict[str, Dict[str, Any]],
+    target_locales: List[str],
+    *,
+    seed,
+    refinement: str = "",
+) -> Dict[str, Dict[str, str]]:
+    """Translate every (locale, field) pair in one provider batch.
+
+    `fields` uses the same spec shape as `translate_fields_with_validation`.
+    Returns ``{locale: {field: text}}`` holding cached values and results
+    that passed validation; callers translate whatever is missing synchronously.
+    """
+    results: Dict[str, Dict[str, str]] = {}
+    cache = get_translation_cache()
+    cache_keys: Dict[str, str] = {}
+    # Batch APIs restrict custom_id to [a-zA-Z0-9_-]{1,64}: use "r<n>" and map back
+    targets: Dict[str, Tuple[str, str]] = {}
+    jobs = []
+    for loc in target_locales:
+        language_name = APP_STORE_LOCALES.get(loc, loc)
+        for key, spec in fields.items():
+            options = {k: v for k, v in spec.items() if k != "text"}
+            cache_key = None
+            if cache is not None:
+                cache_key = field_cache_key(
+                    provider, spec["text"], language_name, refinement=refinement, **options
+                )
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    results.setdefault(loc, {})[key] = cached
+                    continue
+            custom_id = f"r{len(jobs)}"
+            targets[custom_id] = (loc, key)
+            cache_keys[custom_id] = cache_key
+            input_text, kwargs = build_translation_request(
+                spec["text"], language_name, seed=seed, refinement=refinement, **options
+            )
+            jobs.append({
+                "custom_id": custom_id,
+                "text": input_text,
+                "target_language": language_name,
+                **kwargs,
+            })
+    if not jobs:
+        return results
+
+    batch_id = provider.submit_batch(jobs)
+    print_info(f"Submitted batch {batch_id} with {len(jobs)} translations, waiting for results...")
+    outputs = wait_for_batch(
+        provider,
+        batch_id,
+        timeout_seconds=_env_int("TRANSLATER_BATCH_API_TIMEOUT_SECONDS", BATCH_TIMEOUT_SECONDS_DEFAULT),
+    )
+
+    rejected = 0
+    for job in jobs:
+        custom_id = job["custom_id"]
+        loc, key = targets[custom_id]
+        spec = fields[key]
+        raw = outputs.get(custom_id)
+        if raw is None:
+            rejected += 1
+            continue
+        single_line = bool(spec.get("single_line"))
+        value = clean_translation(raw, single_line=single_line)
+        try:
+            validate_translation(
+                value,
+                field_label=spec.get("field_label", "App Store metadata field"),
+                max_length=spec.get("max_length"),
+                min_length=spec.get("min_length", 1),
+                single_line=single_line,
+                forbid_emoji=bool(spec.get("forbid_emoji")),
+            )
+        except ValueError:
+            rejected += 1
+            continue
+        results.setdefault(loc, {})[key] = value
+        if cache is not None:
+            cache.set(cache_keys[custom_id], value)
+    if rejected:
+        print_warning(f"{rejected} batch result(s) missing or invalid; translating those directly")
+    return results
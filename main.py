@@ -10,43 +10,113 @@ Contact: emre@ertunc.com
 Repository: https://github.com/emreertunc/translater
 """
 
+import importlib
 import sys
 import os
 import random
-import time
-import random
 import re
 from typing import List, Optional, Any, Dict
 from pathlib import Path
 
 # Modularized UI and workflows
 from ui import UI
-from workflows.release import run as release_run
-from workflows.promo import run as promo_run
-from workflows.translate import run as translate_run
-from workflows.update_localizations import run as update_run
-from workflows.copy import run as copy_run
-from workflows.full_setup import run as full_setup_run
-from workflows.app_info import run as app_info_run
-from workflows.export_localizations import run as export_run
-from workflows.manage_presets import run as manage_presets_run
-from workflows.iap_translate import run as iap_translate_run
-from workflows.subscription_translate import run as subscription_translate_run
-from workflows.game_center_localizations import run as game_center_localizations_run
-from workflows.app_events_translate import run as app_events_translate_run
-
 from config import ConfigManager
-from app_store_client import AppStoreConnectClient
+from app_store_client import AppStoreConnectClient, ASCConflictError
 from ai_providers import AIProviderManager, AnthropicProvider, OpenAIProvider, GoogleGeminiProvider
+from translation_cache import get_translation_cache
 from translation_validation import translate_with_validation
 from utils import (
     APP_STORE_LOCALES,
-    detect_base_language,
-    print_success, print_error, print_warning, print_info, format_progress,
-    resolve_private_key_path, DEFAULT_APPSTORE_P8_DIR
+    detect_base_language, get_field_limit,
+    print_success, print_error, print_warning, print_info, parallel_map_fields, parallel_map_locales,
+    pause_for_enter, resolve_private_key_path, DEFAULT_APPSTORE_P8_DIR
 )
 
 
+def _lazy_workflow(module: str):
+    """Return a `run(cli)` that imports `workflows.<module>` on first call.
+
+    Only one workflow runs per menu pick, so importing all of them up front
+    just delays the first prompt.
+    """
+    def run(cli):
+        return importlib.import_module(f"workflows.{module}").run(cli)
+    run.__name__ = f"{module}_run"
+    return run
+
+
+release_run = _lazy_workflow("release")
+promo_run = _lazy_workflow("promo")
+translate_run = _lazy_workflow("translate")
+update_run = _lazy_workflow("update_localizations")
+copy_run = _lazy_workflow("copy")
+full_setup_run = _lazy_workflow("full_setup")
+app_info_run = _lazy_workflow("app_info")
+export_run = _lazy_workflow("export_localizations")
+manage_presets_run = _lazy_workflow("manage_presets")
+iap_translate_run = _lazy_workflow("iap_translate")
+subscription_translate_run = _lazy_workflow("subscription_translate")
+game_center_localizations_run = _lazy_workflow("game_center_localizations")
+app_events_translate_run = _lazy_workflow("app_events_translate")
+
+
+# App Store Connect key files are named AuthKey_<KEY_ID>.p8
+_AUTHKEY_RE = re.compile(r"AuthKey_([A-Za-z0-9]+)\.p8$")
+
+_PROVIDERS = ("anthropic", "openai", "google")
+_PROVIDER_NAMES = {
+    "anthropic": "Anthropic Claude",
+    "openai": "OpenAI GPT",
+    "google": "Google Gemini",
+}
+
+# Main menu entries as (value, label); shared by the TUI and text menus
+_MAIN_MENU_ITEMS = (
+    ("1", "🌐 Translation Mode - Translate to new languages"),
+    ("2", "📝 Release Mode - Create release notes for new version"),
+    ("3", "✨ Promo Mode - Update promotional text across locales"),
+    ("4", "🔄 Update Mode - Update existing localizations"),
+    ("5", "📋 Copy Mode - Copy from previous version"),
+    ("6", "🚀 Full Setup Mode - Complete localization setup"),
+    ("7", "📱 App Name & Subtitle Mode - Translate app name and subtitle"),
+    ("8", "🛒 IAP Translations - Translate in-app purchase metadata"),
+    ("9", "💳 Subscription Translations - Translate subscription metadata"),
+    ("10", "🏆 Game Center - Localize achievements, leaderboards, activities, challenges"),
+    ("11", "🎉 In-App Events - Localize in-app events"),
+    ("12", "📄 Export Localizations - Export existing localizations to file"),
+    ("13", "🗂️ Manage Presets - Create and organize release note presets"),
+    ("14", "⚙️  Configuration - Manage API keys and settings"),
+    ("15", "❌ Exit"),
+)
+_MAIN_MENU_CHOICES = tuple({"name": label, "value": value} for value, label in _MAIN_MENU_ITEMS)
+_MAIN_MENU_TEXT = "\n".join(f"{value}. {label}" for value, label in _MAIN_MENU_ITEMS)
+
+
+# Startup banner, written in a single print
+_LOGO = "\n".join((
+    "",
+    "  ╔════════════════════════════════════════════════════════╗",
+    "  ║                                                        ║",
+    "  ║      ████████ ██████   █████  ███   ██ ███████         ║",
+    "  ║         ██    ██   ██ ██   ██ ████  ██ ██              ║",
+    "  ║         ██    ██████  ███████ ██ ██ ██ ███████         ║",
+    "  ║         ██    ██   ██ ██   ██ ██  ████      ██         ║",
+    "  ║         ██    ██   ██ ██   ██ ██   ███ ███████         ║",
+    "  ║                                                        ║",
+    "  ║      ██       █████  ████████ ███████ \033[38;5;208m██████\033[0m           ║",
+    "  ║      ██      ██   ██    ██    ██      \033[38;5;208m██   ██\033[0m          ║",
+    "  ║      ██      ███████    ██    █████   \033[38;5;208m██████\033[0m           ║",
+    "  ║      ██      ██   ██    ██    ██      \033[38;5;208m██   ██\033[0m          ║",
+    "  ║      ███████ ██   ██    ██    ███████ \033[38;5;208m██   ██\033[0m          ║",
+    "  ║                                                        ║",
+    "  ║         🌍 App Store Connect Localization Tool         ║",
+    "  ║             Multi-AI Provider Translation              ║",
+    "  ║                                                        ║",
+    "  ╚════════════════════════════════════════════════════════╝",
+    "",
+))
+
+
 class TranslateRCLI:
     """Main CLI interface for TranslateR application."""
     
@@ -65,65 +135,60 @@ class TranslateRCLI:
             # Reset manager to reflect latest config accurately
             self.ai_manager = AIProviderManager()
             providers_config = self.config.load_providers()
-            
-            # Setup Anthropic
-            anthropic_key = self.config.get_ai_provider_key("anthropic")
-            if anthropic_key:
-                default_model = providers_config.get("anthropic", {}).get("default_model", "claude-sonnet-4-20250514")
-                anthropic = AnthropicProvider(anthropic_key, default_model)
-                self.ai_manager.add_provider("anthropic", anthropic)
-            
-            # Setup OpenAI
-            openai_key = self.config.get_ai_provider_key("openai")
-            if openai_key:
-                default_model = providers_config.get("openai", {}).get("default_model", "gpt-4.1")
-                # Flex mode / service tier (optional)
-                service_tier = (
-                    os.environ.get("TRANSLATER_OPENAI_SERVICE_TIER")
-                    or os.environ.get("OPENAI_SERVICE_TIER")
-                    or providers_config.get("openai", {}).get("service_tier")
-                    or ""
-                )
-                timeout_seconds = (
-                    os.environ.get("TRANSLATER_OPENAI_TIMEOUT_SECONDS")
-                    or os.environ.get("OPENAI_TIMEOUT_SECONDS")
-                    or providers_config.get("openai", {}).get("timeout_seconds")
-                    or ""
-                )
-                flex_timeout_seconds = (
-                    os.environ.get("TRANSLATER_OPENAI_FLEX_TIMEOUT_SECONDS")
-                    or os.environ.get("OPENAI_FLEX_TIMEOUT_SECONDS")
-                    or providers_config.get("openai", {}).get("flex_timeout_seconds")
-                    or ""
-                )
-                try:
-                    timeout_seconds = int(str(timeout_seconds).strip()) if str(timeout_seconds).strip() else None
-                except Exception:
-                    timeout_seconds = None
-                try:
-                    flex_timeout_seconds = int(str(flex_timeout_seconds).strip()) if str(flex_timeout_seconds).strip() else None
-                except Exception:
-                    flex_timeout_seconds = None
-
-                openai = OpenAIProvider(
-                    openai_key,
-                    default_model,
-                    service_tier=service_tier or None,
-                    timeout_seconds=timeout_seconds,
-                    flex_timeout_seconds=flex_timeout_seconds,
-                )
-                self.ai_manager.add_provider("openai", openai)
-            
-            # Setup Google Gemini
-            google_key = self.config.get_ai_provider_key("google")
-            if google_key:
-                default_model = providers_config.get("google", {}).get("default_model", "gemini-2.5-flash")
-                google = GoogleGeminiProvider(google_key, default_model)
-                self.ai_manager.add_provider("google", google)
-                
+
+            # (provider key, provider class, fallback model when config has none)
+            registry = (
+                ("anthropic", AnthropicProvider, "claude-sonnet-4-20250514"),
+                ("openai", OpenAIProvider, "gpt-4.1"),
+                ("google", GoogleGeminiProvider, "gemini-2.5-flash"),
+            )
+            for name, provider_cls, fallback_model in registry:
+                api_key = self.config.get_ai_provider_key(name)
+                if not api_key:
+                    continue
+                provider_config = providers_config.get(name, {})
+                default_model = provider_config.get("default_model", fallback_model)
+                options = self._openai_provider_options(provider_config) if name == "openai" else {}
+                self.ai_manager.add_provider(name, provider_cls(api_key, default_model, **options))
         except Exception as e:
             print_error(f"Error setting up AI providers: {e}")
     
+    @staticmethod
+    def _openai_provider_options(provider_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve OpenAI service tier and timeouts from env overrides or providers.json."""
+        # Flex mode / service tier (optional)
+        service_tier = (
+            os.environ.get("TRANSLATER_OPENAI_SERVICE_TIER")
+            or os.environ.get("OPENAI_SERVICE_TIER")
+            or provider_config.get("service_tier")
+            or ""
+        )
+        timeout_seconds = (
+            os.environ.get("TRANSLATER_OPENAI_TIMEOUT_SECONDS")
+            or os.environ.get("OPENAI_TIMEOUT_SECONDS")
+            or provider_config.get("timeout_seconds")
+            or ""
+        )
+        flex_timeout_seconds = (
+            os.environ.get("TRANSLATER_OPENAI_FLEX_TIMEOUT_SECONDS")
+            or os.environ.get("OPENAI_FLEX_TIMEOUT_SECONDS")
+            or provider_config.get("flex_timeout_seconds")
+            or ""
+        )
+        try:
+            timeout_seconds = int(str(timeout_seconds).strip()) if str(timeout_seconds).strip() else None
+        except Exception:
+            timeout_seconds = None
+        try:
+            flex_timeout_seconds = int(str(flex_timeout_seconds).strip()) if str(flex_timeout_seconds).strip() else None
+        except Exception:
+            flex_timeout_seconds = None
+        return {
+            "service_tier": service_tier or None,
+            "timeout_seconds": timeout_seconds,
+            "flex_timeout_seconds": flex_timeout_seconds,
+        }
+
     def setup_app_store_client(self):
         """Initialize App Store Connect client."""
         asc_config = self.config.get_app_store_config()
@@ -141,14 +206,26 @@ class TranslateRCLI:
             with open(resolved_key_path, "r") as f:
                 private_key = f.read()
             
+            previous_client = getattr(self, "asc_client", None)
             self.asc_client = AppStoreConnectClient(
                 key_id=asc_config["key_id"],
                 issuer_id=asc_config["issuer_id"],
                 private_key=private_key
             )
+            # Release the replaced client's pooled connections
+            close_previous = getattr(previous_client, "close", None)
+            if callable(close_previous):
+                close_previous()
+            # Apps listed for previous credentials must not be offered again
+            ui = getattr(self, "ui", None)
+            if ui is not None and hasattr(ui, "invalidate_apps_cache"):
+                ui.invalidate_apps_cache()
             
-            # Test the connection
-            self.asc_client.get_apps()
+            # Test the connection; the apps list is kept for the first app picker
+            if ui is not None and hasattr(ui, "list_apps"):
+                ui.list_apps(self.asc_client)
+            else:
+                self.asc_client.get_apps()
             print_success("App Store Connect client initialized successfully")
             return True
             
@@ -210,7 +287,7 @@ class TranslateRCLI:
         if selected_path:
             try:
                 name = Path(os.path.expanduser(selected_path)).name
-                m = re.match(r"AuthKey_([A-Za-z0-9]+)\.p8$", name)
+                m = _AUTHKEY_RE.match(name)
                 if m:
                     key_id_guess = m.group(1)
             except Exception:
@@ -252,14 +329,9 @@ class TranslateRCLI:
         print("Configure at least one AI provider for translations:")
         
         # AI providers setup
-        providers = ["anthropic", "openai", "google"]
-        provider_names = {
-            "anthropic": "Anthropic Claude",
-            "openai": "OpenAI GPT", 
-            "google": "Google Gemini"
-        }
+        provider_names = _PROVIDER_NAMES
         
-        for provider in providers:
+        for provider in _PROVIDERS:
             response = input(f"Do you want to configure {provider_names[provider]}? (y/n): ").strip().lower()
             if response in ['y', 'yes']:
                 api_key = input(f"Enter {provider_names[provider]} API key: ").strip()
@@ -307,42 +379,12 @@ class TranslateRCLI:
         """Display main menu and handle user choice."""
         # TUI-based main menu when available
         if self.ui.available():
-            choices = [
-                {"name": "🌐 Translation Mode - Translate to new languages", "value": "1"},
-                {"name": "📝 Release Mode - Create release notes for new version", "value": "2"},
-                {"name": "✨ Promo Mode - Update promotional text across locales", "value": "3"},
-                {"name": "🔄 Update Mode - Update existing localizations", "value": "4"},
-                {"name": "📋 Copy Mode - Copy from previous version", "value": "5"},
-                {"name": "🚀 Full Setup Mode - Complete localization setup", "value": "6"},
-                {"name": "📱 App Name & Subtitle Mode - Translate app name and subtitle", "value": "7"},
-                {"name": "🛒 IAP Translations - Translate in-app purchase metadata", "value": "8"},
-                {"name": "💳 Subscription Translations - Translate subscription metadata", "value": "9"},
-                {"name": "🏆 Game Center - Localize achievements, leaderboards, activities, challenges", "value": "10"},
-                {"name": "🎉 In-App Events - Localize in-app events", "value": "11"},
-                {"name": "📄 Export Localizations - Export existing localizations to file", "value": "12"},
-                {"name": "🗂️ Manage Presets - Create and organize release note presets", "value": "13"},
-                {"name": "⚙️  Configuration - Manage API keys and settings", "value": "14"},
-                {"name": "❌ Exit", "value": "15"},
-            ]
+            choices = [dict(choice) for choice in _MAIN_MENU_CHOICES]
             choice = self.ui.select("TranslateR — Choose your workflow", choices) or ""
         else:
             print()
             print("🌍 TranslateR - Choose your workflow:")
-            print("1. 🌐 Translation Mode - Translate to new languages")
-            print("2. 📝 Release Mode - Create release notes for new version")
-            print("3. ✨ Promo Mode - Update promotional text across locales")
-            print("4. 🔄 Update Mode - Update existing localizations")
-            print("5. 📋 Copy Mode - Copy from previous version") 
-            print("6. 🚀 Full Setup Mode - Complete localization setup")
-            print("7. 📱 App Name & Subtitle Mode - Translate app name and subtitle")
-            print("8. 🛒 IAP Translations - Translate in-app purchase metadata")
-            print("9. 💳 Subscription Translations - Translate subscription metadata")
-            print("10. 🏆 Game Center - Localize achievements, leaderboards, activities, challenges")
-            print("11. 🎉 In-App Events - Localize in-app events")
-            print("12. 📄 Export Localizations - Export existing localizations to file")
-            print("13. 🗂️ Manage Presets - Create and organize release note presets")
-            print("14. ⚙️  Configuration - Manage API keys and settings")
-            print("15. ❌ Exit")
+            print(_MAIN_MENU_TEXT)
             print()
             choice = input("Select an option (1-15): ").strip()
 
@@ -385,7 +427,18 @@ class TranslateRCLI:
         """Handle translation workflow."""
         return translate_run(self)
 
-    def _translate_app_info(self, app_id: str, target_locales: List[str], provider):
+    @staticmethod
+    def _same_language(locale_a: str, locale_b: str) -> bool:
+        """Return True when two App Store locales denote the same localization.
+
+        Deliberately conservative: region variants (en-US vs en-GB) are distinct
+        App Store localizations, so only an exact (case-insensitive) match counts.
+        """
+        if not locale_a or not locale_b:
+            return False
+        return locale_a.strip().lower() == locale_b.strip().lower()
+
+    def _translate_app_info(self, app_id: str, target_locales: List[str], provider, refinement: str = ""):
         """Helper method to translate app name and subtitle for given locales."""
         try:
             # Find primary app info ID
@@ -396,13 +449,10 @@ class TranslateRCLI:
             
             # Get existing localizations
             existing_localizations = self.asc_client.get_app_info_localizations(app_info_id)
-            existing_locales = []
-            localization_map = {}
-            
-            for loc in existing_localizations.get("data", []):
-                locale = loc["attributes"]["locale"]
-                existing_locales.append(locale)
-                localization_map[locale] = loc["id"]
+            localization_map = {
+                loc["attributes"]["locale"]: loc["id"]
+                for loc in existing_localizations.get("data", [])
+            }
             
             # Get base language data
             base_locale = detect_base_language(existing_localizations.get("data", []))
@@ -428,66 +478,74 @@ class TranslateRCLI:
             if base_subtitle:
                 print(f"📝 Subtitle: {base_subtitle}")
             
-            success_count = 0
-            
-            for i, target_locale in enumerate(target_locales, 1):
+            # Base locale already holds the source text: no LLM call, no PATCH
+            base_targets = [loc for loc in target_locales if self._same_language(loc, base_locale)]
+            for loc in base_targets:
+                print_info(f"  {APP_STORE_LOCALES.get(loc, loc)} is the base language, keeping existing name & subtitle")
+            pending = [loc for loc in target_locales if loc not in base_targets]
+            name_limit = get_field_limit("name")
+            subtitle_limit = get_field_limit("subtitle")
+
+            def _task(target_locale: str):
                 language_name = APP_STORE_LOCALES.get(target_locale, target_locale)
-                print()
-                print(format_progress(i, len(target_locales), f"Translating {language_name} app info"))
-                
-                try:
-                    translated_data = {}
-                    
-                    # Translate name
-                    if base_name:
-                        print(f"  • Translating app name...")
-                        translated_name = translate_with_validation(
-                            provider,
-                            base_name,
-                            language_name,
-                            max_length=30,
-                            seed=self.session_seed,
-                            field_label="App name",
-                            single_line=True,
-                        )
-                        translated_data["name"] = translated_name
-                    
-                    # Translate subtitle
-                    if base_subtitle:
-                        print(f"  • Translating subtitle...")
-                        translated_subtitle = translate_with_validation(
-                            provider,
-                            base_subtitle,
-                            language_name,
-                            max_length=30,
-                            seed=self.session_seed,
-                            field_label="App subtitle",
-                            single_line=True,
-                        )
-                        translated_data["subtitle"] = translated_subtitle
-                    
-                    # Create or update app info localization
-                    if target_locale in existing_locales:
-                        # Update existing
-                        self.asc_client.update_app_info_localization(
-                            localization_map[target_locale],
-                            **translated_data
-                        )
-                    else:
-                        # Create new
+                # Name and subtitle are independent: translate them side by side
+                field_tasks = {}
+                if base_name:
+                    field_tasks["name"] = lambda: translate_with_validation(
+                        provider,
+                        base_name,
+                        language_name,
+                        max_length=name_limit,
+                        seed=self.session_seed,
+                        refinement=refinement,
+                        field_label="App name",
+                        single_line=True,
+                    )
+                if base_subtitle and base_subtitle != base_name:
+                    field_tasks["subtitle"] = lambda: translate_with_validation(
+                        provider,
+                        base_subtitle,
+                        language_name,
+                        max_length=subtitle_limit,
+                        seed=self.session_seed,
+                        refinement=refinement,
+                        field_label="App subtitle",
+                        single_line=True,
+                    )
+                translated_data = parallel_map_fields(field_tasks)
+                if base_subtitle and base_subtitle == base_name:
+                    # Identical source and limit: reuse the name instead of a second request
+                    translated_data["subtitle"] = translated_data["name"]
+
+                # Create or update app info localization
+                if target_locale in localization_map:
+                    self.asc_client.update_app_info_localization(
+                        localization_map[target_locale],
+                        **translated_data
+                    )
+                else:
+                    try:
                         self.asc_client.create_app_info_localization(
                             app_info_id,
                             target_locale,
                             **translated_data
                         )
-                    
-                    print_success(f"  ✅ {language_name} app info translation completed")
-                    success_count += 1
-                    time.sleep(1)  # Rate limiting
-                    
-                except Exception as e:
-                    print_error(f"  ❌ Failed to translate {language_name} app info: {str(e)}")
-                    continue
+                    except ASCConflictError:
+                        # Created since the map was fetched: look it up again and update it
+                        refreshed = self.asc_client.get_app_info_localizations(app_info_id).get("data", [])
+                        loc_id = next(
+                            (loc["id"] for loc in refreshed if loc["attributes"]["locale"] == target_locale), None
+                        )
+                        if not loc_id:
+                            raise
+                        self.asc_client.update_app_info_localization(loc_id, **translated_data)
+                return translated_data
+
+            # Locales are independent: translate and upload them concurrently
+            results, _errors = parallel_map_locales(
+                pending, _task, progress_action="Translated app info for", pacing_seconds=0.0,
+            )
+            success_count = len(base_targets) + len(results)
             
             print()
             print_success(f"App name & subtitle translation completed! {success_count}/{len(target_locales)} languages processed")
@@ -542,6 +600,7 @@ class TranslateRCLI:
                     {"name": "Set default model per provider", "value": "models"},
                     {"name": "Set OpenAI service tier (flex mode)", "value": "openai_tier"},
                     {"name": "Set translation prompt refinement", "value": "refine"},
+                    {"name": "Clear translation cache", "value": "cache"},
                     {"name": "Back", "value": "back"},
                 ]
             ) or "back"
@@ -552,9 +611,10 @@ class TranslateRCLI:
             print("3) Set default model per provider")
             print("4) Set OpenAI service tier (flex mode)")
             print("5) Set translation prompt refinement")
-            print("6) Back")
-            raw = input("Select (1-6): ").strip()
-            choice = {"1": "keys", "2": "provider", "3": "models", "4": "openai_tier", "5": "refine", "6": "back"}.get(raw, "back")
+            print("6) Clear translation cache")
+            print("7) Back")
+            raw = input("Select (1-7): ").strip()
+            choice = {"1": "keys", "2": "provider", "3": "models", "4": "openai_tier", "5": "refine", "6": "cache", "7": "back"}.get(raw, "back")
 
         if choice == "keys":
             # Run the setup wizard to re-enter keys
@@ -599,7 +659,7 @@ class TranslateRCLI:
         if choice == "models":
             # Set default model for a provider
             provs_cfg = self.config.load_providers()
-            prov_keys = [p for p in ["anthropic", "openai", "google"] if p in provs_cfg]
+            prov_keys = [p for p in _PROVIDERS if p in provs_cfg]
             if self.ui.available():
                 cur_provider = self.config.get_default_ai_provider()
                 pick = self.ui.select(
@@ -697,31 +757,21 @@ class TranslateRCLI:
             self.config.set_prompt_refinement(phrase)
             print_success("Prompt refinement updated")
             return True
+        if choice == "cache":
+            # Forget cached translations so the next run asks the AI provider again
+            cache = get_translation_cache()
+            if cache is None:
+                print_info("Translation cache is disabled (TRANSLATER_NO_CACHE is set)")
+                return True
+            removed = cache.clear()
+            print_success(f"Translation cache cleared ({removed} entries removed)")
+            return True
         # back or unknown
         return True
     
     def show_logo(self):
         """Display ASCII art logo."""
-        print()
-        print("  ╔════════════════════════════════════════════════════════╗")
-        print("  ║                                                        ║")
-        print("  ║      ████████ ██████   █████  ███   ██ ███████         ║")
-        print("  ║         ██    ██   ██ ██   ██ ████  ██ ██              ║")
-        print("  ║         ██    ██████  ███████ ██ ██ ██ ███████         ║")
-        print("  ║         ██    ██   ██ ██   ██ ██  ████      ██         ║")
-        print("  ║         ██    ██   ██ ██   ██ ██   ███ ███████         ║")
-        print("  ║                                                        ║")
-        print("  ║      ██       █████  ████████ ███████ \033[38;5;208m██████\033[0m           ║")
-        print("  ║      ██      ██   ██    ██    ██      \033[38;5;208m██   ██\033[0m          ║")
-        print("  ║      ██      ███████    ██    █████   \033[38;5;208m██████\033[0m           ║")
-        print("  ║      ██      ██   ██    ██    ██      \033[38;5;208m██   ██\033[0m          ║")
-        print("  ║      ███████ ██   ██    ██    ███████ \033[38;5;208m██   ██\033[0m          ║")
-        print("  ║                                                        ║")
-        print("  ║         🌍 App Store Connect Localization Tool         ║")
-        print("  ║             Multi-AI Provider Translation              ║")
-        print("  ║                                                        ║")
-        print("  ╚════════════════════════════════════════════════════════╝")
-        print()
+        print(_LOGO)
     
     def run(self):
         """Main application loop."""
@@ -748,7 +798,7 @@ class TranslateRCLI:
                 break
             except Exception as e:
                 print_error(f"An error occurred: {e}")
-                input("Press Enter to continue...")
+                pause_for_enter("Press Enter to continue...")
 
 
 def main():
@@ -0,0 +1,267 @@
+"""
+Provider Rate Limiting
+
+Proactive client-side pacing for AI provider requests. Each provider
+instance owns a ProviderLimiter that keeps requests and tokens inside a
+sliding one-minute window and caps in-flight requests. The concurrency cap
+self-tunes with AIMD: it grows slowly while requests succeed and halves on
+HTTP 429, so parallel workflows settle just under the account's limits
+instead of bouncing off them.
+
+App Store Connect calls go through a TokenBucket sized to Apple's hourly
+quota, so they only wait when the quota is actually exhausted.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+# Conservative per-provider defaults (requests/min, tokens/min, max in flight).
+# Override with TRANSLATER_<PROVIDER>_RPM / _TPM / _MAX_CONCURRENCY.
+PROVIDER_LIMIT_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "anthropic": {"rpm": 50, "tpm": 80_000, "max_concurrency": 5},
+    "openai": {"rpm": 60, "tpm": 150_000, "max_concurrency": 10},
+    "google": {"rpm": 60, "tpm": 100_000, "max_concurrency": 8},
+}
+
+
+class ProviderLimiter:
+    """Thread-safe sliding-window RPM/TPM limiter with AIMD concurrency."""
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        max_concurrency: int,
+        *,
+        window_seconds: float = 60.0,
+        additive_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.rpm = max(1, int(rpm))
+        self.tpm = max(1, int(tpm))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.window_seconds = window_seconds
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        # Current AIMD concurrency target, between 1 and max_concurrency
+        self.concurrency = float(self.max_concurrency)
+        self.in_flight = 0
+        self._requests: deque = deque()  # request timestamps
+        self._tokens: deque = deque()  # [timestamp, tokens] tickets
+        self._cond = threading.Condition()
+
+    def _purge(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._tokens.popleft()
+
+    def _wait_time(self, now: float, estimated_tokens: int) -> float:
+        """Seconds until a request of this size may start (0 when it can start now)."""
+        waits = [0.0]
+        if len(self._requests) >= self.rpm:
+            waits.append(self._requests[0] + self.window_seconds - now)
+        used = sum(ticket[1] for ticket in self._tokens)
+        # A single oversized request is allowed into an empty window
+        if self._tokens and used + estimated_tokens > self.tpm:
+            waits.append(self._tokens[0][0] + self.window_seconds - now)
+        return max(waits)
+
+    def acquire(self, estimated_tokens: int = 0) -> List:
+        """Block until a request may be sent; return its token ticket."""
+        estimated_tokens = max(0, int(estimated_tokens or 0))
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._purge(now)
+                if self.in_flight >= max(1, int(self.concurrency)):
+                    self._cond.wait()
+                    continue
+                delay = self._wait_time(now, estimated_tokens)
+                if delay > 0:
+                    self._cond.wait(timeout=delay)
+                    continue
+                self.in_flight += 1
+                self._requests.append(now)
+                ticket = [now, estimated_tokens]
+                self._tokens.append(ticket)
+                return ticket
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._cond.notify_all()
+
+    def update(self, ticket: Optional[List], used_tokens: Optional[int] = None,
+               status_code: Optional[int] = None) -> None:
+        """Feed back real usage and outcome of a request."""
+        with self._cond:
+            if ticket is not None and used_tokens is not None:
+                ticket[1] = max(0, int(used_tokens))
+            if status_code == 429:
+                self.concurrency = max(1.0, self.concurrency * self.decrease_factor)
+            elif status_code is not None and status_code < 400:
+                self.concurrency = min(
+                    float(self.max_concurrency),
+                    self.concurrency + self.additive_increase / max(1.0, self.concurrency),
+                )
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, estimated_tokens: int = 0):
+        """Context manager holding a request slot for the duration of the call."""
+        ticket = self.acquire(estimated_tokens)
+        try:
+            yield ticket
+        finally:
+            self.release()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to `capacity`, then `refill_rate` tokens/sec.
+
+    Unlike a fixed sleep, callers only wait when the bucket is actually empty.
+    The refill rate adapts to server feedback: `throttled()` empties the bucket
+    and multiplies the rate by `decrease_factor`; `succeeded()` ramps it back
+    up by `increase_step` of the nominal rate per success.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, *,
+                 decrease_factor: float = 0.5, increase_step: float = 0.05,
+                 min_rate_fraction: float = 0.1):
+        self.capacity = max(1.0, float(capacity))
+        self.refill_rate = max(1e-6, float(refill_rate))
+        self.nominal_rate = self.refill_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.min_rate = self.nominal_rate * min_rate_fraction
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def throttled(self) -> None:
+        """The server rejected a request (HTTP 429): drain and slow down."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = 0.0
+            self.refill_rate = max(self.min_rate, self.refill_rate * self.decrease_factor)
+
+    def succeeded(self) -> None:
+        """A request went through: recover towards the nominal rate."""
+        with self._lock:
+            if self.refill_rate < self.nominal_rate:
+                self._refill(time.monotonic())
+                self.refill_rate = min(
+                    self.nominal_rate, self.refill_rate + self.nominal_rate * self.increase_step
+                )
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available and take them; return seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = max(0.0, (tokens - self.tokens) / self.refill_rate)
+            time.sleep(wait)
+            waited += wait
+
+
+RETRY_AFTER_MAX_SECONDS = 120.0
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Seconds a server asked us to wait, from Retry-After / retry-after-ms headers.
+
+    Accepts delta-seconds or an HTTP date; capped at RETRY_AFTER_MAX_SECONDS.
+    Returns None when the response carries no usable hint.
+    """
+    headers = getattr(response, "headers", None) or {}
+    try:
+        lowered = {str(k).lower(): v for k, v in headers.items()}
+    except Exception:
+        return None
+    value = lowered.get("retry-after-ms")
+    if value is not None:
+        try:
+            return min(RETRY_AFTER_MAX_SECONDS, max(0.0, float(value) / 1000.0))
+        except (TypeError, ValueError):
+            pass
+    value = lowered.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return min(RETRY_AFTER_MAX_SECONDS, max(0.0, float(value)))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    delta = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(RETRY_AFTER_MAX_SECONDS, max(0.0, delta))
+
+
+# App Store Connect allows 3600 requests/hour per key; pace at that average
+# rate while permitting short bursts. Override with TRANSLATER_ASC_RPM / _BURST.
+ASC_RPM_DEFAULT = 60
+ASC_BURST_DEFAULT = 100
+
+
+def _rate_limit_enabled() -> bool:
+    flag = (os.environ.get("TRANSLATER_RATE_LIMIT", "1") or "1").strip().lower()
+    return flag not in ("0", "false", "no", "off")
+
+
+def asc_bucket() -> Optional[TokenBucket]:
+    """Build the App Store Connect request bucket, or None when rate limiting is off."""
+    if not _rate_limit_enabled():
+        return None
+    values = {}
+    for name, default in (("rpm", ASC_RPM_DEFAULT), ("burst", ASC_BURST_DEFAULT)):
+        try:
+            values[name] = int(os.environ.get(f"TRANSLATER_ASC_{name.upper()}", default) or default)
+        except Exception:
+            values[name] = default
+    if values["rpm"] <= 0:
+        return None
+    return TokenBucket(capacity=max(1, values["burst"]), refill_rate=values["rpm"] / 60.0)
+
+
+def limiter_for(provider_key: str) -> Optional[ProviderLimiter]:
+    """Build the limiter for a provider from defaults and env overrides.
+
+    Returns None when TRANSLATER_RATE_LIMIT=0 or the provider is unknown.
+    """
+    if not _rate_limit_enabled():
+        return None
+    defaults = PROVIDER_LIMIT_DEFAULTS.get(provider_key)
+    if not defaults:
+        return None
+    values = {}
+    for name, default in defaults.items():
+        env_name = f"TRANSLATER_{provider_key.upper()}_{name.upper()}"
+        try:
+            values[name] = int(os.environ.get(env_name, default) or default)
+        except Exception:
+            values[name] = default
+    return ProviderLimiter(values["rpm"], values["tpm"], values["max_concurrency"])
@@ -9,6 +9,7 @@ files containing localized strings for all App Store locales.
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -16,11 +17,28 @@ from typing import Dict, List, Optional, Tuple
 
 from utils import APP_STORE_LOCALES
 
+try:  # Optional: faster parsing of preset files
+    import orjson
+except ImportError:
+    orjson = None
+
 
 REPO_ROOT = Path(__file__).resolve().parent
 BUILTIN_PRESETS_DIR = REPO_ROOT / "presets"
 USER_PRESETS_DIR = REPO_ROOT / "config" / "presets"
 PRESET_FILE_EXTENSION = ".json"
+ENGLISH_FALLBACK_LOCALES = ("en-US", "en-GB", "en-AU", "en-CA")
+# Preset id slugs: characters that are dropped, and separator runs
+_SLUG_DROP = re.compile(r"[^\w \-]")
+_SLUG_SEPARATORS = re.compile(r"[ _\-]+")
+
+# Parsed presets keyed by file path, with the (mtime_ns, size) they were read at
+_PRESET_CACHE: Dict[Path, Tuple[Tuple[int, int], Optional["ReleaseNotePreset"]]] = {}
+# Id index over both preset directories, valid while the listing fingerprint matches
+_PRESET_BY_ID: Dict[str, "ReleaseNotePreset"] = {}
+_PRESET_INDEX_KEY: Optional[tuple] = None
+# list_presets() order for the current index; rebuilt with it
+_PRESET_SORTED: Optional[List["ReleaseNotePreset"]] = None
 
 
 @dataclass
@@ -36,7 +54,7 @@ class ReleaseNotePreset:
         """Return translation for locale, falling back to English variants."""
         if locale in self.translations:
             return self.translations[locale]
-        for fallback in ("en-US", "en-GB", "en-AU", "en-CA"):
+        for fallback in ENGLISH_FALLBACK_LOCALES:
             val = self.translations.get(fallback)
             if val:
                 return val
@@ -47,34 +65,17 @@ class ReleaseNotePreset:
 def _normalize_translations(raw: Dict[str, str]) -> Dict[str, str]:
     """Ensure every locale has a non-null translation using sensible fallbacks."""
     sanitized = {k: (v or "").strip() for k, v in raw.items() if isinstance(v, str)}
-    primary_fallback = (
-        sanitized.get("en-US")
-        or sanitized.get("en-GB")
-        or sanitized.get("en-AU")
-        or sanitized.get("en-CA")
-        or next(iter(sanitized.values()), "")
+    # English variant first, else whatever was provided first; resolved once for all locales
+    fallback = next((sanitized[k] for k in ENGLISH_FALLBACK_LOCALES if sanitized.get(k)), "") or next(
+        iter(sanitized.values()), ""
     )
-    result: Dict[str, str] = {}
-    for locale in APP_STORE_LOCALES.keys():
-        if locale in sanitized and sanitized[locale]:
-            result[locale] = sanitized[locale]
-            continue
-        fallback = sanitized.get("en-US") or sanitized.get("en-GB") or sanitized.get("en-AU") or sanitized.get("en-CA")
-        result[locale] = fallback or primary_fallback or ""
-    return result
+    return {locale: sanitized.get(locale) or fallback for locale in APP_STORE_LOCALES}
 
 
 def _slugify(value: str) -> str:
     """Generate filesystem-friendly identifier."""
-    slug_chars: List[str] = []
-    value = value.strip().lower()
-    for ch in value:
-        if ch.isalnum():
-            slug_chars.append(ch)
-        elif ch in (" ", "-", "_"):
-            if not slug_chars or slug_chars[-1] != "-":
-                slug_chars.append("-")
-    slug = "".join(slug_chars).strip("-")
+    # Keep alphanumerics; runs of spaces, hyphens and underscores become one hyphen
+    slug = _SLUG_SEPARATORS.sub("-", _SLUG_DROP.sub("", value.strip().lower())).strip("-")
     return slug or "preset"
 
 
@@ -85,10 +86,12 @@ def ensure_user_directory() -> Path:
 
 def _load_preset_from_path(path: Path, built_in: bool) -> Optional[ReleaseNotePreset]:
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return None
+    if not isinstance(data, dict):
+        return None
 
     translations_raw = data.get("translations")
     if not isinstance(translations_raw, dict):
@@ -109,9 +112,19 @@ def _load_preset_from_path(path: Path, built_in: bool) -> Optional[ReleaseNotePr
     )
 
 
-def list_presets() -> List[ReleaseNotePreset]:
-    """Return all available presets (built-in + user-defined)."""
-    presets: Dict[str, ReleaseNotePreset] = {}
+def _load_preset_cached(path: Path, built_in: bool, fingerprint: Tuple[int, int]) -> Optional[ReleaseNotePreset]:
+    """Load a preset file, reusing the parsed result while the file is unchanged."""
+    cached = _PRESET_CACHE.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    preset = _load_preset_from_path(path, built_in=built_in)
+    _PRESET_CACHE[path] = (fingerprint, preset)
+    return preset
+
+
+def _preset_files() -> List[Tuple[Path, bool, Tuple[int, int]]]:
+    """(path, built_in, (mtime_ns, size)) for every preset file, built-ins first."""
+    files = []
     for directory, built_in in (
         (BUILTIN_PRESETS_DIR, True),
         (USER_PRESETS_DIR, False),
@@ -119,23 +132,53 @@ def list_presets() -> List[ReleaseNotePreset]:
         if not directory.exists():
             continue
         for path in sorted(directory.glob(f"*{PRESET_FILE_EXTENSION}")):
-            preset = _load_preset_from_path(path, built_in=built_in)
-            if not preset:
+            try:
+                stat = path.stat()
+            except OSError:
                 continue
-            presets[preset.preset_id] = preset
-    return sorted(presets.values(), key=lambda p: (0 if p.built_in else 1, p.name.lower()))
+            files.append((path, built_in, (stat.st_mtime_ns, stat.st_size)))
+    return files
+
+
+def _presets_by_id() -> Dict[str, ReleaseNotePreset]:
+    """Map preset id to preset; user presets override built-ins with the same id."""
+    global _PRESET_BY_ID, _PRESET_INDEX_KEY, _PRESET_SORTED
+    files = _preset_files()
+    key = tuple(files)
+    if key == _PRESET_INDEX_KEY:
+        return _PRESET_BY_ID
+    presets: Dict[str, ReleaseNotePreset] = {}
+    for path, built_in, fingerprint in files:
+        preset = _load_preset_cached(path, built_in, fingerprint)
+        if not preset:
+            continue
+        presets[preset.preset_id] = preset
+    _PRESET_BY_ID, _PRESET_INDEX_KEY, _PRESET_SORTED = presets, key, None
+    return presets
+
+
+def _invalidate_preset(path: Path) -> None:
+    global _PRESET_INDEX_KEY
+    _PRESET_CACHE.pop(path, None)
+    _PRESET_INDEX_KEY = None
+
+
+def list_presets() -> List[ReleaseNotePreset]:
+    """Return all available presets (built-in + user-defined)."""
+    global _PRESET_SORTED
+    presets = _presets_by_id()
+    if _PRESET_SORTED is None:
+        _PRESET_SORTED = sorted(presets.values(), key=lambda p: (0 if p.built_in else 1, p.name.lower()))
+    return list(_PRESET_SORTED)
 
 
 def get_preset(preset_id: str) -> Optional[ReleaseNotePreset]:
     """Return preset by identifier."""
-    for preset in list_presets():
-        if preset.preset_id == preset_id:
-            return preset
-    return None
+    return _presets_by_id().get(preset_id)
 
 
 def preset_exists(preset_id: str) -> bool:
-    return get_preset(preset_id) is not None
+    return preset_id in _presets_by_id()
 
 
 def _build_serializable_payload(
@@ -171,9 +214,12 @@ def save_user_preset(
     # Fill in missing locales explicitly before saving
     normalized_translations = _normalize_translations(translations)
     payload = _build_serializable_payload(preset_id, name, normalized_translations, description)
-    with preset_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
-        f.write("\n")
+    # Write to a temp file and swap it in, so a crash never leaves half a preset behind
+    tmp_path = preset_path.with_suffix(f"{PRESET_FILE_EXTENSION}.tmp")
+    tmp_path.write_text(
+        json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    tmp_path.replace(preset_path)
 
     preset = ReleaseNotePreset(
         preset_id=preset_id,
@@ -183,6 +229,11 @@ def save_user_preset(
         built_in=False,
         description=description,
     )
+    _invalidate_preset(preset_path)
+    if name:
+        # Same object a reload would produce: seed the cache instead of re-parsing the file
+        stat = preset_path.stat()
+        _PRESET_CACHE[preset_path] = ((stat.st_mtime_ns, stat.st_size), preset)
     return preset, preset_path
 
 
@@ -194,6 +245,7 @@ def delete_user_preset(preset_id: str) -> bool:
         return False
     try:
         target.unlink()
+        _invalidate_preset(target)
         return True
     except Exception:
         return False
@@ -0,0 +1,119 @@
+"""
+Source State Sidecar
+
+Remembers which base-language text each translated field was produced from,
+so re-running Translation Mode after a small edit only re-translates the
+fields whose source actually changed. One JSON file per app and version:
+
+    ~/.translater/state/{app_id}_{version_id}.json
+    {"base_locale": "en-US", "locales": {"fr-FR": {"description": "<sha256>"}}}
+
+The whole file is ignored when the base language changes. Hashes also cover
+the provider, model and refinement phrase, so switching any of them
+re-translates every field.
+
+Configuration (environment):
+- TRANSLATER_NO_SOURCE_STATE=1 disables skipping and recording
+- TRANSLATER_STATE_DIR overrides the directory (default ~/.translater/state)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+DEFAULT_STATE_DIR = Path.home() / ".translater" / "state"
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w.-]")
+
+
+def source_hash(text: str, fingerprint: str = "") -> str:
+    """sha256 of a base-language field value, salted with the translation fingerprint."""
+    blob = f"{fingerprint}\0{text or ''}" if fingerprint else (text or "")
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def translation_fingerprint(provider, refinement: str = "") -> str:
+    """Identify what produced a translation: provider, model and refinement phrase."""
+    try:
+        provider_name = provider.get_name()
+    except Exception:
+        provider_name = type(provider).__name__
+    parts = {"provider": provider_name, "model": getattr(provider, "model", None), "refinement": refinement or ""}
+    return json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class SourceState:
+    """Per app/version record of the source hash behind each written field."""
+
+    def __init__(self, path: Path, base_locale: str, fingerprint: str = ""):
+        self.path = Path(path)
+        self.base_locale = base_locale
+        self.fingerprint = fingerprint
+        self.locales: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("base_locale") != self.base_locale:
+            # Different (or unknown) base language: every stored hash is stale
+            return
+        locales = data.get("locales")
+        if isinstance(locales, dict):
+            self.locales = {
+                str(loc): {str(k): str(v) for k, v in fields.items()}
+                for loc, fields in locales.items()
+                if isinstance(fields, dict)
+            }
+
+    def is_unchanged(self, locale: str, field: str, text: str) -> bool:
+        """True when `field` of `locale` was last written from exactly `text`."""
+        with self._lock:
+            stored = self.locales.get(locale, {}).get(field)
+        return stored is not None and stored == source_hash(text, self.fingerprint)
+
+    def record(self, locale: str, base_texts: Dict[str, str]) -> None:
+        """Remember the source text of fields just written for `locale`."""
+        with self._lock:
+            entry = self.locales.setdefault(locale, {})
+            for field, text in base_texts.items():
+                entry[field] = source_hash(text, self.fingerprint)
+
+    def save(self) -> None:
+        """Write the sidecar; failures never interrupt a workflow."""
+        with self._lock:
+            payload = {"base_locale": self.base_locale, "locales": self.locales}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+
+def load_source_state(app_id: str, version_id: str, base_locale: str, fingerprint: str = "") -> Optional[SourceState]:
+    """Open the sidecar for an app version, or None when disabled via TRANSLATER_NO_SOURCE_STATE."""
+    if os.environ.get("TRANSLATER_NO_SOURCE_STATE"):
+        return None
+    state_dir = Path(os.environ.get("TRANSLATER_STATE_DIR") or DEFAULT_STATE_DIR).expanduser()
+    safe_name = _UNSAFE_NAME_CHARS.sub("_", f"{app_id}_{version_id}")
+    return SourceState(state_dir / f"{safe_name}.json", base_locale, fingerprint)
+
+
+def unchanged_fields(states: Iterable[Optional[SourceState]], locale: str, base_texts: Dict[str, str]) -> set:
+    """Fields whose source is unchanged in every given state (empty if any state is missing)."""
+    states = list(states)
+    if not states or any(state is None for state in states):
+        return set()
+    return {
+        field for field, text in base_texts.items()
+        if all(state.is_unchanged(locale, field, text) for state in states)
+    }
@@ -12,6 +12,8 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import ai_logger  # noqa: E402
+
 
 class FakeUI:
     def __init__(self, tui=False):
@@ -48,6 +50,12 @@ class FakeUI:
     def prompt_app_id(self, *_args, **_kwargs):
         return self.app_id
 
+    def app_name(self, asc_client, app_id, default="Unknown App"):
+        for app in asc_client.get_apps(limit=200).get("data", []):
+            if app.get("id") == app_id:
+                return app.get("attributes", {}).get("name") or default
+        return default
+
 
 class FakeProvider:
     def __init__(self, name="Fake Provider", model="fake-model", prefix="translated"):
@@ -261,6 +269,28 @@ def build_http_error(status=409, payload=None, text="", headers=None, json_exc=N
     return err
 
 
+def patch_asc_session(monkeypatch, fake_request):
+    """Route AppStoreConnectClient HTTP calls (made through its requests.Session) to `fake_request`."""
+    monkeypatch.setattr(
+        "app_store_client.requests.Session.request",
+        lambda _session, *args, **kwargs: fake_request(*args, **kwargs),
+    )
+
+
+def patch_ai_session(monkeypatch, post=None, get=None):
+    """Route AI provider HTTP calls (made through their pooled requests.Session) to fakes."""
+    if post is not None:
+        monkeypatch.setattr(
+            "ai_providers.requests.Session.post",
+            lambda _session, *args, **kwargs: post(*args, **kwargs),
+        )
+    if get is not None:
+        monkeypatch.setattr(
+            "ai_providers.requests.Session.get",
+            lambda _session, *args, **kwargs: get(*args, **kwargs),
+        )
+
+
 class InquirerExec:
     def __init__(self, value=None, fail=False):
         self.value = value
@@ -313,6 +343,15 @@ def patch_inquirer_import(monkeypatch, values=None, fail=False):
     monkeypatch.setattr(builtins, "__import__", fake_import)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_user_state(monkeypatch, tmp_path):
+    # Keep tests hermetic: never read or write the user's translation cache or source-state sidecars
+    monkeypatch.setenv("TRANSLATER_NO_CACHE", "1")
+    monkeypatch.setenv("TRANSLATER_STATE_DIR", str(tmp_path / "state"))
+    # ...nor the repo's ./logs: AI request logs go to a per-test directory
+    monkeypatch.setattr(ai_logger, "_logger_instance", ai_logger.AILogger(log_dir=str(tmp_path / "logs")))
+
+
 @pytest.fixture
 def fake_provider():
     return FakeProvider()
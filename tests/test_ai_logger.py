@@ -26,6 +26,17 @@ def test_ai_logger_logs_request_response_and_retry(tmp_path):
     assert "CHARACTER LIMIT RETRY" in content
 
 
+def test_ai_logger_response_includes_usage(tmp_path):
+    logger = ai_logger.AILogger(log_dir=str(tmp_path))
+    logger.log_response(
+        "anthropic", "bonjour", success=True,
+        usage={"input_tokens": 12, "cache_read_input_tokens": 900, "server_tool_use": {}},
+    )
+
+    content = Path(logger.get_log_file_path()).read_text(encoding="utf-8")
+    assert "Usage: input_tokens=12, cache_read_input_tokens=900\n" in content
+
+
 def test_ai_logger_log_error_uses_string_fallback_on_non_serializable_details(tmp_path):
     logger = ai_logger.AILogger(log_dir=str(tmp_path))
     details = {"broken": {1, 2, 3}}
@@ -2,7 +2,7 @@ import copy
 
 from ai_providers import AIProviderManager, AnthropicProvider, OpenAIProvider
 
-from conftest import DummyResponse
+from conftest import DummyResponse, patch_ai_session
 
 
 def test_provider_manager_add_get_list():
@@ -29,7 +29,7 @@ def test_openai_translate_retries_without_seed(monkeypatch):
             )
         return DummyResponse(payload={"choices": [{"message": {"content": "Bonjour"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = OpenAIProvider("api-key", "gpt-4.1")
     out = provider.translate("Hello", "French", max_length=20, seed=42, refinement="be natural")
@@ -49,7 +49,7 @@ def test_openai_translate_retries_when_too_long(monkeypatch):
             return DummyResponse(payload={"choices": [{"message": {"content": "x" * 50}}]})
         return DummyResponse(payload={"choices": [{"message": {"content": "short"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = OpenAIProvider("api-key", "gpt-4.1")
     out = provider.translate("Hello", "German", max_length=10)
@@ -67,7 +67,7 @@ def test_anthropic_translate_formats_request_and_returns_text(monkeypatch):
         captured["json"] = json
         return DummyResponse(payload={"content": [{"text": "Salut"}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = AnthropicProvider("anthropic-key", "claude-sonnet-4-20250514")
     out = provider.translate("Hello", "French", max_length=20, is_keywords=True, seed=11)
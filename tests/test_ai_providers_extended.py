@@ -1,8 +1,10 @@
 import copy
 
-from ai_providers import AnthropicProvider, GoogleGeminiProvider, OpenAIProvider
+import pytest
 
-from conftest import DummyResponse
+from ai_providers import AnthropicProvider, GoogleGeminiProvider, OpenAIProvider, StructuredReplyError
+
+from conftest import DummyResponse, patch_ai_session
 
 
 def test_google_translate_retries_without_seed(monkeypatch):
@@ -15,7 +17,7 @@ def test_google_translate_retries_without_seed(monkeypatch):
             return DummyResponse(status_code=400, payload={"error": {"message": "seed unsupported", "code": 400, "status": "INVALID_ARGUMENT"}}, text="seed unsupported")
         return DummyResponse(payload={"candidates": [{"content": {"parts": [{"text": "Bonjour"}]}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
     out = provider.translate("Hello", "French", seed=12)
@@ -35,7 +37,7 @@ def test_google_translate_retries_when_too_long(monkeypatch):
             return DummyResponse(payload={"candidates": [{"content": {"parts": [{"text": "x" * 50}]}}]})
         return DummyResponse(payload={"candidates": [{"content": {"parts": [{"text": "short"}]}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
     out = provider.translate("Hello", "German", max_length=10)
@@ -45,9 +47,9 @@ def test_google_translate_retries_when_too_long(monkeypatch):
 
 
 def test_google_translate_max_tokens_finish_reason_raises(monkeypatch):
-    monkeypatch.setattr(
-        "ai_providers.requests.post",
-        lambda *_a, **_k: DummyResponse(payload={"candidates": [{"finishReason": "MAX_TOKENS"}]})
+    patch_ai_session(
+        monkeypatch,
+        post=lambda *_a, **_k: DummyResponse(payload={"candidates": [{"finishReason": "MAX_TOKENS"}]}),
     )
 
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
@@ -65,7 +67,7 @@ def test_openai_gpt5_uses_max_completion_tokens(monkeypatch):
         captured["json"] = copy.deepcopy(json)
         return DummyResponse(payload={"choices": [{"message": {"content": "ok"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     provider = OpenAIProvider("key", "gpt-5.2")
     out = provider.translate("hello", "French")
 
@@ -81,7 +83,7 @@ def test_openai_supports_service_tier_flex(monkeypatch):
         captured["timeout"] = _kwargs.get("timeout")
         return DummyResponse(payload={"choices": [{"message": {"content": "ok"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     provider = OpenAIProvider("key", "gpt-4.1", service_tier="flex")
     out = provider.translate("hello", "French")
 
@@ -97,7 +99,7 @@ def test_openai_non_flex_timeout_is_lower_by_default(monkeypatch):
         captured["timeout"] = _kwargs.get("timeout")
         return DummyResponse(payload={"choices": [{"message": {"content": "ok"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     provider = OpenAIProvider("key", "gpt-4.1")  # no tier
     out = provider.translate("hello", "French")
 
@@ -109,7 +111,7 @@ def test_anthropic_http_error_bubbles_as_wrapped_exception(monkeypatch):
     def fake_post(_url, headers=None, json=None, **_kwargs):
         return DummyResponse(status_code=401, payload={"error": {"type": "auth_error", "message": "bad key"}}, text="bad key")
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     provider = AnthropicProvider("bad", "claude-sonnet-4-20250514")
 
     try:
@@ -117,3 +119,98 @@ def test_anthropic_http_error_bubbles_as_wrapped_exception(monkeypatch):
         assert False, "expected exception"
     except Exception as e:
         assert "Anthropic API error 401" in str(e)
+
+
+_SCHEMA = {
+    "type": "object",
+    "properties": {"description": {"type": "string"}, "keywords": {"type": "array", "items": {"type": "string"}}},
+    "required": ["description", "keywords"],
+    "additionalProperties": False,
+}
+
+
+def _capture_posts(monkeypatch, payloads):
+    captured = []
+
+    def fake_post(url, headers=None, json=None, **_kwargs):
+        captured.append((url, copy.deepcopy(json)))
+        return DummyResponse(payload=payloads.pop(0))
+
+    patch_ai_session(monkeypatch, post=fake_post)
+    return captured
+
+
+def test_anthropic_translate_json_forces_tool_call_and_detects_truncation(monkeypatch):
+    reply = {"description": "Bonjour", "keywords": ["a"]}
+    captured = _capture_posts(monkeypatch, [
+        {"content": [{"type": "tool_use", "name": "submit_translation", "input": reply}], "stop_reason": "tool_use"},
+        {"content": [{"type": "tool_use", "input": {}}], "stop_reason": "max_tokens"},
+    ])
+    provider = AnthropicProvider("key", "claude-sonnet-4-20250514")
+
+    out = provider.translate_json({"description": "Hello"}, "French", schema=_SCHEMA, instructions="Rules.",
+                                  max_output_tokens=50000, seed=4)
+    assert out == reply
+    body = captured[0][1]
+    assert body["tools"][0]["input_schema"] == _SCHEMA
+    assert body["tool_choice"] == {"type": "tool", "name": "submit_translation"}
+    assert body["max_tokens"] == provider.structured_output_cap() == 32000
+
+    with pytest.raises(StructuredReplyError, match="max_tokens"):
+        provider.translate_json({"description": "Hello"}, "French", schema=_SCHEMA, instructions="Rules.",
+                                max_output_tokens=100)
+
+
+def test_openai_translate_json_uses_strict_schema_and_reasoning_headroom(monkeypatch):
+    captured = _capture_posts(monkeypatch, [
+        {"choices": [{"message": {"content": '{"description": "Bonjour", "keywords": []}'}, "finish_reason": "stop"}]},
+        {"choices": [{"message": {"content": '{"description": "Bon'}, "finish_reason": "length"}]},
+    ])
+    provider = OpenAIProvider("key", "gpt-5.2")
+
+    out = provider.translate_json({"description": "Hello"}, "French", schema=_SCHEMA, instructions="Rules.",
+                                  max_output_tokens=1000)
+    assert out == {"description": "Bonjour", "keywords": []}
+    body = captured[0][1]
+    assert body["response_format"]["json_schema"] == {"name": "translation", "strict": True, "schema": _SCHEMA}
+    assert body["max_completion_tokens"] == 1000 + 8192
+
+    with pytest.raises(StructuredReplyError, match="output limit"):
+        provider.translate_json({"description": "Hello"}, "French", schema=_SCHEMA, instructions="Rules.",
+                                max_output_tokens=1000)
+    assert OpenAIProvider("key", "gpt-4").structured_output_cap() == 0
+
+
+def test_openai_translate_json_raises_http_errors(monkeypatch):
+    patch_ai_session(
+        monkeypatch,
+        post=lambda *_a, **_k: DummyResponse(status_code=401, payload={"error": {"message": "bad key"}}, text="bad key"),
+    )
+    provider = OpenAIProvider("key", "gpt-4.1")
+
+    with pytest.raises(Exception, match="OpenAI GPT API error 401") as excinfo:
+        provider.translate_json({"a": "Hello"}, "French", schema=_SCHEMA, instructions="", max_output_tokens=100)
+    assert not isinstance(excinfo.value, StructuredReplyError)
+
+
+def test_google_translate_json_sets_mime_type_and_converts_schema(monkeypatch):
+    captured = _capture_posts(monkeypatch, [
+        {"candidates": [{"content": {"parts": [{"text": '{"description": "Hallo", "keywords": ["x"]}'}]}}]},
+        {"candidates": [{"content": {"parts": [{"text": "not json"}]}, "finishReason": "STOP"}]},
+    ])
+    provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
+
+    out = provider.translate_json({"description": "Hello"}, "German", schema=_SCHEMA, instructions="Rules.",
+                                  max_output_tokens=1000)
+    assert out == {"description": "Hallo", "keywords": ["x"]}
+    url, body = captured[0]
+    assert "/v1beta/models/gemini-2.5-flash:generateContent" in url
+    config = body["generationConfig"]
+    assert config["responseMimeType"] == "application/json"
+    assert config["responseSchema"]["type"] == "OBJECT"
+    assert config["responseSchema"]["properties"]["keywords"]["items"] == {"type": "STRING"}
+    assert "additionalProperties" not in config["responseSchema"]
+
+    with pytest.raises(StructuredReplyError, match="not valid JSON"):
+        provider.translate_json({"description": "Hello"}, "German", schema=_SCHEMA, instructions="Rules.",
+                                max_output_tokens=1000)
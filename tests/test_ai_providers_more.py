@@ -1,8 +1,8 @@
 import copy
 
-from ai_providers import AIProvider, AnthropicProvider, GoogleGeminiProvider, OpenAIProvider
+from ai_providers import AIProvider, AIProviderManager, AnthropicProvider, GoogleGeminiProvider, OpenAIProvider
 
-from conftest import DummyResponse
+from conftest import DummyResponse, patch_ai_session
 
 
 def test_ai_provider_abstract_method_bodies_are_reachable():
@@ -34,7 +34,7 @@ def test_anthropic_retries_after_character_limit(monkeypatch):
             return DummyResponse(payload={"content": [{"text": "x" * 50}]})
         return DummyResponse(payload={"content": [{"text": "short"}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
 
     provider = AnthropicProvider("api-key", "claude-sonnet-4-20250514")
     out = provider.translate("hello", "French", max_length=10, refinement="tone")
@@ -42,13 +42,15 @@ def test_anthropic_retries_after_character_limit(monkeypatch):
     assert out == "short"
     assert calls["n"] == 2
     assert "Additional guidance: tone" in calls["payloads"][0]["system"]
+    assert "MUST be under 10 characters" in calls["payloads"][1]["system"]
 
 
 def test_openai_http_error_when_error_body_not_json(monkeypatch):
     def fake_post(_url, headers=None, json=None, **_kwargs):
         return DummyResponse(status_code=500, payload={}, text="internal", json_exc=ValueError("bad json"))
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
+    monkeypatch.setattr("ai_providers.time.sleep", lambda *_a, **_k: None)
     provider = OpenAIProvider("api-key", "gpt-4.1")
 
     try:
@@ -67,7 +69,7 @@ def test_openai_retries_on_500_then_succeeds(monkeypatch):
             return DummyResponse(status_code=500, payload={"error": {"message": "internal"}}, text="internal")
         return DummyResponse(payload={"choices": [{"message": {"content": "ok"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     monkeypatch.setattr("ai_providers.time.sleep", lambda *_a, **_k: None)
 
     provider = OpenAIProvider("api-key", "gpt-4.1")
@@ -77,7 +79,7 @@ def test_openai_retries_on_500_then_succeeds(monkeypatch):
 
 
 def test_openai_unexpected_payload_shape_is_wrapped(monkeypatch):
-    monkeypatch.setattr("ai_providers.requests.post", lambda *_a, **_k: DummyResponse(payload={}))
+    patch_ai_session(monkeypatch, post=lambda *_a, **_k: DummyResponse(payload={}))
     provider = OpenAIProvider("api-key", "gpt-4.1")
 
     try:
@@ -98,7 +100,7 @@ def test_openai_retries_character_limit_followup(monkeypatch):
             return DummyResponse(status_code=500, payload={"error": {"message": "internal"}}, text="internal")
         return DummyResponse(payload={"choices": [{"message": {"content": "short"}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     monkeypatch.setattr("ai_providers.time.sleep", lambda *_a, **_k: None)
 
     provider = OpenAIProvider("api-key", "gpt-4.1")
@@ -115,7 +117,7 @@ def test_google_seed_cast_failure_and_keyword_refinement(monkeypatch):
         captured["json"] = copy.deepcopy(json)
         return DummyResponse(payload={"candidates": [{"content": {"parts": [{"text": "ok"}]}}]})
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    patch_ai_session(monkeypatch, post=fake_post)
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
 
     out = provider.translate("hello", "German", is_keywords=True, refinement="short and formal", seed="not-an-int")
@@ -127,9 +129,9 @@ def test_google_seed_cast_failure_and_keyword_refinement(monkeypatch):
 
 
 def test_google_http_error_without_seed_retry(monkeypatch):
-    monkeypatch.setattr(
-        "ai_providers.requests.post",
-        lambda *_a, **_k: DummyResponse(status_code=400, payload={"error": {"status": "INVALID_ARGUMENT", "code": 400, "message": "bad request"}}, text="bad request"),
+    patch_ai_session(
+        monkeypatch,
+        post=lambda *_a, **_k: DummyResponse(status_code=400, payload={"error": {"status": "INVALID_ARGUMENT", "code": 400, "message": "bad request"}}, text="bad request"),
     )
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
 
@@ -141,7 +143,7 @@ def test_google_http_error_without_seed_retry(monkeypatch):
 
 
 def test_google_unexpected_payload_shape_is_wrapped(monkeypatch):
-    monkeypatch.setattr("ai_providers.requests.post", lambda *_a, **_k: DummyResponse(payload={}))
+    patch_ai_session(monkeypatch, post=lambda *_a, **_k: DummyResponse(payload={}))
     provider = GoogleGeminiProvider("key", "gemini-2.5-flash")
 
     try:
@@ -149,3 +151,86 @@ def test_google_unexpected_payload_shape_is_wrapped(monkeypatch):
         assert False, "expected exception"
     except Exception as e:
         assert "Google Gemini translation failed" in str(e)
+
+
+def test_anthropic_retries_overloaded_honoring_retry_after(monkeypatch):
+    responses = [
+        DummyResponse(status_code=529, headers={"retry-after": "7"}),
+        DummyResponse(status_code=429, headers={"retry-after-ms": "1500"}),
+        DummyResponse(payload={"content": [{"text": "bonjour"}]}),
+    ]
+    sleeps = []
+    patch_ai_session(monkeypatch, post=lambda *_a, **_k: responses.pop(0))
+    monkeypatch.setattr("ai_providers.time.sleep", lambda s: sleeps.append(s))
+
+    provider = AnthropicProvider("api-key", "claude-model")
+    assert provider.translate("hello", "French") == "bonjour"
+    assert sleeps == [7.0, 1.5]
+
+
+def test_gemini_retries_connection_error_with_jittered_backoff(monkeypatch):
+    import requests
+
+    calls = {"n": 0}
+
+    def fake_post(*_a, **_k):
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise requests.exceptions.ConnectionError("reset")
+        return DummyResponse(payload={"candidates": [{"content": {"parts": [{"text": "hola"}]}}]})
+
+    sleeps = []
+    patch_ai_session(monkeypatch, post=fake_post)
+    monkeypatch.setattr("ai_providers.time.sleep", lambda s: sleeps.append(s))
+
+    provider = GoogleGeminiProvider("api-key", "gemini-model")
+    assert provider.translate("hello", "Spanish") == "hola"
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_retries_stop_after_max_attempts(monkeypatch):
+    calls = {"n": 0}
+
+    def fake_post(*_a, **_k):
+        calls["n"] += 1
+        return DummyResponse(status_code=503, payload={"error": {"message": "unavailable"}})
+
+    monkeypatch.setenv("TRANSLATER_AI_MAX_ATTEMPTS", "3")
+    patch_ai_session(monkeypatch, post=fake_post)
+    monkeypatch.setattr("ai_providers.time.sleep", lambda *_a: None)
+
+    provider = AnthropicProvider("api-key", "claude-model")
+    try:
+        provider.translate("hello", "French")
+        assert False, "expected exception"
+    except Exception as e:
+        assert "503" in str(e)
+    assert calls["n"] == 3
+
+
+def test_provider_reuses_one_pooled_session_until_closed(monkeypatch):
+    sessions = []
+
+    def fake_post(self, *_a, **_k):
+        sessions.append(self)
+        return DummyResponse(payload={"content": [{"text": "Bonjour"}]})
+
+    monkeypatch.setattr("ai_providers.requests.Session.post", fake_post)
+    provider = AnthropicProvider("api-key", "claude-model")
+    provider.translate("hello", "French")
+    provider.translate("world", "French")
+    assert len(sessions) == 2 and sessions[0] is sessions[1]
+
+    manager = AIProviderManager()
+    manager.add_provider("anthropic", provider)
+    manager.close()
+    provider.translate("again", "French")
+    assert sessions[2] is not sessions[0]
+
+
+def test_provider_pool_covers_limiter_concurrency(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_OPENAI_MAX_CONCURRENCY", "48")
+    provider = OpenAIProvider("api-key", "gpt-model")
+    assert provider.session.get_adapter("https://api.openai.com")._pool_maxsize == 48
+    provider.close()
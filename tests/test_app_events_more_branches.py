@@ -1,5 +1,6 @@
 import builtins
 
+from app_store_client import ASCConflictError
 from app_events_test_helpers import make_event, make_event_loc
 from workflows import app_events_translate as aet
 
@@ -83,7 +84,6 @@ def test_app_events_run_fallback_and_target_skip_paths(fake_cli, fake_ui, fake_a
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1", primary=None)])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: [])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     fake_asc.set_response("get_app_event_localizations", {"data": []})
@@ -100,13 +100,10 @@ def test_app_events_run_conflict_recovery_and_failure_paths(fake_cli, fake_ui, f
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: ["de-DE", "fr-FR"])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     monkeypatch.setattr(
-        aet,
-        "format_progress",
+        "utils.format_progress",
         lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("no progress")),
-        raising=False,
     )
 
     call_count = {"locs": 0}
@@ -132,7 +129,7 @@ def test_app_events_run_conflict_recovery_and_failure_paths(fake_cli, fake_ui, f
 
     fake_asc.set_response(
         "create_app_event_localization",
-        lambda _event_id, locale, **_kwargs: (_ for _ in ()).throw(Exception("409 create conflict"))
+        lambda _event_id, locale, **_kwargs: (_ for _ in ()).throw(ASCConflictError("409 create conflict", status_code=409))
         if locale == "de-DE"
         else {"data": {"id": "created"}},
     )
@@ -154,7 +151,6 @@ def test_app_events_run_filtered_targets_empty_after_base_removal(fake_cli, fake
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: ["en-US"])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     fake_asc.set_response(
         "get_app_event_localizations",
@@ -168,7 +164,6 @@ def test_app_events_run_update_path_progress_and_clear_errors(fake_cli, fake_ui,
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     fake_asc.set_response(
         "get_app_event_localizations",
@@ -189,7 +184,7 @@ def test_app_events_run_update_path_progress_and_clear_errors(fake_cli, fake_ui,
             raise RuntimeError("clear fail")
         return real_print(*args, **kwargs)
 
-    monkeypatch.setattr(aet, "format_progress", format_progress, raising=False)
+    monkeypatch.setattr("utils.format_progress", format_progress)
     monkeypatch.setattr(aet, "print", fake_print, raising=False)
     assert aet.run(fake_cli) is True
 
@@ -199,7 +194,6 @@ def test_app_events_run_409_refresh_fallback_and_recovered_progress_error(fake_c
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     calls = {"locs": 0}
 
@@ -212,7 +206,7 @@ def test_app_events_run_409_refresh_fallback_and_recovered_progress_error(fake_c
     fake_asc.set_response("get_app_event_localizations", get_event_locs)
     fake_asc.set_response(
         "create_app_event_localization",
-        lambda *_a, **_k: (_ for _ in ()).throw(Exception("409 create conflict")),
+        lambda *_a, **_k: (_ for _ in ()).throw(ASCConflictError("409 create conflict", status_code=409)),
     )
     fake_asc.set_response("update_app_event_localization", {"data": {"id": "loc-fr"}})
     fake_asc.set_response(
@@ -230,5 +224,5 @@ def test_app_events_run_409_refresh_fallback_and_recovered_progress_error(fake_c
             raise RuntimeError("progress fail")
         return "0/1 Saving locales..."
 
-    monkeypatch.setattr(aet, "format_progress", format_progress, raising=False)
+    monkeypatch.setattr("utils.format_progress", format_progress)
     assert aet.run(fake_cli) is True
@@ -1,5 +1,6 @@
 import builtins
 
+from app_store_client import ASCConflictError
 from app_events_test_helpers import make_event, make_event_loc
 from workflows import app_events_translate as aet
 
@@ -23,7 +24,6 @@ def test_app_events_run_skips_missing_id_and_missing_localizations(fake_cli, fak
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event(event_id=""), make_event("event2")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(aet, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     fake_asc.set_response("get_app_event_localizations", {"data": []})
@@ -38,7 +38,6 @@ def test_app_events_run_prompts_for_missing_base_fields_and_skips(fake_cli, fake
     fake_ui.multiline_values.append("")
     monkeypatch.setattr(aet, "_select_app_events", lambda *_a, **_k: [make_event("event1")])
     monkeypatch.setattr(aet, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     fake_asc.set_response("get_app_event_localizations", {"data": [make_event_loc("loc-en", "en-US", name="", short="", long="")]})
@@ -61,7 +60,6 @@ def test_app_events_run_recovers_from_409_update_conflict_via_fetch_match(
             {"de-DE": "translation failed"},
         ),
     )
-    monkeypatch.setattr(aet.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     monkeypatch.setattr(aet, "_DEBUG_APP_EVENTS", True)
     debug_lines = []
@@ -86,11 +84,11 @@ def test_app_events_run_recovers_from_409_update_conflict_via_fetch_match(
     )
     fake_asc.set_response(
         "create_app_event_localization",
-        lambda *_a, **_k: (_ for _ in ()).throw(Exception("409 create conflict")),
+        lambda *_a, **_k: (_ for _ in ()).throw(ASCConflictError("409 create conflict", status_code=409)),
     )
     fake_asc.set_response(
         "update_app_event_localization",
-        lambda *_a, **_k: (_ for _ in ()).throw(Exception("409 update conflict")),
+        lambda *_a, **_k: (_ for _ in ()).throw(ASCConflictError("409 update conflict", status_code=409)),
     )
     fake_asc.set_response(
         "get_app_event_localization",
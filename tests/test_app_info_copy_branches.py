@@ -33,7 +33,6 @@ def test_app_info_run_target_provider_and_save_failure_paths(fake_cli, fake_ui,
         "create_app_info_localization",
         lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")),
     )
-    monkeypatch.setattr(app_info.time, "sleep", lambda *_a, **_k: None)
     assert app_info.run(fake_cli) is True
 
 
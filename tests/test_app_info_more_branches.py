@@ -23,7 +23,6 @@ def test_app_info_run_success_path_creates_localization(fake_cli, fake_ui, fake_
     fake_asc.set_response("get_app_info_localizations", {"data": [_loc("loc-en", "en-US")]})
     fake_asc.set_response("get_app_info_localization", {"data": {"attributes": {"name": "Base", "subtitle": "Sub"}}})
     fake_asc.set_response("create_app_info_localization", {"data": {"id": "loc-fr"}})
-    monkeypatch.setattr(app_info.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(app_info, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
     monkeypatch.setattr(app_info, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
@@ -48,3 +47,19 @@ def test_app_info_run_empty_translation_warning_and_save_error(fake_cli, fake_ui
     )
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     assert app_info.run(fake_cli) is True
+
+
+def test_app_info_run_updates_existing_locale_instead_of_creating(fake_cli, fake_ui, fake_asc, monkeypatch):
+    fake_ui.app_id = "app1"
+    fake_asc.set_response("find_primary_app_info_id", "app-info-1")
+    fake_asc.set_response("get_app_info_localizations", {"data": [_loc("loc-en", "en-US"), _loc("loc-fr", "fr-FR")]})
+    fake_asc.set_response("get_app_info_localization", {"data": {"attributes": {"name": "Base", "subtitle": "Sub"}}})
+    fake_asc.set_response("update_app_info_localization", {"data": {"id": "loc-fr"}})
+    monkeypatch.setattr(app_info, "choose_target_locales", lambda *_a, **_k: ["fr-FR", "de-DE"])
+    monkeypatch.setattr(app_info, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert app_info.run(fake_cli) is True
+    calls = [(name, args) for name, args, _kwargs in fake_asc.calls]
+    assert [args[0] for name, args in calls if name == "update_app_info_localization"] == ["loc-fr"]
+    assert [args[1] for name, args in calls if name == "create_app_info_localization"] == ["de-DE"]
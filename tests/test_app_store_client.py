@@ -1,9 +1,11 @@
+import json
+
 import requests
 import pytest
 
-from app_store_client import AppStoreConnectClient
+from app_store_client import AppStoreConnectClient, ASCConflictError, ASCRateLimitError
 
-from conftest import DummyResponse
+from conftest import DummyResponse, patch_asc_session
 
 
 def test_request_uses_v1_base_and_auth_header(monkeypatch):
@@ -17,7 +19,7 @@ def test_request_uses_v1_base_and_auth_header(monkeypatch):
         return DummyResponse(payload={"ok": True})
 
     monkeypatch.setattr("app_store_client.jwt.encode", fake_encode)
-    monkeypatch.setattr("app_store_client.requests.request", fake_request)
+    patch_asc_session(monkeypatch, fake_request)
 
     client = AppStoreConnectClient("kid", "issuer", "pk")
     out = client._request("GET", "apps", params={"limit": 1})
@@ -29,8 +31,8 @@ def test_request_uses_v1_base_and_auth_header(monkeypatch):
 
 def test_request_routes_v2_endpoint(monkeypatch):
     monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
-    monkeypatch.setattr(
-        "app_store_client.requests.request",
+    patch_asc_session(
+        monkeypatch,
         lambda *_a, **_k: DummyResponse(payload={"data": [{"id": "1"}]})
     )
 
@@ -49,7 +51,7 @@ def test_request_retries_on_409(monkeypatch):
         return DummyResponse(payload={"data": [{"id": "ok"}]})
 
     monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
-    monkeypatch.setattr("app_store_client.requests.request", fake_request)
+    patch_asc_session(monkeypatch, fake_request)
     monkeypatch.setattr("app_store_client.time.sleep", lambda *_a, **_k: None)
 
     client = AppStoreConnectClient("kid", "issuer", "pk")
@@ -77,7 +79,7 @@ def test_request_does_not_retry_mutation_409_and_preserves_asc_detail(monkeypatc
         return DummyResponse(status_code=409, payload=payload)
 
     monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
-    monkeypatch.setattr("app_store_client.requests.request", fake_request)
+    patch_asc_session(monkeypatch, fake_request)
 
     client = AppStoreConnectClient("kid", "issuer", "pk")
     with pytest.raises(requests.exceptions.HTTPError) as exc_info:
@@ -87,12 +89,31 @@ def test_request_does_not_retry_mutation_409_and_preserves_asc_detail(monkeypatc
             data={"data": {"id": "loc-1"}},
         )
     assert calls["n"] == 1
+    assert isinstance(exc_info.value, ASCConflictError)
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.response.status_code == 409
     message = str(exc_info.value)
     assert "ENTITY_ERROR.ATTRIBUTE.INVALID" in message
     assert "The value is invalid." in message
     assert "/data/attributes/whatsNew" in message
 
 
+def test_request_raises_rate_limit_error_after_retries(monkeypatch):
+    monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
+    monkeypatch.setattr("app_store_client.time.sleep", lambda *_a, **_k: None)
+    patch_asc_session(
+        monkeypatch,
+        lambda *_a, **_k: DummyResponse(status_code=429, headers={"Retry-After": "7"}),
+    )
+
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    with pytest.raises(ASCRateLimitError) as exc_info:
+        client._request("GET", "apps", max_retries=1)
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 7.0
+    assert not isinstance(exc_info.value, ASCConflictError)
+
+
 def test_create_and_update_localization_payload_mapping(monkeypatch):
     sent = []
 
@@ -173,3 +194,39 @@ def test_many_wrapper_methods_hit_expected_endpoints(monkeypatch):
     assert any("appEvents" in e for e in endpoints)
     assert any("gameCenterDetails" in e for e in endpoints)
     assert any("gameCenterActivities/activity1/versions" in e for e in endpoints)
+
+
+def test_requests_share_one_pooled_session(monkeypatch):
+    sessions = []
+
+    def fake_request(session, method, url, **_kwargs):
+        sessions.append(session)
+        return DummyResponse(payload={"data": []})
+
+    monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
+    monkeypatch.setattr("app_store_client.requests.Session.request", fake_request)
+
+    with AppStoreConnectClient("kid", "issuer", "pk") as client:
+        client._request("GET", "apps")
+        client._request("GET", "apps")
+        assert sessions == [client.session, client.session]
+        assert client.session.get_adapter("https://api.appstoreconnect.apple.com")._pool_maxsize == 20
+
+
+def test_request_decodes_raw_body_with_and_without_orjson(monkeypatch):
+    import app_store_client
+
+    class RawResponse(DummyResponse):
+        content = b'{"data": [{"attributes": {"locale": "fr-FR", "description": "\xc3\xa9t\xc3\xa9"}}]}'
+
+        def json(self):
+            return json.loads(self.content)
+
+    monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
+    monkeypatch.setattr("app_store_client.requests.Session.request", lambda *_a, **_k: RawResponse())
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    expected = {"data": [{"attributes": {"locale": "fr-FR", "description": "été"}}]}
+
+    assert client._request("GET", "apps") == expected
+    monkeypatch.setattr(app_store_client, "orjson", None)
+    assert client._request("GET", "apps") == expected
@@ -1,7 +1,7 @@
 import requests
 
 from app_store_client import AppStoreConnectClient
-from conftest import DummyResponse
+from conftest import DummyResponse, patch_asc_session
 
 
 def test_request_retries_5xx_and_raises_with_unprintable_preview(monkeypatch):
@@ -27,13 +27,13 @@ def test_request_retries_5xx_and_raises_with_unprintable_preview(monkeypatch):
             )
         return DummyResponse(payload={"data": [{"id": "ok"}]})
 
-    monkeypatch.setattr("app_store_client.requests.request", fake_request)
+    patch_asc_session(monkeypatch, fake_request)
     client = AppStoreConnectClient("kid", "issuer", "pk")
     out = client._request("GET", "apps", params={"x": _Bad()}, max_retries=1)
     assert out["data"][0]["id"] == "ok"
 
-    monkeypatch.setattr(
-        "app_store_client.requests.request",
+    patch_asc_session(
+        monkeypatch,
         lambda *_a, **_k: DummyResponse(status_code=500, headers={"request-id": "req-2"}, text="still down"),
     )
     try:
@@ -43,7 +43,35 @@ def test_request_retries_5xx_and_raises_with_unprintable_preview(monkeypatch):
         pass
 
 
-def test_apps_paging_and_latest_version_helpers(monkeypatch):
+
+def test_request_retries_429_mutation_honoring_retry_after(monkeypatch):
+    sleeps = []
+    clock = {"now": 1000.0}
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
+    monkeypatch.setattr("app_store_client.time.sleep", fake_sleep)
+    monkeypatch.setattr("ratelimit.time.monotonic", lambda: clock["now"])
+
+    responses = [
+        DummyResponse(status_code=429, headers={"Retry-After": "4"}),
+        DummyResponse(status_code=429),
+        DummyResponse(payload={"data": {"id": "loc-1"}}),
+    ]
+    patch_asc_session(monkeypatch, lambda *_a, **_k: responses.pop(0))
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    nominal = client.rate_limiter.refill_rate
+
+    out = client._request("PATCH", "appStoreVersionLocalizations/loc-1", data={"data": {}})
+    assert out["data"]["id"] == "loc-1"
+    assert sleeps[0] == 4.0
+    assert 4.0 <= sleeps[1] <= 5.0  # no header: 2**2 plus jitter
+    # Two 429s slowed the bucket down; the success starts recovering it
+    assert client.rate_limiter.refill_rate < nominal
+
     seen = []
 
     def fake_request(_self, method, endpoint, params=None, data=None, max_retries=3):
@@ -177,6 +205,18 @@ def test_app_info_and_copy_localization_paths(monkeypatch):
     assert client.copy_localization_from_previous_version("src", "dst", "fr-FR") is True
     assert client.copy_localization_from_previous_version("src", "dst", "ja") is False
 
+    # Prefetched localizations skip the per-locale GETs
+    sent.clear()
+    assert client.copy_localization_from_previous_version(
+        "src",
+        "dst",
+        "fr-FR",
+        source_localizations=[{"id": "src-loc", "attributes": {"locale": "fr-FR", "description": "Desc"}}],
+        target_localizations=[{"id": "dst-loc", "attributes": {"locale": "fr-FR"}}],
+    ) is True
+    assert not [e for _m, e, _d in sent if e.endswith("/appStoreVersionLocalizations")]
+    assert ("PATCH", "appStoreVersionLocalizations/dst-loc") in [(m, e) for m, e, _d in sent]
+
 
 def test_subscription_conflict_fallback_paths(monkeypatch):
     client = AppStoreConnectClient("kid", "issuer", "pk")
@@ -272,3 +312,13 @@ def test_game_center_optional_fields_and_image_accessors(monkeypatch):
     assert "v1/gameCenterChallengeLocalizations/loc4/relationships/image" in endpoints
     assert "v1/gameCenterChallengeImages/img4" in endpoints
     assert "v1/gameCenterLeaderboardLocalizations" in endpoints
+
+
+def test_session_pool_covers_locale_workers(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_CONCURRENCY", "32")
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    assert client.session.get_adapter("https://api.appstoreconnect.apple.com")._pool_maxsize == 32
+
+    monkeypatch.setenv("TRANSLATER_CONCURRENCY", "2")
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    assert client.session.get_adapter("https://api.appstoreconnect.apple.com")._pool_maxsize == 20
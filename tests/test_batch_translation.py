@@ -0,0 +1,153 @@
+import json
+import re
+
+import batch_translation
+from ai_providers import AnthropicProvider, OpenAIProvider
+
+from conftest import DummyResponse, FakeProvider, patch_ai_session
+
+
+class BatchProvider(FakeProvider):
+    def __init__(self, outputs, polls_before_ready=1):
+        super().__init__()
+        self.outputs = outputs
+        self.polls_before_ready = polls_before_ready
+        self.jobs = None
+
+    def submit_batch(self, jobs):
+        self.jobs = jobs
+        return "batch-1"
+
+    def poll_batch(self, batch_id):
+        assert batch_id == "batch-1"
+        if self.polls_before_ready:
+            self.polls_before_ready -= 1
+            return None
+        return self.outputs
+
+
+def test_batch_api_enabled_requires_flag_threshold_and_support(monkeypatch):
+    provider = BatchProvider({})
+    assert not batch_translation.batch_api_enabled(provider, 20)
+    monkeypatch.setenv("TRANSLATER_BATCH_API", "1")
+    assert batch_translation.batch_api_enabled(provider, 8)
+    assert not batch_translation.batch_api_enabled(provider, 7)
+    assert not batch_translation.batch_api_enabled(FakeProvider(), 20)
+    monkeypatch.setenv("TRANSLATER_BATCH_API_THRESHOLD", "2")
+    assert batch_translation.batch_api_enabled(provider, 2)
+
+
+def test_translate_locales_via_batch_keeps_only_valid_results(monkeypatch):
+    monkeypatch.setattr(batch_translation.time, "sleep", lambda *_a, **_k: None)
+    provider = BatchProvider({
+        "r0": "Description FR",
+        "r1": "k" * 200,
+        "r2": " Beschreibung ",
+    })
+    fields = {
+        "description": {"text": "Description", "max_length": 4000, "field_label": "App description"},
+        "keywords": {"text": "a,b", "max_length": 100, "is_keywords": True, "single_line": True},
+    }
+
+    results = batch_translation.translate_locales_via_batch(
+        provider, fields, ["fr-FR", "de-DE"], seed=5, refinement="tone"
+    )
+
+    assert results == {"fr-FR": {"description": "Description FR"}, "de-DE": {"description": "Beschreibung"}}
+    # Anthropic rejects custom_id values outside [a-zA-Z0-9_-]{1,64}
+    assert [job["custom_id"] for job in provider.jobs] == ["r0", "r1", "r2", "r3"]
+    assert all(re.fullmatch(r"[a-zA-Z0-9_-]{1,64}", job["custom_id"]) for job in provider.jobs)
+    assert provider.jobs[0]["target_language"] == "French"
+    assert provider.jobs[1]["is_keywords"] is True
+    assert "tone" in provider.jobs[0]["refinement"]
+
+
+def test_wait_for_batch_times_out(monkeypatch):
+    monkeypatch.setattr(batch_translation.time, "sleep", lambda *_a, **_k: None)
+    provider = BatchProvider({}, polls_before_ready=99)
+    try:
+        batch_translation.wait_for_batch(provider, "batch-1", timeout_seconds=0)
+    except TimeoutError as e:
+        assert "batch-1" in str(e)
+    else:
+        raise AssertionError("expected TimeoutError")
+
+
+def test_anthropic_submit_and_poll_batch(monkeypatch):
+    posted = {}
+
+    def fake_post(url, headers=None, json=None, **_kwargs):
+        posted["url"], posted["json"] = url, json
+        return DummyResponse(payload={"id": "msgbatch_1"})
+
+    results_text = "\n".join([
+        json.dumps({"custom_id": "r0", "result": {"type": "succeeded", "message": {"content": [{"text": " Bonjour "}]}}}),
+        json.dumps({"custom_id": "r1", "result": {"type": "errored"}}),
+    ])
+    statuses = iter([{"processing_status": "in_progress"}, {"processing_status": "ended", "results_url": "https://results"}])
+
+    def fake_get(url, headers=None, **_kwargs):
+        if url == "https://results":
+            return DummyResponse(text=results_text)
+        return DummyResponse(payload=next(statuses))
+
+    patch_ai_session(monkeypatch, post=fake_post)
+    patch_ai_session(monkeypatch, get=fake_get)
+    provider = AnthropicProvider("key", "claude")
+
+    batch_id = provider.submit_batch([{"custom_id": "r0", "text": "Hello", "target_language": "French", "seed": 3}])
+
+    assert batch_id == "msgbatch_1"
+    assert posted["url"].endswith("/v1/messages/batches")
+    params = posted["json"]["requests"][0]["params"]
+    assert params["messages"][0]["content"] == "Hello"
+    assert params["metadata"] == {"seed": "3"}
+    assert provider.poll_batch(batch_id) is None
+    assert provider.poll_batch(batch_id) == {"r0": "Bonjour"}
+
+
+def test_openai_submit_and_poll_batch(monkeypatch):
+    posted = []
+
+    def fake_post(url, headers=None, json=None, data=None, files=None, **_kwargs):
+        posted.append((url, json, data, files))
+        if url.endswith("/v1/files"):
+            return DummyResponse(payload={"id": "file-in"})
+        return DummyResponse(payload={"id": "batch_1"})
+
+    output = json.dumps({"custom_id": "r0", "response": {"status_code": 200, "body": {"choices": [{"message": {"content": "Hallo"}}]}}})
+    gets = iter([
+        DummyResponse(payload={"status": "completed", "output_file_id": "file-out"}),
+        DummyResponse(text=output),
+        DummyResponse(payload={"status": "expired"}),
+    ])
+    patch_ai_session(monkeypatch, post=fake_post)
+    patch_ai_session(monkeypatch, get=lambda *_a, **_k: next(gets))
+    provider = OpenAIProvider("key", "gpt-4.1", service_tier="flex")
+
+    batch_id = provider.submit_batch([{"custom_id": "r0", "text": "Hello", "target_language": "German", "seed": 1}])
+
+    assert batch_id == "batch_1"
+    line = json.loads(posted[0][3]["file"][1].decode("utf-8"))
+    assert line["url"] == "/v1/chat/completions"
+    assert line["body"]["seed"] == 1
+    assert "service_tier" not in line["body"]
+    assert posted[1][1]["input_file_id"] == "file-in"
+    assert provider.poll_batch(batch_id) == {"r0": "Hallo"}
+    try:
+        provider.poll_batch(batch_id)
+    except Exception as e:
+        assert "expired" in str(e)
+    else:
+        raise AssertionError("expected failure for expired batch")
+
+
+def test_batch_submit_and_poll_retry_rate_limits(monkeypatch):
+    monkeypatch.setattr("ai_providers.time.sleep", lambda *_a, **_k: None)
+    posts = iter([DummyResponse(status_code=429), DummyResponse(payload={"id": "msgbatch_1"})])
+    gets = iter([DummyResponse(status_code=503), DummyResponse(payload={"processing_status": "in_progress"})])
+    patch_ai_session(monkeypatch, post=lambda *_a, **_k: next(posts), get=lambda *_a, **_k: next(gets))
+    provider = AnthropicProvider("key", "claude")
+
+    assert provider.submit_batch([{"custom_id": "r0", "text": "Hello", "target_language": "French"}]) == "msgbatch_1"
+    assert provider.poll_batch("msgbatch_1") is None
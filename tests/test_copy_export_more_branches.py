@@ -1,4 +1,5 @@
 import builtins
+import threading
 import types
 
 from workflows import copy, export_localizations
@@ -47,3 +48,72 @@ def test_export_run_cancelled_when_no_app_selected(fake_cli, fake_ui, monkeypatc
     fake_ui.app_id = None
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     assert export_localizations.run(fake_cli) is True
+
+
+def test_export_joins_app_info_name_and_subtitle_by_locale():
+    asc = types.SimpleNamespace(
+        find_primary_app_info_id=lambda app_id: "info1",
+        get_app_info_localizations=lambda info_id: {"data": [
+            {"id": "ai-fr", "attributes": {"locale": "fr-FR", "name": "Mon App", "subtitle": ""}},
+            {"id": "ai-en", "attributes": {"locale": "en-US", "name": "My App", "subtitle": "Best"}},
+        ]},
+    )
+    by_locale = export_localizations.app_info_attrs_by_locale(asc, "app1")
+    merged = export_localizations.with_app_info(
+        [
+            {"id": "v-en", "attributes": {"locale": "en-US", "description": "D"}},
+            {"id": "v-fr", "attributes": {"locale": "fr-FR", "description": "Dfr"}},
+            {"id": "v-de", "attributes": {"locale": "de-DE", "description": "Dde"}},
+        ],
+        by_locale,
+    )
+    assert merged[0]["attributes"] == {"locale": "en-US", "description": "D", "name": "My App", "subtitle": "Best"}
+    assert merged[1]["attributes"] == {"locale": "fr-FR", "description": "Dfr", "name": "Mon App"}
+    assert merged[2]["attributes"] == {"locale": "de-DE", "description": "Dde"}
+
+    assert export_localizations.app_info_attrs_by_locale(types.SimpleNamespace(), "app1") == {}
+
+
+def test_export_app_info_join_passes_unmatched_locales_through():
+    version_locs = [
+        {"id": "v-en", "attributes": {"locale": "en-US"}},
+        {"id": "v-fr", "attributes": {"locale": "fr-FR"}},
+    ]
+    merged = export_localizations.with_app_info(
+        version_locs, {"en-US": {"name": "", "subtitle": ""}, "fr-FR": {"name": "Mon App"}}
+    )
+    assert merged[0] is version_locs[0]
+    assert merged[1] is not version_locs[1]
+    assert version_locs[1]["attributes"] == {"locale": "fr-FR"}
+
+
+def test_export_run_fetches_app_info_alongside_version_localizations(fake_cli, fake_ui, fake_asc, monkeypatch):
+    fake_ui.app_id = "app1"
+    monkeypatch.setattr(
+        export_localizations, "select_platform",
+        lambda *_a, **_k: {"IOS": {"id": "ver-ios", "attributes": {"versionString": "1.0"}}},
+    )
+    version_fetch_started = threading.Event()
+
+    def version_localizations(version_id):
+        version_fetch_started.set()
+        return {"data": [{"id": "v-en", "attributes": {"locale": "en-US", "description": "D"}}]}
+
+    def app_info_localizations(app_info_id):
+        # Only returns once the version localizations are being fetched too
+        assert version_fetch_started.wait(timeout=2)
+        return {"data": [{"id": "ai-en", "attributes": {"locale": "en-US", "name": "My App"}}]}
+
+    fake_asc.set_response("get_apps", {"data": []})
+    fake_asc.set_response("get_app_store_version_localizations", version_localizations)
+    fake_asc.set_response("find_primary_app_info_id", "info1")
+    fake_asc.set_response("get_app_info_localizations", app_info_localizations)
+    exported = {}
+    monkeypatch.setattr(
+        export_localizations, "export_existing_localizations",
+        lambda locs, **_k: exported.setdefault("locs", locs) and "existing_localizations/x.txt",
+    )
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert export_localizations.run(fake_cli) is True
+    assert exported["locs"][0]["attributes"]["name"] == "My App"
@@ -56,6 +56,23 @@ def test_pick_version_for_platform_tui_and_no_versions():
     assert copy.pick_version_for_platform(ui, asc_none, "app1", "IOS", "Pick") is None
 
 
+def test_pick_version_for_platform_requests_filtered_sparse_page():
+    seen = []
+
+    def fake_request(method, endpoint, params=None):
+        seen.append((method, endpoint, params))
+        return {"data": [{"id": "v1", "attributes": {"platform": "IOS", "versionString": "1.0"}}]}
+
+    ui = types.SimpleNamespace(available=lambda: True, select=lambda *_a, **_k: "picked")
+    asc = types.SimpleNamespace(_request=fake_request)
+    assert copy.pick_version_for_platform(ui, asc, "app1", "IOS", "Pick") == "picked"
+    assert seen == [(
+        "GET",
+        "apps/app1/appStoreVersions",
+        {"filter[platform]": "IOS", "fields[appStoreVersions]": copy.VERSION_FIELDS, "limit": copy.VERSION_PICK_LIMIT},
+    )]
+
+
 def test_copy_run_target_missing_and_copy_loop_error_branches(fake_cli, fake_ui, fake_asc, monkeypatch):
     fake_ui.app_id = "app1"
     monkeypatch.setattr(copy, "select_platforms", lambda *_a, **_k: {"IOS": {"id": "ver-target", "attributes": {"versionString": "2.0"}}})
@@ -87,32 +104,18 @@ def test_copy_run_target_missing_and_copy_loop_error_branches(fake_cli, fake_ui,
         },
     )
 
-    def fake_copy(_src, _dst, locale):
+    def fake_copy(_src, _dst, locale, **kwargs):
+        assert [l["attributes"]["locale"] for l in kwargs["source_localizations"]] == ["en-US", "fr-FR"]
+        assert kwargs["target_localizations"] is not None
         if locale == "fr-FR":
             raise RuntimeError("copy failed")
         return True
 
     fake_asc.set_response("copy_localization_from_previous_version", fake_copy)
-    monkeypatch.setattr(copy.time, "sleep", lambda *_a, **_k: None)
-
-    calls = {"n": 0}
-
-    def fake_progress(i, total, label):
-        calls["n"] += 1
-        if calls["n"] == 1:
-            raise RuntimeError("progress failed")
-        return f"{i}/{total} {label}"
-
-    monkeypatch.setattr(copy, "format_progress", fake_progress)
-
-    real_write = copy.sys.stdout.write
-
-    def flaky_write(s):
-        if isinstance(s, str) and s.startswith("\r"):
-            raise RuntimeError("no tty")
-        return real_write(s)
-
-    monkeypatch.setattr(copy.sys.stdout, "write", flaky_write)
-    monkeypatch.setattr(copy.sys.stdout, "flush", lambda *_a, **_k: None)
+    fake_asc.calls.clear()
 
     assert copy.run(fake_cli) is True
+    fetched = sorted(c[1][0] for c in fake_asc.calls if c[0] == "get_app_store_version_localizations")
+    assert fetched == ["dst", "src"]
+    copied = sorted(c[1][2] for c in fake_asc.calls if c[0] == "copy_localization_from_previous_version")
+    assert copied == ["en-US", "fr-FR"]
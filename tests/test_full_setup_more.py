@@ -54,7 +54,6 @@ def test_full_setup_empty_translation_warning_path(fake_cli, fake_ui, fake_asc,
     monkeypatch.setattr(full_setup, "detect_base_language", lambda _locs: "en-US")
     monkeypatch.setattr(full_setup, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
     monkeypatch.setattr(full_setup, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
-    monkeypatch.setattr(full_setup.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(
         full_setup,
         "parallel_map_locales",
@@ -81,3 +80,117 @@ def test_full_setup_all_supported_languages_already_localized(fake_cli, fake_ui,
         },
     )
     assert full_setup.run(fake_cli) is True
+
+
+def test_full_setup_saves_each_locale_from_its_worker(fake_cli, fake_ui, fake_asc, monkeypatch):
+    fake_ui.app_id = "app1"
+    monkeypatch.setattr(
+        full_setup,
+        "select_platform_versions",
+        lambda *_a, **_k: ({"IOS": {"id": "ver1"}, "MAC_OS": {"id": "ver2"}}, None, None),
+    )
+    monkeypatch.setattr(full_setup, "detect_base_language", lambda _locs: "en-US")
+    monkeypatch.setattr(full_setup, "choose_target_locales", lambda *_a, **_k: ["fr-FR", "de-DE"])
+    monkeypatch.setattr(full_setup, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
+    fake_asc.set_response("get_app_store_version_localizations", _base_locs(with_content=True))
+
+    def fake_create(**kwargs):
+        if kwargs["locale"] == "de-DE":
+            raise RuntimeError("save failed")
+        return {"data": {"id": f"loc-{kwargs['version_id']}"}}
+
+    fake_asc.set_response("create_app_store_version_localization", fake_create)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert full_setup.run(fake_cli) is True
+    created = sorted(
+        (kwargs["locale"], kwargs["version_id"])
+        for name, _args, kwargs in fake_asc.calls
+        if name == "create_app_store_version_localization"
+    )
+    # One locale failing to save does not stop the others
+    assert ("fr-FR", "ver1") in created and ("fr-FR", "ver2") in created
+    assert ("de-DE", "ver1") in created
+
+
+def test_full_setup_translates_all_fields_in_one_request_per_locale(fake_cli, fake_ui, fake_asc, monkeypatch):
+    import json
+
+    class JsonProvider:
+        model = "json-model"
+
+        def __init__(self):
+            self.calls = []
+
+        def get_name(self):
+            return "JSON"
+
+        def translate(self, text, target_language, **_kwargs):
+            self.calls.append(target_language)
+            source = json.loads(text)
+            return json.dumps({
+                key: [f"{target_language}-{term}" for term in value] if isinstance(value, list)
+                else f"{target_language}: {value}"
+                for key, value in source.items()
+            })
+
+    provider = JsonProvider()
+    fake_ui.app_id = "app1"
+    monkeypatch.setenv("TRANSLATER_NO_CACHE", "1")
+    monkeypatch.setattr(full_setup, "select_platform_versions", lambda *_a, **_k: ({"IOS": {"id": "ver1"}}, None, None))
+    monkeypatch.setattr(full_setup, "detect_base_language", lambda _locs: "en-US")
+    monkeypatch.setattr(full_setup, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
+    monkeypatch.setattr(full_setup, "pick_provider", lambda _cli: (provider, "json"))
+    fake_asc.set_response("get_app_store_version_localizations", _base_locs(with_content=True))
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert full_setup.run(fake_cli) is True
+    assert provider.calls == ["French"]
+    created = [kwargs for name, _args, kwargs in fake_asc.calls if name == "create_app_store_version_localization"]
+    assert created[0]["description"] == "French: Desc"
+    assert created[0]["keywords"] == "French-a,French-b"
+    assert created[0]["promotional_text"] == "French: Promo"
+    assert created[0]["whats_new"] == "French: Notes"
+
+
+def test_full_setup_updates_locales_known_from_the_initial_fetch(fake_cli, fake_ui, fake_asc, monkeypatch):
+    fake_ui.app_id = "app1"
+    monkeypatch.setattr(full_setup, "select_platform_versions", lambda *_a, **_k: ({"IOS": {"id": "ver1"}}, None, None))
+    monkeypatch.setattr(full_setup, "detect_base_language", lambda _locs: "en-US")
+    monkeypatch.setattr(full_setup, "choose_target_locales", lambda *_a, **_k: ["fr-FR", "de-DE"])
+    monkeypatch.setattr(full_setup, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
+    locs = _base_locs(with_content=True)
+    locs["data"].append({"id": "loc-fr", "attributes": {"locale": "fr-FR", "description": "Old"}})
+    fake_asc.set_response("get_app_store_version_localizations", locs)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert full_setup.run(fake_cli) is True
+    created = [kwargs["locale"] for name, _args, kwargs in fake_asc.calls if name == "create_app_store_version_localization"]
+    updated = [kwargs["localization_id"] for name, _args, kwargs in fake_asc.calls if name == "update_app_store_version_localization"]
+    assert created == ["de-DE"]
+    assert updated == ["loc-fr"]
+    # No refetch of the localization list to resolve conflicts
+    assert [name for name, _a, _k in fake_asc.calls].count("get_app_store_version_localizations") == 1
+
+
+def test_full_setup_rerun_with_unchanged_base_is_served_from_cache(fake_cli, fake_ui, fake_asc, monkeypatch, tmp_path):
+    monkeypatch.delenv("TRANSLATER_NO_CACHE", raising=False)
+    monkeypatch.setenv("TRANSLATER_CACHE_PATH", str(tmp_path / "cache.db"))
+    provider = fake_cli.ai_manager.get_provider("fake")
+    fake_ui.app_id = "app1"
+    monkeypatch.setattr(full_setup, "select_platform_versions", lambda *_a, **_k: ({"IOS": {"id": "ver1"}}, None, None))
+    monkeypatch.setattr(full_setup, "detect_base_language", lambda _locs: "en-US")
+    monkeypatch.setattr(full_setup, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
+    monkeypatch.setattr(full_setup, "pick_provider", lambda _cli: (provider, "fake"))
+    fake_asc.set_response("get_app_store_version_localizations", _base_locs(with_content=True))
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert full_setup.run(fake_cli) is True
+    first_calls = len(provider.calls)
+    assert first_calls > 0
+
+    # A re-run after e.g. a failed save translates nothing again
+    assert full_setup.run(fake_cli) is True
+    assert len(provider.calls) == first_calls
+    created = [kwargs for name, _args, kwargs in fake_asc.calls if name == "create_app_store_version_localization"]
+    assert created[0] == created[1]
@@ -3,7 +3,7 @@ import builtins
 from workflows import game_center_localizations as gcl
 
 
-def test_game_center_run_achievement_happy_path(fake_cli, fake_asc, fake_ui, monkeypatch):
+def _setup_single_achievement(fake_asc, fake_ui, monkeypatch):
     fake_ui.app_id = "app1"
 
     monkeypatch.setattr(gcl, "_choose_resource_types", lambda _ui: ["achievement"])
@@ -39,9 +39,30 @@ def test_game_center_run_achievement_happy_path(fake_cli, fake_asc, fake_ui, mon
         },
     )
     fake_asc.set_response("create_game_center_achievement_localization", {"data": {"id": "achloc-fr"}})
-
-    monkeypatch.setattr(gcl.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
+
+def test_game_center_run_achievement_happy_path(fake_cli, fake_asc, fake_ui, monkeypatch):
+    _setup_single_achievement(fake_asc, fake_ui, monkeypatch)
+
     assert gcl.run(fake_cli) is True
     assert any(call[0] == "create_game_center_achievement_localization" for call in fake_asc.calls)
+
+
+def test_game_center_run_translates_achievement_fields_concurrently(fake_cli, fake_asc, fake_ui, monkeypatch):
+    import threading
+
+    _setup_single_achievement(fake_asc, fake_ui, monkeypatch)
+    # Only passes if name, before and after descriptions are in flight together
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_translate(_provider, text, _language, _refinement, _seed, _label, max_length=None):
+        barrier.wait()
+        return f"fr:{text}"
+
+    monkeypatch.setattr(gcl, "_translate_required", fake_translate)
+    assert gcl.run(fake_cli) is True
+    created = [kwargs for name, _args, kwargs in fake_asc.calls if name == "create_game_center_achievement_localization"]
+    assert created[0]["name"] == "fr:Achievement"
+    assert created[0]["before_earned_description"] == "fr:Do it"
+    assert created[0]["after_earned_description"] == "fr:Done"
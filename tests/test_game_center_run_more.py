@@ -9,7 +9,6 @@ def _setup_common_context(monkeypatch, fake_ui, fake_asc, kind):
     monkeypatch.setattr(gcl, "_select_items", lambda _ui, items, _kind: items)
     monkeypatch.setattr(gcl, "_select_base_locale", lambda _ui, _locales, _recommended: "en-US")
     monkeypatch.setattr(gcl, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(gcl.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     fake_asc.set_response("get_game_center_detail", {"data": {"id": "detail1"}})
@@ -371,7 +370,6 @@ def test_run_base_locale_selection_cancel_after_disjoint_locale_sets(fake_cli, f
     monkeypatch.setattr(gcl, "_choose_resource_types", lambda _ui: ["achievement", "leaderboard"])
     monkeypatch.setattr(gcl, "_select_items", lambda _ui, items, _kind: items)
     monkeypatch.setattr(gcl, "_select_base_locale", lambda _ui, _locales, _recommended: None)
-    monkeypatch.setattr(gcl.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     fake_asc.set_response("get_game_center_detail", {"data": {"id": "detail1"}})
@@ -7,7 +7,6 @@ def _base_monkeypatches(monkeypatch):
     monkeypatch.setattr(gcl, "_select_items", lambda _ui, items, _kind: items)
     monkeypatch.setattr(gcl, "_select_base_locale", lambda _ui, _locales, _recommended: "en-US")
     monkeypatch.setattr(gcl, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(gcl.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
 
@@ -1,5 +1,6 @@
 import builtins
 
+from app_store_client import ASCConflictError
 from workflows import iap_translate as iap
 
 
@@ -19,7 +20,6 @@ def _setup_run(monkeypatch, fake_ui, fake_asc, iap_items=None):
     monkeypatch.setattr(iap, "_select_iaps", lambda *_a, **_k: iap_items or [_iap()])
     monkeypatch.setattr(iap, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(iap, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(iap.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
 
@@ -60,7 +60,7 @@ def test_iap_run_empty_name_progress_update_and_clear_line_exception(fake_cli, f
         "parallel_map_locales",
         lambda *_a, **_k: ({"fr-FR": {"name": "", "description": ""}}, {}),
     )
-    monkeypatch.setattr(iap, "format_progress", lambda c, t, m: f"{c}/{t}:{m}")
+    monkeypatch.setattr("utils.format_progress", lambda c, t, m: f"{c}/{t}:{m}")
 
     real_print = builtins.print
 
@@ -83,7 +83,7 @@ def test_iap_run_success_progress_update_exception_branch(fake_cli, fake_ui, fak
             raise RuntimeError("progress failed")
         return "progress"
 
-    monkeypatch.setattr(iap, "format_progress", format_progress)
+    monkeypatch.setattr("utils.format_progress", format_progress)
     assert iap.run(fake_cli) is True
 
 
@@ -107,10 +107,10 @@ def test_iap_run_create_409_recovery_success_and_refresh_failure(fake_cli, fake_
     fake_asc.set_response("get_in_app_purchase_localizations", get_locs)
     fake_asc.set_response(
         "create_in_app_purchase_localization",
-        lambda *_a, **_k: (_ for _ in ()).throw(Exception("409 conflict")),
+        lambda *_a, **_k: (_ for _ in ()).throw(ASCConflictError("409 conflict", status_code=409)),
     )
     fake_asc.set_response("update_in_app_purchase_localization", {"data": {"id": "updated"}})
-    monkeypatch.setattr(iap, "format_progress", lambda c, t, m: f"{c}/{t}:{m}")
+    monkeypatch.setattr("utils.format_progress", lambda c, t, m: f"{c}/{t}:{m}")
     assert iap.run(fake_cli) is True
 
 
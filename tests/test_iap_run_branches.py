@@ -1,5 +1,6 @@
 import builtins
 
+from app_store_client import ASCConflictError
 from workflows import iap_translate as iap
 
 
@@ -99,9 +100,8 @@ def test_iap_run_empty_name_retry_and_skip_branch(fake_cli, fake_ui, fake_asc, m
     monkeypatch.setattr(iap, "_select_iaps", lambda *_a, **_k: [_iap()])
     monkeypatch.setattr(iap, "pick_provider", lambda *_a, **_k: (provider, "fake"))
     monkeypatch.setattr(iap, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(iap, "format_progress", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("progress")))
+    monkeypatch.setattr("utils.format_progress", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("progress")))
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
-    monkeypatch.setattr(iap.time, "sleep", lambda *_a, **_k: None)
     fake_asc.set_response(
         "get_in_app_purchase_localizations",
         {"data": [_loc("loc-en", "en-US", name="Base", description="Desc")]},
@@ -115,7 +115,6 @@ def test_iap_run_updates_existing_and_recovers_from_409_create(fake_cli, fake_ui
     monkeypatch.setattr(iap, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(iap, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
-    monkeypatch.setattr(iap.time, "sleep", lambda *_a, **_k: None)
 
     def iap_locs(iap_id):
         if iap_id == "iap1":
@@ -126,7 +125,7 @@ def test_iap_run_updates_existing_and_recovers_from_409_create(fake_cli, fake_ui
     fake_asc.set_response("update_in_app_purchase_localization", {"data": {"id": "ok"}})
     fake_asc.set_response(
         "create_in_app_purchase_localization",
-        lambda *_a, **_k: (_ for _ in ()).throw(Exception("409 conflict")),
+        lambda *_a, **_k: (_ for _ in ()).throw(ASCConflictError("409 conflict", status_code=409)),
     )
 
     assert iap.run(fake_cli) is True
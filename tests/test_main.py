@@ -31,6 +31,22 @@ def test_show_main_menu_dispatches_translate(monkeypatch):
     assert main.TranslateRCLI.show_main_menu(cli) == "translated"
 
 
+def test_workflows_are_imported_on_first_use(monkeypatch):
+    import os
+    import subprocess
+    import sys
+
+    probe = "import sys, main; print(any(m.startswith('workflows.') for m in sys.modules))"
+    repo_root = os.path.dirname(os.path.abspath(main.__file__))
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True, cwd=repo_root)
+    assert out.stdout.strip() == "False"
+
+    import workflows.copy
+
+    monkeypatch.setattr(workflows.copy, "run", lambda cli: ("copied", cli))
+    assert main.copy_run("cli") == ("copied", "cli")
+
+
 def test_show_main_menu_dispatches_release(monkeypatch):
     cli = _make_cli("2")
     monkeypatch.setattr(main, "release_run", lambda _cli: "released")
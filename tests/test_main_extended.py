@@ -87,6 +87,36 @@ def test_setup_ai_providers_loads_all_providers(monkeypatch):
     assert set(cli.ai_manager.providers.keys()) == {"anthropic", "openai", "google"}
 
 
+def test_setup_ai_providers_skips_missing_keys_and_passes_openai_options(monkeypatch):
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.config = DummyConfig()
+    cli.config.get_ai_provider_key = lambda provider: "ok-openai" if provider == "openai" else None
+    created = []
+
+    class ProviderManager:
+        def __init__(self):
+            self.providers = {}
+
+        def add_provider(self, name, provider):
+            self.providers[name] = provider
+
+    def fake_openai(key, model, **kwargs):
+        created.append((key, model, kwargs))
+        return "openai-provider"
+
+    monkeypatch.setattr(main, "AIProviderManager", ProviderManager)
+    monkeypatch.setattr(main, "OpenAIProvider", fake_openai)
+    monkeypatch.setenv("TRANSLATER_OPENAI_SERVICE_TIER", "flex")
+    monkeypatch.setenv("TRANSLATER_OPENAI_TIMEOUT_SECONDS", "90")
+
+    main.TranslateRCLI.setup_ai_providers(cli)
+
+    assert list(cli.ai_manager.providers) == ["openai"]
+    assert created == [
+        ("ok-openai", "gpt-5.2", {"service_tier": "flex", "timeout_seconds": 90, "flex_timeout_seconds": None})
+    ]
+
+
 def test_configuration_mode_provider_branch_non_tui(monkeypatch):
     cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
     cli.ui = DummyUI(available=False)
@@ -115,6 +145,31 @@ def test_configuration_mode_refine_branch_non_tui(monkeypatch):
     assert cli.config.get_prompt_refinement() == "keep brands"
 
 
+def test_configuration_mode_clears_translation_cache(monkeypatch, tmp_path, capsys):
+    import translation_cache
+
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.ui = DummyUI(available=False)
+    cli.config = DummyConfig()
+    cli.asc_client = object()
+    cli.ai_manager = types.SimpleNamespace(list_providers=lambda: [])
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "6")
+
+    # Disabled cache (test default): nothing to clear
+    assert main.TranslateRCLI.configuration_mode(cli) is True
+    assert "disabled" in capsys.readouterr().out
+
+    monkeypatch.delenv("TRANSLATER_NO_CACHE")
+    monkeypatch.setenv("TRANSLATER_CACHE_PATH", str(tmp_path / "cache.db"))
+    cache = translation_cache.get_translation_cache()
+    cache.set("a", "x")
+    cache.set("b", "y")
+
+    assert main.TranslateRCLI.configuration_mode(cli) is True
+    assert "2 entries removed" in capsys.readouterr().out
+    assert cache.get("a") is None
+
+
 def test_run_exits_when_setup_fails(monkeypatch):
     cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
     cli.show_logo = lambda: None
@@ -158,12 +213,139 @@ def test_translate_app_info_updates_and_creates_localizations(monkeypatch):
 
     asc = ASC()
     cli.asc_client = asc
-    monkeypatch.setattr(main.time, "sleep", lambda *_a, **_k: None)
 
     main.TranslateRCLI._translate_app_info(cli, "app1", ["fr-FR", "de-DE"], Provider())
 
-    assert asc.updated and asc.updated[0][0] == "loc-fr"
-    assert asc.created and asc.created[0][1] == "de-DE"
+    assert [u[0] for u in asc.updated] == ["loc-fr"]
+    assert [c[1] for c in asc.created] == ["de-DE"]
+    assert asc.created[0][2] == {"name": "German-Base App", "subtitle": "German-Base Subtitle"}
+
+
+def test_translate_app_info_updates_after_create_conflict(monkeypatch):
+    from app_store_client import ASCConflictError
+
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.session_seed = 7
+    localizations = [{"id": "loc-en", "attributes": {"locale": "en-US"}}]
+
+    class ASC:
+        def __init__(self):
+            self.updated = []
+
+        def find_primary_app_info_id(self, _app_id):
+            return "app-info-1"
+
+        def get_app_info_localizations(self, _app_info_id):
+            return {"data": list(localizations)}
+
+        def get_app_info_localization(self, _loc_id):
+            return {"data": {"attributes": {"name": "Base App", "subtitle": ""}}}
+
+        def update_app_info_localization(self, loc_id, **kwargs):
+            self.updated.append((loc_id, kwargs))
+
+        def create_app_info_localization(self, app_info_id, locale, **kwargs):
+            # Someone else created the locale after the initial fetch
+            localizations.append({"id": "loc-fr", "attributes": {"locale": locale}})
+            raise ASCConflictError("409 Conflict", status_code=409)
+
+    class Provider:
+        def translate(self, text, target_language, max_length=None, seed=None, refinement=None):
+            return f"{target_language}-{text}-{refinement}"[:max_length]
+
+    asc = ASC()
+    cli.asc_client = asc
+
+    main.TranslateRCLI._translate_app_info(cli, "app1", ["fr-FR"], Provider(), refinement="tone")
+
+    assert [u[0] for u in asc.updated] == ["loc-fr"]
+    assert asc.updated[0][1]["name"].startswith("French-Base App-tone")
+
+
+def test_translate_app_info_translates_name_and_subtitle_concurrently(monkeypatch):
+    import threading
+
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.session_seed = 7
+    updates = []
+    barrier = threading.Barrier(2, timeout=5)
+
+    cli.asc_client = types.SimpleNamespace(
+        find_primary_app_info_id=lambda _app_id: "app-info-1",
+        get_app_info_localizations=lambda _id: {
+            "data": [
+                {"id": "loc-en", "attributes": {"locale": "en-US"}},
+                {"id": "loc-fr", "attributes": {"locale": "fr-FR"}},
+            ]
+        },
+        get_app_info_localization=lambda _id: {"data": {"attributes": {"name": "Base", "subtitle": "Sub"}}},
+        update_app_info_localization=lambda loc_id, **kw: updates.append((loc_id, kw)),
+    )
+
+    class Provider:
+        def translate(self, text, target_language, **_kwargs):
+            # Both fields must be in flight at once for the barrier to release
+            barrier.wait()
+            return f"{target_language}-{text}"
+
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "2")
+    main.TranslateRCLI._translate_app_info(cli, "app1", ["fr-FR"], Provider())
+
+    assert updates == [("loc-fr", {"name": "French-Base", "subtitle": "French-Sub"})]
+
+
+def test_translate_app_info_shares_identical_name_and_subtitle(monkeypatch):
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.session_seed = 7
+    updates = []
+    sent = []
+
+    cli.asc_client = types.SimpleNamespace(
+        find_primary_app_info_id=lambda _app_id: "app-info-1",
+        get_app_info_localizations=lambda _id: {
+            "data": [
+                {"id": "loc-en", "attributes": {"locale": "en-US"}},
+                {"id": "loc-fr", "attributes": {"locale": "fr-FR"}},
+            ]
+        },
+        get_app_info_localization=lambda _id: {"data": {"attributes": {"name": "Same", "subtitle": "Same"}}},
+        update_app_info_localization=lambda loc_id, **kw: updates.append((loc_id, kw)),
+    )
+
+    class Provider:
+        def translate(self, text, target_language, **_kwargs):
+            sent.append(text)
+            return f"{target_language}-{text}"
+
+    main.TranslateRCLI._translate_app_info(cli, "app1", ["fr-FR"], Provider())
+
+    assert sent == ["Same"]
+    assert updates == [("loc-fr", {"name": "French-Same", "subtitle": "French-Same"})]
+
+
+def test_translate_app_info_base_locale_fast_path(monkeypatch):
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    cli.session_seed = 7
+    updates = []
+
+    cli.asc_client = types.SimpleNamespace(
+        find_primary_app_info_id=lambda _app_id: "app-info-1",
+        get_app_info_localizations=lambda _id: {
+            "data": [{"id": "loc-en", "attributes": {"locale": "en-US"}}]
+        },
+        get_app_info_localization=lambda _id: {"data": {"attributes": {"name": "Base", "subtitle": "Sub"}}},
+        update_app_info_localization=lambda loc_id, **kw: updates.append(loc_id),
+    )
+
+    class Provider:
+        def translate(self, *_a, **_k):
+            raise AssertionError("base locale must not be translated")
+
+    main.TranslateRCLI._translate_app_info(cli, "app1", ["en-US"], Provider())
+
+    assert updates == []
+    assert main.TranslateRCLI._same_language("en-US", "en-us")
+    assert not main.TranslateRCLI._same_language("en-US", "en-GB")
 
 
 def test_translate_app_info_skips_when_no_app_info_id():
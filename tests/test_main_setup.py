@@ -84,3 +84,30 @@ def test_run_handles_runtime_error_then_continues(monkeypatch):
     cli.show_main_menu = menu
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     assert main.TranslateRCLI.run(cli) is None
+
+
+def test_setup_app_store_client_connection_check_primes_app_picker(monkeypatch, tmp_path):
+    cli = main.TranslateRCLI.__new__(main.TranslateRCLI)
+    key_file = tmp_path / "AuthKey_TEST.p8"
+    key_file.write_text("private-key", encoding="utf-8")
+    cli.config = types.SimpleNamespace(
+        get_app_store_config=lambda: {"key_id": "KID", "issuer_id": "ISS", "private_key_path": str(key_file)}
+    )
+    cli.setup_wizard = lambda: False
+    cli.ui = main.UI()
+    calls = []
+
+    class DummyASC:
+        def __init__(self, key_id, issuer_id, private_key):
+            pass
+
+        def get_apps(self, limit=200):
+            calls.append(limit)
+            return {"data": [{"id": "app1", "attributes": {"name": "My App"}}]}
+
+    monkeypatch.setattr(main, "AppStoreConnectClient", DummyASC)
+    monkeypatch.setattr(main, "resolve_private_key_path", lambda key_id, configured_path=None: Path(configured_path))
+
+    assert main.TranslateRCLI.setup_app_store_client(cli) is True
+    assert cli.ui.app_name(cli.asc_client, "app1") == "My App"
+    assert calls == [200]
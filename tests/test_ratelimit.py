@@ -0,0 +1,172 @@
+import threading
+import time
+
+import ratelimit
+from ai_providers import AnthropicProvider
+
+from conftest import DummyResponse, patch_ai_session
+
+
+def test_limiter_for_defaults_env_overrides_and_disable(monkeypatch):
+    limiter = ratelimit.limiter_for("anthropic")
+    assert (limiter.rpm, limiter.tpm, limiter.max_concurrency) == (50, 80_000, 5)
+
+    monkeypatch.setenv("TRANSLATER_OPENAI_RPM", "7")
+    monkeypatch.setenv("TRANSLATER_OPENAI_MAX_CONCURRENCY", "bogus")
+    limiter = ratelimit.limiter_for("openai")
+    assert limiter.rpm == 7
+    assert limiter.max_concurrency == 10
+
+    assert ratelimit.limiter_for("unknown") is None
+    monkeypatch.setenv("TRANSLATER_RATE_LIMIT", "0")
+    assert ratelimit.limiter_for("anthropic") is None
+
+
+def test_limiter_paces_requests_per_window():
+    limiter = ratelimit.ProviderLimiter(rpm=1, tpm=1000, max_concurrency=2, window_seconds=0.1)
+
+    with limiter.slot(10):
+        pass
+    start = time.monotonic()
+    with limiter.slot(10):
+        pass
+
+    assert time.monotonic() - start >= 0.05
+
+
+def test_limiter_token_budget_uses_reported_usage():
+    limiter = ratelimit.ProviderLimiter(rpm=100, tpm=100, max_concurrency=2, window_seconds=0.1)
+
+    ticket = limiter.acquire(10)
+    limiter.release()
+    limiter.update(ticket, used_tokens=95)
+    start = time.monotonic()
+    with limiter.slot(10):
+        pass
+
+    assert time.monotonic() - start >= 0.05
+
+
+def test_limiter_aimd_concurrency():
+    limiter = ratelimit.ProviderLimiter(rpm=100, tpm=1000, max_concurrency=4)
+
+    limiter.update(None, status_code=429)
+    assert limiter.concurrency == 2.0
+    limiter.update(None, status_code=429)
+    limiter.update(None, status_code=429)
+    assert limiter.concurrency == 1.0
+    limiter.update(None, status_code=200)
+    assert limiter.concurrency == 2.0
+    for _ in range(20):
+        limiter.update(None, status_code=200)
+    assert limiter.concurrency == 4.0
+
+
+def test_limiter_blocks_beyond_concurrency():
+    limiter = ratelimit.ProviderLimiter(rpm=100, tpm=1000, max_concurrency=1)
+    order = []
+
+    limiter.acquire()
+
+    def worker():
+        with limiter.slot():
+            order.append("worker")
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    time.sleep(0.05)
+    order.append("main")
+    limiter.release()
+    thread.join(timeout=2)
+
+    assert order == ["main", "worker"]
+
+
+def test_provider_post_reports_usage_to_limiter(monkeypatch):
+    patch_ai_session(
+        monkeypatch,
+        post=lambda *_a, **_k: DummyResponse(payload={"content": [{"text": "Bonjour"}], "usage": {"input_tokens": 30, "output_tokens": 12}}),
+    )
+    provider = AnthropicProvider("key", "claude")
+
+    assert provider.translate("Hello", "French") == "Bonjour"
+    assert provider.limiter.in_flight == 0
+    assert [ticket[1] for ticket in provider.limiter._tokens] == [42]
+
+
+def test_token_bucket_bursts_then_waits_for_refill(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(ratelimit.time, "sleep", fake_sleep)
+
+    bucket = ratelimit.TokenBucket(capacity=2, refill_rate=0.5)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    # Empty: the third request waits exactly one refill interval
+    assert bucket.acquire() == 2.0
+    assert sleeps == [2.0]
+
+
+def test_asc_bucket_env_overrides_and_disable(monkeypatch):
+    bucket = ratelimit.asc_bucket()
+    assert bucket.capacity == ratelimit.ASC_BURST_DEFAULT
+    assert bucket.refill_rate == ratelimit.ASC_RPM_DEFAULT / 60.0
+
+    monkeypatch.setenv("TRANSLATER_ASC_RPM", "30")
+    monkeypatch.setenv("TRANSLATER_ASC_BURST", "5")
+    bucket = ratelimit.asc_bucket()
+    assert (bucket.capacity, bucket.refill_rate) == (5, 0.5)
+
+    monkeypatch.setenv("TRANSLATER_ASC_RPM", "0")
+    assert ratelimit.asc_bucket() is None
+    monkeypatch.delenv("TRANSLATER_ASC_RPM")
+    monkeypatch.setenv("TRANSLATER_RATE_LIMIT", "0")
+    assert ratelimit.asc_bucket() is None
+
+
+def test_asc_requests_take_a_bucket_token(monkeypatch):
+    from app_store_client import AppStoreConnectClient
+
+    acquired = []
+    monkeypatch.setattr("app_store_client.jwt.encode", lambda *_a, **_k: "t")
+    monkeypatch.setattr(
+        "app_store_client.requests.Session.request", lambda *_a, **_k: DummyResponse(payload={"data": []})
+    )
+    client = AppStoreConnectClient("kid", "issuer", "pk")
+    monkeypatch.setattr(client.rate_limiter, "acquire", lambda: acquired.append(1))
+
+    client._request("GET", "apps")
+    client._request("GET", "apps")
+    assert acquired == [1, 1]
+
+
+def test_token_bucket_adapts_rate_to_throttling():
+    bucket = ratelimit.TokenBucket(capacity=10, refill_rate=1.0)
+    bucket.throttled()
+    assert bucket.tokens == 0.0
+    assert bucket.refill_rate == 0.5
+    for _ in range(3):
+        bucket.throttled()
+    assert bucket.refill_rate == 0.1  # floored at min_rate_fraction of nominal
+    for _ in range(100):
+        bucket.succeeded()
+    assert bucket.refill_rate == 1.0
+
+
+def test_retry_after_seconds_parses_seconds_ms_and_dates():
+    from email.utils import format_datetime
+    from datetime import datetime, timedelta, timezone
+
+    assert ratelimit.retry_after_seconds(DummyResponse(headers={"Retry-After": "3"})) == 3.0
+    assert ratelimit.retry_after_seconds(DummyResponse(headers={"retry-after-ms": "250"})) == 0.25
+    assert ratelimit.retry_after_seconds(DummyResponse(headers={"Retry-After": "99999"})) == ratelimit.RETRY_AFTER_MAX_SECONDS
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= ratelimit.retry_after_seconds(DummyResponse(headers={"Retry-After": future})) <= 30
+    assert ratelimit.retry_after_seconds(DummyResponse(headers={"Retry-After": "soon"})) is None
+    assert ratelimit.retry_after_seconds(DummyResponse()) is None
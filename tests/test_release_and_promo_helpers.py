@@ -2,7 +2,11 @@ import builtins
 
 from release_presets import ReleaseNotePreset
 from workflows import promo, release
-from workflows.promo_helpers import apply_promotional_updates, verify_promotional_updates
+from workflows.promo_helpers import (
+    apply_promotional_updates,
+    generate_promotional_translations,
+    verify_promotional_updates,
+)
 
 
 class DummyUI:
@@ -225,3 +229,13 @@ def test_promotional_apply_and_verify_skip_failed_translations():
     assert failures == 0
     assert {update["localization_id"] for update in asc.updates} == {"loc-en", "loc-fr"}
     assert "loc-de" not in asc.reads
+
+
+def test_generate_promotional_translations_does_not_sleep_between_locales(fake_provider, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("utils.time.sleep", lambda seconds: sleeps.append(seconds))
+
+    out = generate_promotional_translations(fake_provider, ["fr-FR", "de-DE"], "Big sale", 170, seed=1, refine_phrase="")
+
+    assert set(out) == {"fr-FR", "de-DE"}
+    assert sleeps == []
@@ -6,6 +6,8 @@ from utils import APP_STORE_LOCALES
 
 def test_slugify_and_generate_preset_id():
     assert release_presets.generate_preset_id("  My Fancy Preset  ") == "my-fancy-preset"
+    assert release_presets.generate_preset_id("Rock&Roll -- _Café_ ") == "rockroll-café"
+    assert release_presets.generate_preset_id("!!!") == "preset"
 
 
 def test_normalize_translations_fills_missing_locales():
@@ -111,3 +113,100 @@ def test_builtin_preset_files_include_all_supported_locales():
         missing = [locale for locale in APP_STORE_LOCALES if locale not in translations]
 
         assert missing == [], f"{path.name} is missing locales: {missing}"
+
+
+def test_presets_are_reparsed_only_when_the_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(release_presets, "BUILTIN_PRESETS_DIR", tmp_path / "builtin")
+    monkeypatch.setattr(release_presets, "USER_PRESETS_DIR", tmp_path / "presets")
+    _, path = release_presets.save_user_preset(name="Launch", translations={"en-US": "Hello"}, preset_id="launch")
+
+    loads = []
+    original = release_presets._load_preset_from_path
+    monkeypatch.setattr(
+        release_presets, "_load_preset_from_path",
+        lambda p, built_in: loads.append(p) or original(p, built_in=built_in),
+    )
+
+    assert release_presets.get_preset("launch").name == "Launch"
+    assert release_presets.preset_exists("launch")
+    assert [p.preset_id for p in release_presets.list_presets()] == ["launch"]
+    assert loads == []
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["name"] = "Launch Day"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert release_presets.get_preset("launch").name == "Launch Day"
+    assert release_presets.get_preset("launch").name == "Launch Day"
+    assert loads == [path]
+
+
+def test_preset_id_index_is_reused_until_presets_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(release_presets, "BUILTIN_PRESETS_DIR", tmp_path / "builtin")
+    monkeypatch.setattr(release_presets, "USER_PRESETS_DIR", tmp_path / "presets")
+    release_presets.save_user_preset(name="Launch", translations={"en-US": "Hello"}, preset_id="launch")
+
+    index = release_presets._presets_by_id()
+    assert release_presets._presets_by_id() is index
+    assert release_presets.get_preset("missing") is None
+
+    release_presets.save_user_preset(name="Fixes", translations={"en-US": "Bug fixes"}, preset_id="fixes")
+    assert release_presets._presets_by_id() is not index
+    assert release_presets.preset_exists("fixes")
+    assert release_presets.delete_user_preset("fixes") is True
+    assert not release_presets.preset_exists("fixes")
+
+
+def test_normalize_translations_fallback_order():
+    normalized = release_presets._normalize_translations({"fr-FR": "Bonjour", "en-GB": "Hello", "de-DE": "  "})
+    assert normalized["fr-FR"] == "Bonjour"
+    assert normalized["de-DE"] == "Hello"
+    assert set(normalized) == set(APP_STORE_LOCALES)
+
+    only_french = release_presets._normalize_translations({"fr-FR": "Bonjour", "ja": None})
+    assert only_french["ja"] == "Bonjour"
+    assert release_presets._normalize_translations({})["en-US"] == ""
+
+
+def test_saved_preset_is_served_from_cache_without_reparse(tmp_path, monkeypatch):
+    monkeypatch.setattr(release_presets, "BUILTIN_PRESETS_DIR", tmp_path / "builtin")
+    monkeypatch.setattr(release_presets, "USER_PRESETS_DIR", tmp_path / "presets")
+    monkeypatch.setattr(
+        release_presets, "_load_preset_from_path",
+        lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("re-parsed")),
+    )
+
+    preset, path = release_presets.save_user_preset(name="Launch", translations={"en-US": "Hello"}, preset_id="launch")
+
+    assert release_presets.get_preset("launch") is preset
+    assert not list(path.parent.glob("*.tmp"))
+    assert json.loads(path.read_text(encoding="utf-8"))["translations"]["fr-FR"] == "Hello"
+
+
+def test_load_preset_from_path_reads_utf8_bytes_and_skips_bad_files(tmp_path):
+    good = tmp_path / "good.json"
+    good.write_bytes(json.dumps({"name": "Grüße", "translations": {"de-DE": "Hallo"}}, ensure_ascii=False).encode("utf-8"))
+    preset = release_presets._load_preset_from_path(good, built_in=True)
+    assert preset.preset_id == "good"
+    assert preset.name == "Grüße"
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("[1, 2]", encoding="utf-8")
+    assert release_presets._load_preset_from_path(bad, built_in=True) is None
+    bad.write_text("{not json", encoding="utf-8")
+    assert release_presets._load_preset_from_path(bad, built_in=True) is None
+
+
+def test_list_presets_sorts_only_when_presets_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(release_presets, "BUILTIN_PRESETS_DIR", tmp_path / "builtin")
+    monkeypatch.setattr(release_presets, "USER_PRESETS_DIR", tmp_path / "presets")
+    release_presets.save_user_preset(name="Zeta", translations={"en-US": "Z"}, preset_id="zeta")
+    release_presets.save_user_preset(name="alpha", translations={"en-US": "A"}, preset_id="alpha")
+
+    first = release_presets.list_presets()
+    assert [p.preset_id for p in first] == ["alpha", "zeta"]
+    first.clear()
+    assert release_presets._PRESET_SORTED is not None
+    assert [p.preset_id for p in release_presets.list_presets()] == ["alpha", "zeta"]
+
+    release_presets.save_user_preset(name="Beta", translations={"en-US": "B"}, preset_id="beta")
+    assert [p.preset_id for p in release_presets.list_presets()] == ["alpha", "beta", "zeta"]
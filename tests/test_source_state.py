@@ -0,0 +1,47 @@
+from source_state import load_source_state, source_hash, translation_fingerprint, unchanged_fields
+
+
+def test_source_state_round_trip_and_base_locale_invalidation(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRANSLATER_STATE_DIR", str(tmp_path))
+
+    state = load_source_state("app1", "ver/1", "en-US")
+    assert not state.is_unchanged("fr-FR", "description", "Hello")
+    state.record("fr-FR", {"description": "Hello", "keywords": "a,b"})
+    state.save()
+    assert (tmp_path / "app1_ver_1.json").exists()
+
+    reloaded = load_source_state("app1", "ver/1", "en-US")
+    assert reloaded.locales["fr-FR"]["description"] == source_hash("Hello")
+    assert unchanged_fields([reloaded], "fr-FR", {"description": "Hello", "keywords": "a,b,c"}) == {"description"}
+
+    # A different base language makes every stored hash stale
+    other_base = load_source_state("app1", "ver/1", "de-DE")
+    assert other_base.locales == {}
+
+
+def test_unchanged_fields_requires_every_state(monkeypatch, tmp_path):
+    monkeypatch.setenv("TRANSLATER_STATE_DIR", str(tmp_path))
+    ios = load_source_state("app1", "ver-ios", "en-US")
+    mac = load_source_state("app1", "ver-mac", "en-US")
+    ios.record("fr-FR", {"description": "Hello"})
+
+    assert unchanged_fields([ios], "fr-FR", {"description": "Hello"}) == {"description"}
+    assert unchanged_fields([ios, mac], "fr-FR", {"description": "Hello"}) == set()
+    assert unchanged_fields([ios, None], "fr-FR", {"description": "Hello"}) == set()
+
+
+def test_source_state_disabled_by_env(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_NO_SOURCE_STATE", "1")
+    assert load_source_state("app1", "ver-ios", "en-US") is None
+
+
+def test_source_state_fingerprint_invalidates_other_providers(monkeypatch, tmp_path, fake_provider):
+    monkeypatch.setenv("TRANSLATER_STATE_DIR", str(tmp_path))
+    fingerprint = translation_fingerprint(fake_provider, "tone")
+    state = load_source_state("app1", "ver-ios", "en-US", fingerprint)
+    state.record("fr-FR", {"description": "Hello"})
+    state.save()
+
+    assert load_source_state("app1", "ver-ios", "en-US", fingerprint).is_unchanged("fr-FR", "description", "Hello")
+    other = translation_fingerprint(fake_provider, "other tone")
+    assert not load_source_state("app1", "ver-ios", "en-US", other).is_unchanged("fr-FR", "description", "Hello")
@@ -2,6 +2,8 @@ import builtins
 
 from workflows import subscription_translate as st
 
+from conftest import FakeProvider
+
 
 class _NonTUI:
     def available(self):
@@ -91,3 +93,22 @@ def test_require_saved_resource_allows_partial_update_without_name():
         )
         == "loc1"
     )
+
+
+def test_translate_locale_fields_runs_fields_concurrently(monkeypatch):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierProvider(FakeProvider):
+        def translate(self, text, target_language, **kwargs):
+            # Both fields must be in flight at once for the barrier to release
+            barrier.wait()
+            return super().translate(text, target_language, **kwargs)
+
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "2")
+    out = st._translate_locale_fields(
+        BarrierProvider(), "Pro", "Unlock all", "French", 30, 45, None, "", group_scope=False,
+    )
+    assert list(out) == ["name", "description"]
+    assert out["name"].startswith("translated") and out["description"].startswith("translated")
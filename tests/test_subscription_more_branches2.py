@@ -85,8 +85,7 @@ def test_subscription_run_executes_task_and_save_for_sub_and_group(fake_cli, fak
     monkeypatch.setattr(st, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
     monkeypatch.setattr(st, "get_app_locales", lambda *_a, **_k: [])
     monkeypatch.setattr(st, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
-    monkeypatch.setattr(st, "format_progress", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("progress fail")))
+    monkeypatch.setattr("utils.format_progress", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("progress fail")))
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     def fake_parallel(locales, task, **_kwargs):
@@ -122,7 +121,6 @@ def test_subscription_run_refresh_locale_ids_fallback_on_exception(fake_cli, fak
     monkeypatch.setattr(st, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(st, "get_app_locales", lambda *_a, **_k: [])
     monkeypatch.setattr(st, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(st, "parallel_map_locales", lambda *_a, **_k: ({"fr-FR": {"name": "Nom", "description": "Desc FR"}}, {}))
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
@@ -146,7 +144,6 @@ def test_subscription_run_reuses_target_language_confirmation_for_matching_subsc
     monkeypatch.setattr(st, "_pick_subscriptions", lambda *_a, **_k: [_sub("s1"), _sub("s2", "Yearly", "yearly")])
     monkeypatch.setattr(st, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(st, "get_app_locales", lambda *_a, **_k: [])
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     prompts = {"scope": 0, "targets": 0}
@@ -178,7 +175,6 @@ def test_subscription_run_reasks_for_target_languages_when_subscriptions_materia
     monkeypatch.setattr(st, "_pick_subscriptions", lambda *_a, **_k: [_sub("s1"), _sub("s2", "Yearly", "yearly")])
     monkeypatch.setattr(st, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(st, "get_app_locales", lambda *_a, **_k: [])
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     prompts = {"scope": 0, "targets": 0}
@@ -217,7 +213,6 @@ def test_subscription_run_reuses_target_language_confirmation_for_matching_group
     monkeypatch.setattr(st, "_pick_groups", lambda *_a, **_k: [_group("g1", "Main"), _group("g2", "Pro")])
     monkeypatch.setattr(st, "pick_provider", lambda cli: (cli.ai_manager.get_provider("fake"), "fake"))
     monkeypatch.setattr(st, "get_app_locales", lambda *_a, **_k: [])
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     prompts = {"scope": 0, "targets": 0}
@@ -163,7 +163,6 @@ def test_subscription_run_retranslates_after_asc_rejection(
     monkeypatch.setattr(st, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
     provider = fake_cli.ai_manager.get_provider("fake")
     monkeypatch.setattr(st, "pick_provider", lambda _cli: (provider, "fake"))
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(
         st,
         "parallel_map_locales",
@@ -205,7 +204,6 @@ def test_subscription_run_does_not_count_failed_retranslation_as_saved(
     monkeypatch.setattr(
         st, "pick_provider", lambda _cli: (fake_cli.ai_manager.get_provider("fake"), "fake")
     )
-    monkeypatch.setattr(st.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(
         st,
         "parallel_map_locales",
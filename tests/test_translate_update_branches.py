@@ -74,10 +74,33 @@ def test_translate_run_include_app_info_path(fake_cli, fake_ui, fake_asc, monkey
     monkeypatch.setattr(translate, "select_platform_versions", lambda *_a, **_k: (_version(), {}, {}))
     fake_asc.set_response("get_app_store_version_localizations", {"data": [_loc("loc-en", "en-US")]})
     monkeypatch.setattr(translate, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
-    monkeypatch.setattr(translate.time, "sleep", lambda *_a, **_k: None)
     assert translate.run(fake_cli) is True
 
 
+def test_translate_run_app_info_runs_after_version_writes(fake_cli, fake_ui, fake_asc, monkeypatch):
+    fake_ui._tui = False
+    fake_ui.app_id = "app1"
+    monkeypatch.setenv("TRANSLATER_NO_SOURCE_STATE", "1")
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "2" if "Select" in (_a[0] if _a else "") else "")
+    monkeypatch.setattr(translate, "select_platform_versions", lambda *_a, **_k: (_version(), {}, {}))
+    fake_asc.set_response("get_app_store_version_localizations", {"data": [_loc("loc-en", "en-US")]})
+    monkeypatch.setattr(translate, "choose_target_locales", lambda *_a, **_k: ["fr-FR"])
+
+    order = []
+
+    def fake_translate_app_info(app_id, target_locales, provider, refinement=""):
+        order.append(("app_info", app_id, target_locales, refinement))
+
+    def fake_create(**kwargs):
+        order.append(("create", kwargs["locale"]))
+        return {"data": {"id": "loc-fr"}}
+
+    fake_cli._translate_app_info = fake_translate_app_info
+    fake_asc.set_response("create_app_store_version_localization", fake_create)
+    assert translate.run(fake_cli) is True
+    assert order == [("create", "fr-FR"), ("app_info", "app1", ["fr-FR"], "keep tone concise")]
+
+
 def test_update_run_early_exit_branches(fake_cli, fake_ui, fake_asc, monkeypatch):
     fake_ui.app_id = None
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
@@ -0,0 +1,77 @@
+import translation_cache
+from translation_validation import translate_fields_with_validation, translate_with_validation
+
+from conftest import FakeProvider
+
+
+def _enable_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv("TRANSLATER_NO_CACHE", raising=False)
+    monkeypatch.setenv("TRANSLATER_CACHE_PATH", str(tmp_path / "cache.db"))
+
+
+def test_cache_roundtrip_ttl_and_clear(tmp_path, monkeypatch):
+    cache = translation_cache.TranslationCache(tmp_path / "nested" / "cache.db", ttl_seconds=60)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert cache.get("missing") is None
+
+    monkeypatch.setattr(translation_cache.time, "time", lambda: 10**12)
+    assert cache.get("k") is None
+
+    cache.set("k2", "v2")
+    cache.clear()
+    assert cache.get("k2") is None
+    cache.close()
+
+
+def test_cache_failures_are_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    cache = translation_cache.TranslationCache(blocker / "cache.db")
+    cache.set("k", "v")
+    cache.clear()
+    assert cache.get("k") is None
+
+
+def test_get_translation_cache_honours_env(tmp_path, monkeypatch):
+    assert translation_cache.get_translation_cache() is None
+    _enable_cache(monkeypatch, tmp_path)
+    monkeypatch.setenv("TRANSLATER_CACHE_TTL_DAYS", "2")
+    cache = translation_cache.get_translation_cache()
+    assert cache.path == tmp_path / "cache.db"
+    assert cache.ttl_seconds == 2 * 86400
+    assert translation_cache.get_translation_cache() is cache
+
+
+def test_translation_key_distinguishes_provider_model_and_options():
+    base = translation_cache.translation_key(FakeProvider(), "French", "Hello", max_length=10)
+    assert base == translation_cache.translation_key(FakeProvider(), "French", "Hello", max_length=10)
+    assert base != translation_cache.translation_key(FakeProvider(model="other"), "French", "Hello", max_length=10)
+    assert base != translation_cache.translation_key(FakeProvider(), "German", "Hello", max_length=10)
+    assert base != translation_cache.translation_key(FakeProvider(), "French", "Hello", max_length=11)
+
+
+def test_translate_with_validation_reuses_cached_result(tmp_path, monkeypatch):
+    _enable_cache(monkeypatch, tmp_path)
+    provider = FakeProvider()
+
+    first = translate_with_validation(provider, "Hello", "French", max_length=None, seed=1)
+    second = translate_with_validation(provider, "Hello", "French", max_length=None, seed=99)
+    assert first == second
+    assert len(provider.calls) == 1
+
+    translate_with_validation(provider, "Hello", "French", max_length=None, seed=1, submission_retry=True)
+    assert len(provider.calls) == 2
+
+
+def test_batched_fields_skip_cached_values(tmp_path, monkeypatch):
+    _enable_cache(monkeypatch, tmp_path)
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    provider = FakeProvider()
+    fields = {"a": {"text": "One", "max_length": None}, "b": {"text": "Two", "max_length": None}}
+    cached_a = translate_with_validation(provider, "One", "French", max_length=None, seed=None)
+
+    result = translate_fields_with_validation(provider, fields, "French", seed=None)
+
+    assert result["a"] == cached_a
+    assert [call["text"] for call in provider.calls] == ["One", "Two"]
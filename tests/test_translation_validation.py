@@ -4,6 +4,8 @@ import pytest
 
 from translation_validation import (
     strip_emoji,
+    translate_fields_with_validation,
+    translate_keywords_with_validation,
     translate_with_validation,
     validate_translation,
 )
@@ -127,3 +129,178 @@ def test_shared_translation_allows_comparisons_and_indic_joiners_but_rejects_mar
             field_label="Description",
             max_length=100,
         )
+
+
+def test_batched_fields_use_one_call_and_fall_back_for_invalid_keys(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    provider = SequenceProvider([
+        '```json\n{"description": "Description FR", "keywords": "' + "k" * 40 + '"}\n```',
+        '["mots", "clés", "Mots"]',
+    ])
+
+    result = translate_fields_with_validation(
+        provider,
+        {
+            "description": {"text": "Description", "max_length": 4000, "field_label": "App description"},
+            "keywords": {"text": "words,keys", "max_length": 20, "field_label": "App keywords",
+                         "is_keywords": True, "single_line": True},
+        },
+        "French",
+        seed=3,
+    )
+
+    assert result == {"description": "Description FR", "keywords": "mots,clés"}
+    assert '"description": "Description"' in provider.calls[0][0]
+    assert '"keywords": ["words", "keys"]' in provider.calls[0][0]
+    assert provider.calls[1][0] == '["words", "keys"]'
+    assert provider.calls[1][2]["is_keywords"] is True
+
+
+def test_batched_fields_log_and_fall_back_when_reply_is_truncated(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    logged = []
+    monkeypatch.setattr("translation_validation.log_ai_error", lambda *args: logged.append(args))
+    provider = SequenceProvider(['{"a": "Un", "b": "De', "Un", "Deux"])
+
+    result = translate_fields_with_validation(
+        provider,
+        {"a": {"text": "One", "max_length": 10}, "b": {"text": "Two", "max_length": 10}},
+        "French",
+        seed=None,
+    )
+
+    assert result == {"a": "Un", "b": "Deux"}
+    assert [call[0] for call in provider.calls[1:]] == ["One", "Two"]
+    assert logged and logged[0][1] == "Batched translation fell back to per-field calls"
+    assert logged[0][2]["fields"] == ["a", "b"]
+
+
+def test_batched_fields_raise_provider_errors_without_per_field_calls():
+    class FailingProvider(SequenceProvider):
+        def translate(self, text, target_language, **kwargs):
+            self.calls.append((text, target_language, kwargs))
+            raise Exception("OpenAI API error 429: Too Many Requests")
+
+    provider = FailingProvider([])
+
+    with pytest.raises(Exception, match="429"):
+        translate_fields_with_validation(
+            provider,
+            {"a": {"text": "One", "max_length": 10}, "b": {"text": "Two", "max_length": 10}},
+            "French",
+            seed=None,
+        )
+    assert len(provider.calls) == 1
+
+
+class JSONModeProvider(SequenceProvider):
+    def __init__(self, replies, cap=32000):
+        super().__init__([])
+        self.replies = deque(replies)
+        self.cap = cap
+        self.json_calls = []
+
+    def structured_output_cap(self):
+        return self.cap
+
+    def translate_json(self, source, target_language, **kwargs):
+        self.json_calls.append((source, target_language, kwargs))
+        reply = self.replies.popleft()
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+def test_batched_fields_use_json_mode_with_budget_from_field_limits(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    provider = JSONModeProvider([{"description": "Description FR", "keywords": ["mots", "clés"]}])
+
+    result = translate_fields_with_validation(
+        provider,
+        {
+            "description": {"text": "Description", "max_length": 4000, "field_label": "App description"},
+            "keywords": {"text": "words,keys", "max_length": 20, "is_keywords": True, "single_line": True},
+        },
+        "French",
+        seed=3,
+    )
+
+    assert result == {"description": "Description FR", "keywords": "mots,clés"}
+    assert provider.calls == []
+    source, language, kwargs = provider.json_calls[0]
+    assert source == {"description": "Description", "keywords": ["words", "keys"]}
+    assert kwargs["schema"]["required"] == ["description", "keywords"]
+    assert kwargs["schema"]["properties"]["keywords"] == {"type": "array", "items": {"type": "string"}}
+    assert kwargs["max_output_tokens"] == 256 + (42 * 2 + 16) + (20 * 2 + 16)
+    assert kwargs["seed"] == 3
+
+
+def test_batched_fields_json_mode_truncation_or_small_cap_falls_back(monkeypatch):
+    from ai_providers import StructuredReplyError
+
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    logged = []
+    monkeypatch.setattr("translation_validation.log_ai_error", lambda *args: logged.append(args))
+    fields = {"a": {"text": "One", "max_length": 10}, "b": {"text": "Two", "max_length": 10}}
+
+    provider = JSONModeProvider([StructuredReplyError("reply stopped at max_tokens (304)")])
+    provider.outputs.extend(["Un", "Deux"])
+    assert translate_fields_with_validation(provider, fields, "French", seed=None) == {"a": "Un", "b": "Deux"}
+    assert "max_tokens" in logged[-1][2]["reason"]
+
+    # Budget above what the model allows: no batched call at all
+    provider = JSONModeProvider([], cap=100)
+    provider.outputs.extend(["Un", "Deux"])
+    assert translate_fields_with_validation(provider, fields, "French", seed=None) == {"a": "Un", "b": "Deux"}
+    assert provider.json_calls == []
+    assert "model allows 100" in logged[-1][2]["reason"]
+
+
+def test_batched_fields_disabled_or_single_field_uses_per_field_calls(monkeypatch):
+    monkeypatch.setenv("TRANSLATER_BATCH_FIELDS", "0")
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    provider = SequenceProvider(["Un", "Deux"])
+
+    result = translate_fields_with_validation(
+        provider,
+        {"a": {"text": "One", "max_length": 10}, "b": {"text": "Two", "max_length": 10}},
+        "French",
+        seed=None,
+    )
+
+    assert result == {"a": "Un", "b": "Deux"}
+    assert [call[0] for call in provider.calls] == ["One", "Two"]
+
+
+def test_keywords_translated_as_array_and_truncated_on_boundaries():
+    provider = SequenceProvider(['["alpha", "beta", " Alpha ", "gamma"]'])
+
+    result = translate_keywords_with_validation(
+        provider, "one, two,one,three.", "German", max_length=12, seed=None,
+    )
+
+    assert result == "alpha,beta"
+    assert provider.calls[0][0] == '["one", "two", "three"]'
+
+
+def test_keywords_fall_back_to_text_translation_when_reply_is_not_an_array():
+    provider = SequenceProvider(["eins, zwei", "eins,zwei"])
+
+    result = translate_keywords_with_validation(provider, "one,two", "German", max_length=100, seed=None)
+
+    assert result == "eins,zwei"
+    assert provider.calls[1][0] == "one,two"
+    assert provider.calls[1][2]["is_keywords"] is True
+
+
+def test_keywords_provider_errors_propagate_without_a_second_call():
+    class FailingProvider(SequenceProvider):
+        def translate(self, text, target_language, **kwargs):
+            self.calls.append((text, target_language, kwargs))
+            raise Exception("Anthropic API error 402: Payment Required")
+
+    provider = FailingProvider([])
+
+    with pytest.raises(Exception, match="402"):
+        translate_keywords_with_validation(provider, "one,two", "German", max_length=100, seed=None)
+    assert len(provider.calls) == 1
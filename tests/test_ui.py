@@ -1,4 +1,5 @@
 import builtins
+import io
 
 from ui import UI
 
@@ -14,6 +15,7 @@ def test_prompt_multiline_uses_console_fallback(monkeypatch):
     monkeypatch.setattr(ui, "available", lambda: False)
     monkeypatch.setattr(ui, "_launch_system_editor", lambda **_kwargs: None)
 
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
     answers = iter(["line 1", "line 2", "EOF"])
     monkeypatch.setattr(builtins, "input", lambda *args, **kwargs: next(answers))
 
@@ -41,3 +43,16 @@ def test_select_returns_none_if_inquirer_missing(monkeypatch):
 
     monkeypatch.setattr(builtins, "__import__", fake_import)
     assert ui.select("msg", [{"name": "A", "value": "a"}]) is None
+
+
+def test_prompt_multiline_reads_piped_stdin_directly(monkeypatch):
+    ui = UI()
+    monkeypatch.setattr(ui, "available", lambda: False)
+    monkeypatch.setattr(ui, "_launch_system_editor", lambda **_kwargs: None)
+    monkeypatch.setattr("sys.stdin", io.StringIO("line 1\n  indented\nEOF\nignored\n"))
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("input() used")))
+
+    assert ui.prompt_multiline("Prompt") == "line 1\n  indented"
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("no newline at end"))
+    assert ui.prompt_multiline("Prompt") == "no newline at end"
@@ -1,4 +1,5 @@
 import builtins
+import threading
 
 from conftest import patch_inquirer_import
 from ui import UI
@@ -51,6 +52,7 @@ def test_prompt_multiline_console_with_initial_and_eof_error(monkeypatch):
     monkeypatch.setattr(ui, "available", lambda: False)
     monkeypatch.setattr(ui, "_launch_system_editor", lambda **_kwargs: None)
 
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
     answers = iter(["line one", EOFError()])
 
     def fake_input(*_a, **_k):
@@ -102,3 +104,26 @@ def test_prompt_app_id_non_tui_prev_navigation(monkeypatch):
     answers = iter(["n", "p", "1"])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
     assert ui.prompt_app_id(ASC()) == "app1"
+
+
+def test_prompt_app_id_pager_prefetches_next_page(monkeypatch):
+    ui = UI()
+    monkeypatch.setattr(ui, "available", lambda: False)
+    second_page_fetched = threading.Event()
+
+    class ASC:
+        def get_apps_page(self, limit=25, cursor=None):
+            if cursor is None:
+                return {"data": [{"id": "app1", "attributes": {"name": "One"}}], "next_cursor": "c2"}
+            second_page_fetched.set()
+            return {"data": [{"id": "app2", "attributes": {"name": "Two"}}], "next_cursor": None}
+
+    answers = iter(["n", "1"])
+
+    def fake_input(*_a, **_k):
+        # The next page is requested while the first one is on screen
+        assert second_page_fetched.wait(timeout=2)
+        return next(answers)
+
+    monkeypatch.setattr(builtins, "input", fake_input)
+    assert ui.prompt_app_id(ASC()) == "app2"
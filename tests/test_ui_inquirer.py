@@ -25,3 +25,21 @@ def test_confirm_text_editor(monkeypatch):
     assert ui.confirm("confirm?") is True
     assert ui.text("text?") == "typed"
     assert ui.editor("edit?") == "edited"
+
+
+def test_inquirer_is_imported_once_per_ui(monkeypatch):
+    patch_inquirer_import(monkeypatch, [True, "typed"])
+    counting_import = builtins.__import__
+    imports = []
+
+    def fake_import(name, *args, **kwargs):
+        if name == "InquirerPy":
+            imports.append(name)
+        return counting_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", fake_import)
+    ui = UI()
+
+    assert ui.confirm("confirm?") is True
+    assert ui.text("text?") == "typed"
+    assert imports == ["InquirerPy"]
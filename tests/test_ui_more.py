@@ -132,3 +132,91 @@ def test_prompt_app_id_non_tui_reprompts_then_accepts_manual(monkeypatch):
     answers = iter(["", "99", "manual-id"])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
     assert ui.prompt_app_id(asc) == "manual-id"
+
+
+def test_prompt_app_id_reuses_cached_apps_until_invalidated(monkeypatch):
+    ui = UI()
+    monkeypatch.setattr(ui, "available", lambda: True)
+    monkeypatch.setattr(ui, "_fuzzy_app_picker", lambda apps: apps[0]["id"])
+    fetches = []
+
+    def get_apps(**kwargs):
+        fetches.append(kwargs)
+        return {"data": [{"id": "app1", "attributes": {"name": "Demo"}}]}
+
+    asc = types.SimpleNamespace(get_apps=get_apps)
+
+    assert ui.prompt_app_id(asc) == "app1"
+    assert ui.prompt_app_id(asc) == "app1"
+    assert fetches == [{"limit": 200}]
+
+    ui.invalidate_apps_cache()
+    assert ui.prompt_app_id(asc) == "app1"
+    assert len(fetches) == 2
+
+    monkeypatch.setattr(UI, "_APPS_TTL", 0)
+    assert ui.prompt_app_id(asc) == "app1"
+    assert len(fetches) == 3
+
+
+def test_app_name_reads_the_cached_apps_list(monkeypatch):
+    ui = UI()
+    monkeypatch.setattr(ui, "available", lambda: True)
+    monkeypatch.setattr(ui, "_fuzzy_app_picker", lambda apps: apps[0]["id"])
+    fetches = []
+
+    def get_apps(**kwargs):
+        fetches.append(kwargs)
+        return {"data": [{"id": "app1", "attributes": {"name": "Demo"}}]}
+
+    asc = types.SimpleNamespace(get_apps=get_apps)
+    assert ui.prompt_app_id(asc) == "app1"
+    assert ui.app_name(asc, "app1") == "Demo"
+    assert ui.app_name(asc, "other") == "Unknown App"
+    assert len(fetches) == 1
+
+    broken = types.SimpleNamespace(get_apps=lambda **_k: (_ for _ in ()).throw(RuntimeError("down")))
+    assert ui.app_name(broken, "app1", default="X") == "X"
+
+
+
+def test_platform_pickers_share_one_versions_fetch(monkeypatch):
+    from workflows import export_localizations, helpers
+
+    ui = UI()
+    monkeypatch.setattr(ui, "available", lambda: False)
+    requests = []
+
+    def _request(method, path, **_kwargs):
+        requests.append((method, path))
+        return {"data": [{"id": "v1", "attributes": {"platform": "IOS", "versionString": "1.0"}}]}
+
+    asc = types.SimpleNamespace(_request=_request)
+    assert list(export_localizations.select_platform(ui, asc, "app1")) == ["IOS"]
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+    selected, _, _ = helpers.select_platform_versions(ui, asc, "app1")
+    assert list(selected) == ["IOS"]
+    assert requests == [("GET", "apps/app1/appStoreVersions")]
+
+    ui.invalidate_apps_cache()
+    helpers.fetch_app_versions(ui, asc, "app1")
+    assert len(requests) == 2
+
+def test_available_probes_tui_once(monkeypatch):
+    ui = UI()
+    probes = {"n": 0}
+
+    def fake_isatty():
+        probes["n"] += 1
+        return True
+
+    _patch_inquirer_success(monkeypatch)
+    monkeypatch.setattr("sys.stdin", io.StringIO())
+    monkeypatch.setattr("sys.stdout", io.StringIO())
+    monkeypatch.setattr("sys.stdin.isatty", fake_isatty)
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    monkeypatch.delenv("TRANSLATER_NO_TUI", raising=False)
+
+    assert ui.available() is True
+    assert ui.available() is True
+    assert probes["n"] == 1
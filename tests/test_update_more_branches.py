@@ -100,7 +100,6 @@ def test_update_run_task_continue_keywords_truncate_and_missing_platform_locale(
         }
 
     fake_asc.set_response("get_app_store_version_localizations", locs_for_version)
-    monkeypatch.setattr(update_localizations.time, "sleep", lambda *_a, **_k: None)
     answers = iter(["fr-FR", "keywords,promotional_text", "y", ""])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
     assert update_localizations.run(fake_cli) is True
@@ -128,7 +127,6 @@ def test_update_run_does_not_overwrite_selected_fields(fake_cli, fake_ui, fake_a
     fake_asc.set_response("get_app_store_version_localizations", locs_for_version)
     fake_asc.set_response("update_app_store_version_localization", {"data": {"id": "updated"}})
     fake_asc.set_response("create_app_store_version_localization", {"data": {"id": "created"}})
-    monkeypatch.setattr(update_localizations.time, "sleep", lambda *_a, **_k: None)
 
     answers = iter(["a", "fr-FR", "keywords", "y", ""])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
@@ -138,10 +136,15 @@ def test_update_run_does_not_overwrite_selected_fields(fake_cli, fake_ui, fake_a
     create_calls = [c for c in fake_asc.calls if c[0] == "create_app_store_version_localization"]
 
     assert len(update_calls) == 1
-    assert update_calls[0][2] == {"localization_id": "loc-fr-ios", "keywords": "translated-French-base,kw"}
+    # FakeProvider prefixes the whole JSON payload, so the structured per-locale
+    # request parses back to the source values
+    assert update_calls[0][2] == {"localization_id": "loc-fr-ios", "keywords": "base,kw"}
     assert len(create_calls) == 1
-    assert create_calls[0][2]["description"] == "translated-French-Base EN"
+    assert create_calls[0][2]["description"] == "Base EN"
     assert "keywords" in create_calls[0][2]
+    # Localizations are fetched once per platform and reused for the writes
+    fetches = sorted(c[1][0] for c in fake_asc.calls if c[0] == "get_app_store_version_localizations")
+    assert fetches == ["ver-ios", "ver-mac"]
 
 
 def test_update_run_warns_on_empty_translations(fake_cli, fake_ui, fake_asc, monkeypatch):
@@ -154,6 +157,8 @@ def test_update_run_warns_on_empty_translations(fake_cli, fake_ui, fake_asc, mon
     answers = iter(["n", "fr-FR", "description", "y", ""])
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
     assert update_localizations.run(fake_cli) is True
+    # Nothing usable came back, so the existing localization is left untouched
+    assert not [c for c in fake_asc.calls if c[0] == "update_app_store_version_localization"]
 
 
 def test_update_run_tui_selected_field_with_empty_source_hits_continue(fake_cli, fake_ui, fake_asc, monkeypatch):
@@ -171,6 +176,68 @@ def test_update_run_tui_selected_field_with_empty_source_hits_continue(fake_cli,
     )
     fake_ui.checkbox_values.extend([["fr-FR"], ["promotional_text"]])
     fake_ui.confirm_values.append(True)
-    monkeypatch.setattr(update_localizations.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
     assert update_localizations.run(fake_cli) is True
+
+
+def test_update_run_sends_one_structured_request_per_locale(fake_cli, fake_ui, fake_asc, monkeypatch):
+    import json
+
+    _setup_base(
+        monkeypatch, fake_ui, fake_asc,
+        [_loc("loc-en", "en-US"), _loc("loc-fr", "fr-FR")],
+        tui=False,
+    )
+    fake_asc.set_response("update_app_store_version_localization", {"data": {"id": "updated"}})
+    requests_sent = []
+
+    class JSONProvider:
+        model = "json-model"
+
+        def get_name(self):
+            return "JSON"
+
+        def translate(self, text, target_language, **kwargs):
+            requests_sent.append((json.loads(text), kwargs.get("refinement") or ""))
+            return json.dumps({k: (["fr-" + t for t in v] if isinstance(v, list) else "FR " + v)
+                               for k, v in json.loads(text).items()})
+
+    fake_cli.ai_manager.providers = {"json": JSONProvider()}
+    fake_cli.config = type(fake_cli.config)(default_provider="json")
+    answers = iter(["a", "fr-FR", "keywords,promotional_text,whats_new", "y", ""])
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
+
+    assert update_localizations.run(fake_cli) is True
+
+    assert len(requests_sent) == 1
+    payload, guidance = requests_sent[0]
+    assert payload == {"keywords": ["a", "b", "c"], "promotional_text": "Promo", "whats_new": "Whats new"}
+    assert "\"promotional_text\" (Promotional Text) at most 170 characters" in guidance
+    update = [c[2] for c in fake_asc.calls if c[0] == "update_app_store_version_localization"][0]
+    assert update["keywords"] == "fr-a,fr-b,fr-c"
+    assert update["promotional_text"] == "FR Promo"
+    assert update["whats_new"] == "FR Whats new"
+
+
+def test_update_run_uses_table_labels_for_field_specs(fake_cli, fake_ui, fake_asc, monkeypatch):
+    _setup_base(monkeypatch, fake_ui, fake_asc, [_loc("loc-en", "en-US"), _loc("loc-fr", "fr-FR")], tui=False)
+    seen = {}
+
+    def fake_translate(_provider, specs, _language, **_kwargs):
+        seen.update(specs)
+        return {field: spec["text"] for field, spec in specs.items()}
+
+    monkeypatch.setattr(update_localizations, "translate_fields_with_validation", fake_translate)
+    answers = iter(["a", "fr-FR", "whats_new,promotional_text", "y", ""])
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: next(answers))
+    assert update_localizations.run(fake_cli) is True
+
+    assert seen["whats_new"]["field_label"] == "What's New"
+    assert seen["promotional_text"]["max_length"] == 170
+
+
+def test_update_fields_table_is_read_only():
+    import pytest
+
+    with pytest.raises(TypeError):
+        update_localizations.UPDATE_FIELDS["subtitle"] = ("Subtitle", "subtitle")
@@ -1,5 +1,8 @@
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 import utils
 
 
@@ -15,6 +18,13 @@ def test_validate_and_get_field_limit():
     assert utils.validate_field_length("anything", "unknown") is True
 
 
+def test_locale_and_limit_tables_are_read_only():
+    with pytest.raises(TypeError):
+        utils.APP_STORE_LOCALES["xx"] = "Nope"
+    with pytest.raises(TypeError):
+        utils.FIELD_LIMITS["name"] = 99
+
+
 def test_app_store_locales_include_api_shortcode_for_slovenian():
     assert len(utils.APP_STORE_LOCALES) == 50
     assert "sl" not in utils.APP_STORE_LOCALES
@@ -79,6 +89,56 @@ def test_parallel_map_locales_runs_all_tasks(monkeypatch):
     assert "fr-FR" in errors
 
 
+def test_parallel_map_locales_coalesces_progress_redraws(monkeypatch, capsys):
+    monkeypatch.setenv("TRANSLATER_CONCURRENCY", "4")
+    locales = list(utils.APP_STORE_LOCALES)[:20]
+
+    results, errors = utils.parallel_map_locales(locales, lambda loc: loc, progress_action="Testing")
+
+    out = capsys.readouterr().out
+    assert len(results) == 20 and not errors
+    # Instant tasks finish inside one redraw interval: initial 0/20 plus the final 20/20
+    assert out.count("% (") < 20
+    assert "(20/20) Testing" in out
+
+
+def test_progress_line_coalesces_and_survives_display_errors(monkeypatch, capsys):
+    line = utils.ProgressLine(50, "Saving locales...")
+    for i in range(50):
+        line.advance(f"Saved {i}")
+    line.clear()
+    out = capsys.readouterr().out
+    assert "(0/50) Saving locales..." in out
+    assert "(50/50) Saved 49" in out
+    assert out.count("% (") < 50
+
+    monkeypatch.setattr(utils, "format_progress", lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("boom")))
+    broken = utils.ProgressLine(1, "x")
+    broken.advance("y")
+    broken.clear()
+    assert broken.completed == 1
+
+
+def test_parallel_map_fields_preserves_order_and_raises(monkeypatch):
+    assert utils.parallel_map_fields({}) == {}
+    tasks = {"b": lambda: 2, "a": lambda: 1}
+    assert list(utils.parallel_map_fields(tasks).items()) == [("b", 2), ("a", 1)]
+
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "1")
+    assert utils.parallel_map_fields(tasks) == {"b": 2, "a": 1}
+
+    def boom():
+        raise RuntimeError("field failed")
+
+    monkeypatch.setenv("TRANSLATER_FIELD_CONCURRENCY", "bogus")
+    try:
+        utils.parallel_map_fields({"ok": lambda: 1, "bad": boom})
+    except RuntimeError as e:
+        assert "field failed" in str(e)
+    else:
+        raise AssertionError("expected RuntimeError")
+
+
 def test_export_existing_localizations_writes_file(tmp_path, monkeypatch, localization_payload):
     monkeypatch.chdir(tmp_path)
     locs = [localization_payload("en-US"), localization_payload("fr-FR", description="Bonjour")]
@@ -93,6 +153,14 @@ def test_export_existing_localizations_writes_file(tmp_path, monkeypatch, locali
     assert "Bonjour" in content
 
 
+def test_export_file_name_keeps_only_safe_characters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output = utils.export_existing_localizations([], app_name="Café App! 🚀 Pro_Max", app_id="9", version_string="2.0 (beta)")
+    assert Path(output).name.startswith("caféapppro_max_9_v2.0beta_")
+    output = utils.export_existing_localizations([], app_name="!!!", app_id="9", version_string="")
+    assert Path(output).name.startswith("unknown_app_9_v_unknown_")
+
+
 def test_resolve_private_key_path_uses_explicit_and_default(tmp_path, monkeypatch):
     explicit = tmp_path / "AuthKey_ABC123.p8"
     explicit.write_text("secret", encoding="utf-8")
@@ -105,3 +173,111 @@ def test_resolve_private_key_path_uses_explicit_and_default(tmp_path, monkeypatc
     default_key = default_dir / "AuthKey_ZZZ999.p8"
     default_key.write_text("secret", encoding="utf-8")
     assert utils.resolve_private_key_path("ZZZ999", "") == default_key
+
+
+def test_split_keywords_trims_and_dedupes():
+    assert utils.split_keywords("") == []
+    assert utils.split_keywords(" a, b,,A , c.") == ["a", "b", "c"]
+    assert utils.split_keywords(["x", " y ", "X"]) == ["x", "y"]
+
+
+def test_print_translation_previews_writes_all_blocks_at_once(monkeypatch):
+    printed = []
+    monkeypatch.setattr("builtins.print", lambda *args, **_kwargs: printed.append(" ".join(map(str, args))))
+
+    utils.print_translation_previews([("fr-FR", "Bonjour"), ("de-DE", "")])
+
+    assert len(printed) == 1
+    lines = printed[0].split("\n")
+    assert lines[:4] == ["-" * 60, "French [fr-FR]", "-" * 60, "Bonjour"]
+    assert "⚠️  Empty translation for German [de-DE]" in lines
+    assert lines[-1] == ""
+
+
+def test_format_progress_bar_width_is_fixed():
+    assert utils.format_progress(1, 3, "x") == "[" + "█" * 6 + "░" * 14 + "] 33% (1/3) x"
+    assert utils.format_progress(0, 0) == "[" + "░" * 20 + "] 0% (0/0) "
+    # Over-counting never draws past the bar
+    assert utils.format_progress(7, 5).startswith("[" + "█" * 20 + "]")
+
+
+def test_parallel_map_locales_stops_after_repeated_account_failures(monkeypatch):
+    import types
+
+    monkeypatch.setenv("TRANSLATER_CONCURRENCY", "1")
+    calls = []
+
+    def unauthorized(loc):
+        calls.append(loc)
+        error = RuntimeError("401 Unauthorized")
+        error.response = types.SimpleNamespace(status_code=401)
+        raise error
+
+    locales = ["fr-FR", "de-DE", "es-ES", "it", "ja"]
+    results, errors = utils.parallel_map_locales(locales, unauthorized)
+
+    assert results == {}
+    assert calls == locales[:3]
+    assert set(errors) == set(locales)
+    assert errors["ja"].startswith("skipped")
+
+    # Ordinary per-locale failures never trip the breaker
+    calls.clear()
+
+    def flaky(loc):
+        calls.append(loc)
+        raise ValueError("too long")
+
+    utils.parallel_map_locales(locales, flaky)
+    assert calls == locales
+
+    monkeypatch.setenv("TRANSLATER_FAIL_FAST_AFTER", "0")
+    calls.clear()
+    utils.parallel_map_locales(locales, unauthorized)
+    assert calls == locales
+
+
+def test_keyword_cleanup_drops_empty_parts_and_trailing_periods():
+    assert utils.truncate_keywords("a,, b ,c . ") == "a,b,c"
+    assert utils.truncate_keywords("ab, cd ,ef", max_length=5) == "ab,cd"
+    assert utils.truncate_keywords("  solo keyword. ") == "solo keyword"
+    assert utils.truncate_keywords("toolongkeyword", max_length=5) == ""
+    assert utils.split_keywords([" one. ", "Two ", "one", " . "]) == ["one", "Two"]
+
+
+def test_pause_for_enter_only_waits_on_a_terminal(monkeypatch):
+    prompts = []
+    monkeypatch.setattr("builtins.input", lambda msg="": prompts.append(msg) or "")
+    monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+    monkeypatch.setattr("sys.stdin.isatty", lambda: False)
+    utils.pause_for_enter()
+    assert prompts == []
+    monkeypatch.setattr("sys.stdin.isatty", lambda: True)
+    utils.pause_for_enter()
+    assert prompts == ["\nPress Enter to continue..."]
+
+
+def test_detect_base_language_falls_back_to_first_listed_locale():
+    localizations = [
+        {"attributes": None},
+        {"attributes": {"locale": "fr-FR"}},
+        {"attributes": {"locale": "de-DE"}},
+    ]
+    assert utils.detect_base_language(localizations) == "fr-FR"
+    assert utils.detect_base_language(localizations + [{"attributes": {"locale": "en-AU"}}]) == "en-AU"
+    assert utils.detect_base_language([{"attributes": {}}]) is None
+
+
+def test_export_file_name_and_date_share_one_timestamp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ticks = iter([datetime(2026, 1, 1, 23, 59, 59), datetime(2026, 1, 2, 0, 0, 0)])
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(ticks)
+
+    monkeypatch.setattr(utils, "datetime", FakeDatetime)
+    output = utils.export_existing_localizations([], app_name="App", app_id="1", version_string="1.0")
+    assert Path(output).name.endswith("_01012026_23.59.txt")
+    assert "Export Date: 2026-01-01 23:59:59" in Path(output).read_text(encoding="utf-8")
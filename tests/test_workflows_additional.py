@@ -32,8 +32,6 @@ def test_app_info_run_creates_localization(fake_cli, fake_asc, fake_ui, monkeypa
         {"data": {"attributes": {"name": "My App", "subtitle": "Best subtitle"}}},
     )
     fake_asc.set_response("create_app_info_localization", {"data": {"id": "loc-fr"}})
-
-    monkeypatch.setattr(app_info.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert app_info.run(fake_cli) is True
@@ -80,8 +78,6 @@ def test_copy_run_copies_locales(fake_cli, fake_asc, fake_ui, monkeypatch):
         {"data": [{"id": "loc-en", "attributes": {"locale": "en-US"}}]},
     )
     fake_asc.set_response("copy_localization_from_previous_version", True)
-
-    monkeypatch.setattr(copy.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert copy.run(fake_cli) is True
@@ -138,8 +134,6 @@ def test_iap_run_creates_localization(fake_cli, fake_asc, fake_ui, monkeypatch):
         },
     )
     fake_asc.set_response("create_in_app_purchase_localization", {"data": {"id": "iaploc-fr"}})
-
-    monkeypatch.setattr(iap_translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert iap_translate.run(fake_cli) is True
@@ -205,8 +199,6 @@ def test_subscription_run_creates_localization(fake_cli, fake_asc, fake_ui, monk
         },
     )
     fake_asc.set_response("create_subscription_localization", {"data": {"id": "subloc-fr"}})
-
-    monkeypatch.setattr(subscription_translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert subscription_translate.run(fake_cli) is True
@@ -250,8 +242,6 @@ def test_app_events_run_creates_localization(fake_cli, fake_asc, fake_ui, monkey
         },
     )
     fake_asc.set_response("create_app_event_localization", {"data": {"id": "evloc-fr"}})
-
-    monkeypatch.setattr(app_events_translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert app_events_translate.run(fake_cli) is True
@@ -286,8 +276,6 @@ def test_subscription_run_group_scope_creates_localization(fake_cli, fake_asc, f
         },
     )
     fake_asc.set_response("create_subscription_group_localization", {"data": {"id": "grouploc-fr"}})
-
-    monkeypatch.setattr(subscription_translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert subscription_translate.run(fake_cli) is True
@@ -334,8 +322,6 @@ def test_app_events_run_falls_back_to_included_localizations(fake_cli, fake_asc,
         },
     )
     fake_asc.set_response("create_app_event_localization", {"data": {"id": "evloc-fr"}})
-
-    monkeypatch.setattr(app_events_translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert app_events_translate.run(fake_cli) is True
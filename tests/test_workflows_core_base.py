@@ -27,14 +27,123 @@ def test_translate_run_creates_missing_locale(fake_cli, fake_asc, fake_ui, local
     fake_asc.set_response("_request", _versions_response())
     fake_asc.set_response("get_app_store_version_localizations", lambda *_a, **_k: localizations)
     fake_asc.set_response("create_app_store_version_localization", {"data": {"id": "new-loc"}})
-
-    monkeypatch.setattr(translate.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert translate.run(fake_cli) is True
     assert any(call[0] == "create_app_store_version_localization" for call in fake_asc.calls)
 
 
+def test_translate_run_fetches_localizations_once_and_updates_existing(
+    fake_cli, fake_asc, fake_ui, localization_payload, monkeypatch
+):
+    fake_ui.app_id = "app1"
+    fake_ui.select_values.extend(["1", "all"])
+    fake_ui.checkbox_values.extend([["IOS"], ["fr-FR", "de-DE"]])
+
+    localizations = {
+        "data": [
+            localization_payload("en-US", loc_id="loc-en"),
+            localization_payload("fr-FR", loc_id="loc-fr"),
+        ]
+    }
+    fake_asc.set_response("_request", _versions_response())
+    fake_asc.set_response("get_app_store_version_localizations", lambda *_a, **_k: localizations)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    assert translate.run(fake_cli) is True
+    names = [call[0] for call in fake_asc.calls]
+    assert names.count("get_app_store_version_localizations") == 1
+    updates = [c for c in fake_asc.calls if c[0] == "update_app_store_version_localization"]
+    creates = [c for c in fake_asc.calls if c[0] == "create_app_store_version_localization"]
+    assert [c[2]["localization_id"] for c in updates] == ["loc-fr"]
+    assert [c[2]["locale"] for c in creates] == ["de-DE"]
+
+
+def test_translate_rerun_skips_fields_with_unchanged_source(
+    fake_cli, fake_asc, fake_ui, fake_provider, localization_payload, monkeypatch
+):
+    base = {"description": "Base description"}
+    localizations = lambda *_a, **_k: {
+        "data": [
+            localization_payload("en-US", loc_id="loc-en", description=base["description"]),
+            localization_payload("fr-FR", loc_id="loc-fr", description="Description FR"),
+        ]
+    }
+    fake_asc.set_response("_request", _versions_response())
+    fake_asc.set_response("get_app_store_version_localizations", localizations)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
+
+    def _run():
+        fake_ui.app_id = "app1"
+        fake_ui.select_values.extend(["1", "existing"])
+        fake_ui.checkbox_values.extend([["IOS"], ["fr-FR"]])
+        fake_asc.calls.clear()
+        fake_provider.calls.clear()
+        assert translate.run(fake_cli) is True
+        return [c[2] for c in fake_asc.calls if c[0] == "update_app_store_version_localization"]
+
+    assert len(_run()) == 1 and fake_provider.calls
+
+    # Nothing changed in the base locale: no AI calls, no writes
+    assert _run() == [] and fake_provider.calls == []
+
+    # Only the description changed: only it is re-translated and written
+    base["description"] = "New base description"
+    updates = _run()
+    assert len(updates) == 1
+    assert updates[0]["description"]
+    assert updates[0]["keywords"] is None and updates[0]["whats_new"] is None
+
+    # A different refinement phrase or model re-translates every field
+    fake_cli.config.set_prompt_refinement("more playful")
+    updates = _run()
+    assert len(updates) == 1 and updates[0]["keywords"] and updates[0]["whats_new"]
+    fake_provider.model = "other-model"
+    updates = _run()
+    assert len(updates) == 1 and updates[0]["keywords"] and updates[0]["whats_new"]
+    assert _run() == []
+
+    # Declining the skip prompt forces a full re-translation
+    fake_ui.confirm_values.append(False)
+    updates = _run()
+    assert len(updates) == 1 and updates[0]["keywords"] and fake_provider.calls
+
+
+def test_translate_run_missing_scope_offers_missing_and_empty_locales(
+    fake_cli, fake_asc, fake_ui, localization_payload, monkeypatch
+):
+    import utils
+
+    fake_ui.app_id = "app1"
+    fake_ui.select_values.extend(["1", "missing"])
+    fake_ui.checkbox_values.extend([["IOS"], []])
+    offered = {}
+
+    original_checkbox = fake_ui.checkbox
+
+    def checkbox(message, choices, add_back=False):
+        offered[message] = [c["value"] for c in choices]
+        return original_checkbox(message, choices, add_back=add_back)
+
+    fake_ui.checkbox = checkbox
+    localizations = {
+        "data": [
+            localization_payload("en-US"),
+            localization_payload("fr-FR"),
+            localization_payload("de-DE", description="  "),
+        ]
+    }
+    fake_asc.set_response("_request", _versions_response())
+    fake_asc.set_response("get_app_store_version_localizations", lambda *_a, **_k: localizations)
+
+    assert translate.run(fake_cli) is True
+    targets = [v for v in offered["Select target languages"] if not v.startswith("__")]
+    assert "de-DE" in targets
+    assert "fr-FR" not in targets and "en-US" not in targets
+    assert len(targets) == len(utils.APP_STORE_LOCALES) - 2
+    assert targets == sorted(targets)
+
+
 def test_update_run_updates_selected_locale(fake_cli, fake_asc, fake_ui, localization_payload, monkeypatch):
     fake_ui.app_id = "app1"
     fake_ui.select_values.append("existing")
@@ -50,8 +159,6 @@ def test_update_run_updates_selected_locale(fake_cli, fake_asc, fake_ui, localiz
     fake_asc.set_response("_request", _versions_response())
     fake_asc.set_response("get_app_store_version_localizations", lambda *_a, **_k: localizations)
     fake_asc.set_response("update_app_store_version_localization", {"data": {"id": "loc-fr"}})
-
-    monkeypatch.setattr(update_localizations.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert update_localizations.run(fake_cli) is True
@@ -68,8 +175,6 @@ def test_full_setup_run_creates_translations_for_missing_locales(fake_cli, fake_
     fake_asc.set_response("_request", _versions_response())
     fake_asc.set_response("get_app_store_version_localizations", lambda *_a, **_k: localizations)
     fake_asc.set_response("create_app_store_version_localization", {"data": {"id": "new-loc"}})
-
-    monkeypatch.setattr(full_setup.time, "sleep", lambda *_a, **_k: None)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "")
 
     assert full_setup.run(fake_cli) is True
@@ -160,3 +160,22 @@ def test_select_platform_versions_non_tui_all(monkeypatch):
     selected, latest, labels = helpers.select_platform_versions(ui, asc, "app1")
     assert set(selected.keys()) == {"IOS", "MAC_OS"}
     assert labels["IOS"] == "iOS"
+
+
+def test_fetch_platform_localizations_fetches_each_platform_concurrently():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=2)
+
+    def get_locs(version_id):
+        barrier.wait()  # both platforms must be in flight at the same time
+        return {"data": [{"id": f"{version_id}-loc"}]}
+
+    asc = types.SimpleNamespace(get_app_store_version_localizations=get_locs)
+    selected = {"IOS": {"id": "v-ios"}, "MAC_OS": {"id": "v-mac"}}
+
+    result = helpers.fetch_platform_localizations(asc, selected)
+
+    assert list(result) == ["IOS", "MAC_OS"]
+    assert result["MAC_OS"] == [{"id": "v-mac-loc"}]
+    assert helpers.fetch_platform_localizations(asc, {}) == {}
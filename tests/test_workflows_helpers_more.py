@@ -151,6 +151,15 @@ def test_choose_target_locales_paths(monkeypatch):
     assert out == ["de-DE"]
 
 
+def test_choose_target_locales_drops_repeated_locales(monkeypatch):
+    ui = TinyUI(tui=False)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "fr-FR, de-DE,fr-FR")
+
+    out = helpers.choose_target_locales(ui, {"fr-FR": "French", "de-DE": "German"}, "en-US")
+
+    assert out == ["fr-FR", "de-DE"]
+
+
 def test_choose_target_locales_strict_invalid_rejects_typo(monkeypatch):
     ui = TinyUI(tui=False)
     monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "zz-ZZ")
@@ -166,6 +175,16 @@ def test_choose_target_locales_strict_invalid_rejects_typo(monkeypatch):
     assert out == []
 
 
+def test_choose_target_locales_warns_about_unavailable_entries(monkeypatch, capsys):
+    ui = TinyUI(tui=False)
+    monkeypatch.setattr(builtins, "input", lambda *_a, **_k: "de-DE, zz-ZZ, fr-FR, aa-AA")
+
+    out = helpers.choose_target_locales(ui, {"fr-FR": "French", "de-DE": "German"}, "en-US")
+
+    assert out == ["de-DE", "fr-FR"]
+    assert "Ignoring unavailable locales: aa-AA, zz-ZZ" in capsys.readouterr().out
+
+
 def test_choose_target_locales_tui_marks_preferred_locales_preselected():
     captured = {}
 
@@ -242,3 +261,17 @@ def test_get_app_locales_success_and_no_latest():
         get_app_store_version_localizations=lambda _v: {"data": [{"attributes": {"locale": "en-US"}}]},
     )
     assert helpers.get_app_locales(asc_none, "app1") == set()
+
+
+def test_index_by_locale_single_pass_skips_missing_and_keeps_first():
+    locs = [
+        {"id": "a", "attributes": {"locale": "en-US"}},
+        {"id": "b", "attributes": {}},
+        {"id": "c"},
+        {"id": "d", "attributes": {"locale": "fr-FR"}},
+        {"id": "e", "attributes": {"locale": "en-US"}},
+    ]
+    indexed = helpers.index_by_locale(locs)
+    assert list(indexed) == ["en-US", "fr-FR"]
+    assert indexed["en-US"]["id"] == "a"
+    assert helpers.index_by_locale([]) == {}
@@ -0,0 +1,134 @@
+"""
+Translation Cache
+
+Persistent on-disk cache of validated translations, so re-running a
+workflow only pays for source text that actually changed. Entries are keyed
+by a hash of provider, model, target language, field options and source
+text, and expire after a TTL.
+
+Configuration (environment):
+- TRANSLATER_NO_CACHE=1 disables the cache
+- TRANSLATER_CACHE_PATH overrides the database path (default ~/.translater/cache.db)
+- TRANSLATER_CACHE_TTL_DAYS sets the expiry (default 30)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".translater" / "cache.db"
+DEFAULT_TTL_DAYS = 30
+
+
+class TranslationCache:
+    """Thread-safe sqlite3 key/value store for translations."""
+
+    def __init__(self, path: Path, ttl_seconds: float = DEFAULT_TTL_DAYS * 86400):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None when missing, expired, or unreadable."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT value, created FROM translations WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                value, created = row
+                if self.ttl_seconds and time.time() - created > self.ttl_seconds:
+                    conn.execute("DELETE FROM translations WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+                return value
+        except Exception:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value; cache failures never interrupt a translation run."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, value, created) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+                conn.commit()
+        except Exception:
+            pass
+
+    def clear(self) -> int:
+        """Delete every cached translation; return how many entries were removed."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                removed = conn.execute("DELETE FROM translations").rowcount
+                conn.commit()
+                return max(0, removed)
+        except Exception:
+            return 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def translation_key(provider, language_name: str, text: str, **options: Any) -> str:
+    """Build the cache key for translating `text` with `provider` and field options."""
+    try:
+        provider_name = provider.get_name()
+    except Exception:
+        provider_name = type(provider).__name__
+    parts = {
+        "provider": provider_name,
+        "model": getattr(provider, "model", None),
+        "language": language_name,
+        "options": options,
+        "text": text,
+    }
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# Global cache instance (opened lazily, like the AI logger)
+_translation_cache: Optional[TranslationCache] = None
+
+
+def get_translation_cache() -> Optional[TranslationCache]:
+    """Return the process-wide cache, or None when disabled via TRANSLATER_NO_CACHE."""
+    global _translation_cache
+    if os.environ.get("TRANSLATER_NO_CACHE"):
+        return None
+    path = Path(os.environ.get("TRANSLATER_CACHE_PATH") or DEFAULT_CACHE_PATH).expanduser()
+    try:
+        ttl_days = float(os.environ.get("TRANSLATER_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS))
+    except Exception:
+        ttl_days = DEFAULT_TTL_DAYS
+    if _translation_cache is None or _translation_cache.path != path:
+        if _translation_cache is not None:
+            _translation_cache.close()
+        _translation_cache = TranslationCache(path)
+    _translation_cache.ttl_seconds = ttl_days * 86400
+    return _translation_cache
@@ -1,12 +1,22 @@
 """Shared validated translation and shortening retries for every workflow."""
 
+import json
+import os
 import re
 import unicodedata
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+from ai_logger import log_ai_error
+from translation_cache import get_translation_cache, translation_key
 
 
 MAX_TRANSLATION_ATTEMPTS = 4
 
+# Output tokens budgeted per character of a batched JSON reply: non-Latin
+# scripts can take more than one token per character, plus JSON escaping
+STRUCTURED_TOKENS_PER_CHAR = 2
+STRUCTURED_TOKENS_OVERHEAD = 256
+
 _EMOJI_PATTERN = re.compile(
     r"[\u2600-\u27BF\U0001F000-\U0001FAFF\U0001FC00-\U0001FFFD](?:\uFE0F|\u200D)?"
 )
@@ -70,6 +80,101 @@ def validate_translation(
         raise ValueError(f"{field_label} translation contains emoji")
 
 
+def build_translation_request(
+    text: str,
+    language_name: str,
+    *,
+    max_length: Optional[int],
+    seed,
+    attempt: int = 0,
+    retry_source: Optional[str] = None,
+    refinement: str = "",
+    field_label: str = "App Store metadata field",
+    is_keywords: bool = False,
+    min_length: int = 1,
+    single_line: bool = False,
+    forbid_emoji: bool = False,
+    submission_retry: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
+    """Return the (input text, provider.translate kwargs) for one validation attempt."""
+    step = max(2, min(4, round((max_length or 25) * 0.08)))
+    requested_limit = None
+    if max_length is not None:
+        requested_limit = max(1, max_length - step * (attempt + 1))
+    retry_context = " App Store Connect rejected an earlier version." if submission_retry else ""
+    if retry_source is None:
+        task_instruction = (
+            f"Translate the supplied source into {language_name}. Preserve the core customer-facing meaning."
+        )
+        input_text = text
+    else:
+        task_instruction = (
+            f"The supplied text is already a {language_name} translation and is "
+            f"{len(retry_source)} characters long. DO NOT translate from the original source again. "
+            f"Rewrite this existing translation to satisfy the output contract. Remove nonessential "
+            f"wording and compress phrasing while preserving the core meaning."
+        )
+        input_text = retry_source
+
+    format_instruction = (
+        "Return ONLY the final text on one line"
+        if single_line
+        else "Return ONLY the final translated text and preserve meaningful line breaks"
+    )
+    limit_instruction = ""
+    if requested_limit is not None:
+        limit_instruction = (
+            f" The answer is INVALID if it exceeds {requested_limit} characters, counting every "
+            f"space, line break, and punctuation mark. Count characters before answering."
+        )
+    abbreviation_instruction = (
+        f" You may use a standard, natural abbreviation commonly understood in {language_name} "
+        f"when it preserves the core meaning; do not invent abbreviations."
+    )
+    emoji_instruction = " no emoji," if forbid_emoji else ""
+    strict_guidance = (
+        f"MANDATORY OUTPUT CONTRACT — {field_label}.{retry_context} {task_instruction} "
+        f"{format_instruction}: no label, explanation, quotes, markup,{emoji_instruction} or invisible "
+        f"characters.{limit_instruction}{abbreviation_instruction} If necessary, omit secondary marketing "
+        f"wording rather than exceeding the limit or cutting a word in half. Preserve brand names, URLs, "
+        f"numbers, and placeholders such as {{var}}, %d, and %@. Minimum output length is {min_length}. "
+        f"This is validation attempt {attempt + 1} of {MAX_TRANSLATION_ATTEMPTS}."
+    )
+    guidance = " ".join(part for part in (refinement, strict_guidance) if part)
+    attempt_seed = seed + attempt if isinstance(seed, int) else seed
+    translate_kwargs: Dict[str, Any] = {
+        "max_length": requested_limit,
+        "seed": attempt_seed,
+        "refinement": guidance,
+    }
+    if is_keywords:
+        translate_kwargs["is_keywords"] = True
+    return input_text, translate_kwargs
+
+
+def field_cache_key(
+    provider,
+    text: str,
+    language_name: str,
+    *,
+    refinement: str = "",
+    max_length: Optional[int] = None,
+    field_label: str = "App Store metadata field",
+    is_keywords: bool = False,
+    min_length: int = 1,
+    single_line: bool = False,
+    forbid_emoji: bool = False,
+    **_ignored: Any,
+) -> str:
+    """Translation cache key for one field; shared by single, batched and Batch API paths."""
+    return translation_key(
+        provider, language_name, text,
+        refinement=refinement or "", max_length=max_length, field_label=field_label,
+        is_keywords=bool(is_keywords), min_length=min_length,
+        single_line=bool(single_line), forbid_emoji=bool(forbid_emoji),
+    )
+
+
 def translate_with_validation(
     provider,
     text: str,
@@ -85,63 +190,43 @@ def translate_with_validation(
     forbid_emoji: bool = False,
     submission_retry: bool = False,
 ) -> str:
-    """Translate, validate, and rewrite overlong output with progressively stricter targets."""
-    step = max(2, min(4, round((max_length or 25) * 0.08)))
+    """Translate, validate, and rewrite overlong output with progressively stricter targets.
+
+    Validated results are stored in the translation cache; a cache hit skips
+    the provider entirely unless App Store Connect rejected an earlier version.
+    """
+    cache = get_translation_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = field_cache_key(
+            provider, text, language_name, refinement=refinement, max_length=max_length,
+            field_label=field_label, is_keywords=is_keywords, min_length=min_length,
+            single_line=single_line, forbid_emoji=forbid_emoji,
+        )
+        if not submission_retry:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
     last_error = None
     retry_source = None
 
     for attempt in range(MAX_TRANSLATION_ATTEMPTS):
-        requested_limit = None
-        if max_length is not None:
-            requested_limit = max(1, max_length - step * (attempt + 1))
-        retry_context = " App Store Connect rejected an earlier version." if submission_retry else ""
-        if retry_source is None:
-            task_instruction = (
-                f"Translate the supplied source into {language_name}. Preserve the core customer-facing meaning."
-            )
-            input_text = text
-        else:
-            task_instruction = (
-                f"The supplied text is already a {language_name} translation and is "
-                f"{len(retry_source)} characters long. DO NOT translate from the original source again. "
-                f"Rewrite this existing translation to satisfy the output contract. Remove nonessential "
-                f"wording and compress phrasing while preserving the core meaning."
-            )
-            input_text = retry_source
-
-        format_instruction = (
-            "Return ONLY the final text on one line"
-            if single_line
-            else "Return ONLY the final translated text and preserve meaningful line breaks"
-        )
-        limit_instruction = ""
-        if requested_limit is not None:
-            limit_instruction = (
-                f" The answer is INVALID if it exceeds {requested_limit} characters, counting every "
-                f"space, line break, and punctuation mark. Count characters before answering."
-            )
-        abbreviation_instruction = (
-            f" You may use a standard, natural abbreviation commonly understood in {language_name} "
-            f"when it preserves the core meaning; do not invent abbreviations."
+        input_text, translate_kwargs = build_translation_request(
+            text,
+            language_name,
+            max_length=max_length,
+            seed=seed,
+            attempt=attempt,
+            retry_source=retry_source,
+            refinement=refinement,
+            field_label=field_label,
+            is_keywords=is_keywords,
+            min_length=min_length,
+            single_line=single_line,
+            forbid_emoji=forbid_emoji,
+            submission_retry=submission_retry,
         )
-        emoji_instruction = " no emoji," if forbid_emoji else ""
-        strict_guidance = (
-            f"MANDATORY OUTPUT CONTRACT — {field_label}.{retry_context} {task_instruction} "
-            f"{format_instruction}: no label, explanation, quotes, markup,{emoji_instruction} or invisible "
-            f"characters.{limit_instruction}{abbreviation_instruction} If necessary, omit secondary marketing "
-            f"wording rather than exceeding the limit or cutting a word in half. Preserve brand names, URLs, "
-            f"numbers, and placeholders such as {{var}}, %d, and %@. Minimum output length is {min_length}. "
-            f"This is validation attempt {attempt + 1} of {MAX_TRANSLATION_ATTEMPTS}."
-        )
-        guidance = " ".join(part for part in (refinement, strict_guidance) if part)
-        attempt_seed = seed + attempt if isinstance(seed, int) else seed
-        translate_kwargs = {
-            "max_length": requested_limit,
-            "seed": attempt_seed,
-            "refinement": guidance,
-        }
-        if is_keywords:
-            translate_kwargs["is_keywords"] = True
         translated = provider.translate(input_text, language_name, **translate_kwargs)
         translated = clean_translation(translated, single_line=single_line)
         try:
@@ -155,6 +240,8 @@ def translate_with_validation(
                 single_line=single_line,
                 forbid_emoji=forbid_emoji,
             )
+            if cache is not None:
+                cache.set(cache_key, translated)
             return translated
         except ValueError as error:
             last_error = error
@@ -165,3 +252,249 @@ def translate_with_validation(
     raise ValueError(
         f"{last_error}{limit_suffix}; provider failed {MAX_TRANSLATION_ATTEMPTS} progressively stricter attempts"
     )
+
+
+def _parse_json_block(raw: str, opener: str, closer: str):
+    raw = (raw or "").strip()
+    start, end = raw.find(opener), raw.rfind(closer)
+    if start == -1 or end <= start:
+        raise ValueError("response did not contain the expected JSON")
+    return json.loads(raw[start:end + 1])
+
+
+def translate_keywords_with_validation(
+    provider,
+    text: str,
+    language_name: str,
+    *,
+    max_length: Optional[int],
+    seed,
+    refinement: str = "",
+    field_label: str = "App keywords",
+    **options: Any,
+) -> str:
+    """Translate a comma-separated keyword field as a JSON array of keywords.
+
+    The keywords are split and de-duplicated first, so the model translates
+    terms instead of a punctuation-heavy string and cannot answer with prose.
+    The translated terms are joined and trimmed to `max_length` on keyword
+    boundaries. Falls back to `translate_with_validation` when the reply is
+    not a usable array.
+    """
+    from utils import split_keywords, truncate_keywords
+
+    options.pop("is_keywords", None)
+    options.pop("single_line", None)
+    cache = get_translation_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = field_cache_key(
+            provider, text, language_name, refinement=refinement, max_length=max_length,
+            field_label=field_label, is_keywords=True, single_line=True, **options,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    keywords = split_keywords(text)
+    strict_guidance = (
+        f"MANDATORY OUTPUT CONTRACT — {field_label}. The input is a JSON array of App Store search "
+        f"keywords. Translate each keyword into a natural {language_name} search term and return ONLY "
+        f"a JSON array of strings, no explanation. Keep brand names unchanged."
+    )
+    guidance = " ".join(part for part in (refinement, strict_guidance) if part)
+    # Provider errors (HTTP 401/429, ...) propagate; only an unusable reply falls back
+    raw = provider.translate(
+        json.dumps(keywords, ensure_ascii=False), language_name,
+        seed=seed, refinement=guidance, is_keywords=True,
+    )
+    try:
+        parsed = _parse_json_block(raw, "[", "]")
+        if not isinstance(parsed, list):
+            raise ValueError("keywords reply is not an array")
+        joined = ",".join(split_keywords(clean_translation(str(item), single_line=True) for item in parsed))
+        value = truncate_keywords(joined, max_length) if max_length else joined
+        validate_translation(
+            value,
+            field_label=field_label,
+            max_length=max_length,
+            min_length=options.get("min_length", 1),
+            single_line=True,
+            forbid_emoji=bool(options.get("forbid_emoji")),
+        )
+    except ValueError:
+        return translate_with_validation(
+            provider, text, language_name, max_length=max_length, seed=seed, refinement=refinement,
+            field_label=field_label, is_keywords=True, single_line=True, **options,
+        )
+    if cache is not None:
+        cache.set(cache_key, value)
+    return value
+
+
+def _parse_fields_response(raw: str) -> Dict[str, Any]:
+    """Extract the JSON object from a batched reply, tolerating code fences or chatter."""
+    data = _parse_json_block(raw, "{", "}")
+    if not isinstance(data, dict):
+        raise ValueError("batched translation did not return a JSON object")
+    return data
+
+
+def _fields_schema(fields: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """JSON Schema of a batched reply: every key required, keywords as an array of strings."""
+    properties = {
+        key: {"type": "array", "items": {"type": "string"}} if spec.get("is_keywords") else {"type": "string"}
+        for key, spec in fields.items()
+    }
+    return {"type": "object", "properties": properties, "required": list(fields), "additionalProperties": False}
+
+
+def structured_output_tokens(fields: Dict[str, Dict[str, Any]]) -> int:
+    """Output token budget for one batched reply: each field's store limit, or twice its source length."""
+    total = STRUCTURED_TOKENS_OVERHEAD
+    for spec in fields.values():
+        chars = 2 * len(spec["text"]) + 20
+        if spec.get("max_length"):
+            chars = min(chars, spec["max_length"])
+        total += chars * STRUCTURED_TOKENS_PER_CHAR + 16
+    return total
+
+
+def _log_batch_fallback(provider, language_name: str, keys, reason: str) -> None:
+    try:
+        provider_name = provider.get_name()
+    except Exception:
+        provider_name = type(provider).__name__
+    log_ai_error(
+        provider_name,
+        "Batched translation fell back to per-field calls",
+        {"language": language_name, "fields": list(keys), "reason": reason},
+    )
+
+
+def translate_fields_with_validation(
+    provider,
+    fields: Dict[str, Dict[str, Any]],
+    language_name: str,
+    *,
+    seed,
+    refinement: str = "",
+) -> Dict[str, str]:
+    """Translate several fields of one locale with a single provider call.
+
+    `fields` maps an output key to the keyword arguments of
+    `translate_with_validation` plus the source under "text", e.g.
+    ``{"description": {"text": ..., "max_length": 4000, "field_label": "App description"}}``.
+    The source fields are sent as one JSON object and the model must answer with
+    the same keys, so prompt overhead and request count are paid once per locale.
+    Providers with a structured-output mode (``translate_json``) answer against a
+    JSON schema with an output budget sized from the fields' limits; when that
+    budget exceeds what the model allows, the fields are translated one by one.
+    Every returned value goes through the same cleaning and validation as a
+    single-field translation; keys that are missing or invalid fall back to
+    `translate_with_validation`. A truncated or unparseable reply is logged and
+    falls back the same way, while provider errors (HTTP 401/429, ...) are raised.
+    Fields already in the translation cache are not sent at all. Set
+    TRANSLATER_BATCH_FIELDS=0 to always use per-field calls.
+    """
+    from utils import parallel_map_fields, split_keywords, truncate_keywords
+
+    def _single(key: str):
+        spec = dict(fields[key])
+        text = spec.pop("text")
+        translate_fn = translate_keywords_with_validation if spec.get("is_keywords") else translate_with_validation
+        return lambda: translate_fn(
+            provider, text, language_name, seed=seed, refinement=refinement, **spec
+        )
+
+    results: Dict[str, str] = {}
+    cache = get_translation_cache()
+    cache_keys: Dict[str, str] = {}
+    if cache is not None:
+        for key, spec in fields.items():
+            options = {k: v for k, v in spec.items() if k != "text"}
+            cache_keys[key] = field_cache_key(provider, spec["text"], language_name, refinement=refinement, **options)
+            cached = cache.get(cache_keys[key])
+            if cached is not None:
+                results[key] = cached
+    pending = {key: spec for key, spec in fields.items() if key not in results}
+
+    batch_enabled = (os.environ.get("TRANSLATER_BATCH_FIELDS", "1") or "1").strip().lower() not in ("0", "false", "no", "off")
+    if len(pending) < 2 or not batch_enabled:
+        results.update(parallel_map_fields({key: _single(key) for key in pending}))
+        return {key: results[key] for key in fields}
+
+    # Keywords travel as a JSON array of terms rather than one comma-joined string
+    source = {
+        key: split_keywords(spec["text"]) if spec.get("is_keywords") else spec["text"]
+        for key, spec in pending.items()
+    }
+    rules = []
+    for key, spec in pending.items():
+        rule = f'"{key}" ({spec.get("field_label", key)})'
+        if spec.get("max_length") is not None:
+            rule += f" at most {spec['max_length']} characters"
+        if spec.get("is_keywords"):
+            rule += " once joined with commas, a JSON array of translated keywords"
+        if spec.get("single_line"):
+            rule += ", one line"
+        rules.append(rule)
+    strict_guidance = (
+        f"MANDATORY OUTPUT CONTRACT — batched App Store metadata. The input is a JSON object whose "
+        f"values are App Store metadata fields. Translate every value into {language_name} and return "
+        f"ONLY a JSON object with exactly the same keys, no code fences or explanation. Limits: "
+        f"{'; '.join(rules)}. Preserve meaningful line breaks inside values as \\n, brand names, URLs, "
+        f"numbers, and placeholders such as {{var}}, %d, and %@. Do not add markup."
+    )
+    guidance = " ".join(part for part in (refinement, strict_guidance) if part)
+
+    parsed: Dict[str, Any] = {}
+    cap = provider.structured_output_cap() if callable(getattr(provider, "structured_output_cap", None)) else None
+    if cap is not None:
+        budget = structured_output_tokens(pending)
+        if budget > cap:
+            reason = f"needs {budget} output tokens, model allows {cap}" if cap else "model has no JSON mode"
+            _log_batch_fallback(provider, language_name, pending, reason)
+        else:
+            try:
+                parsed = provider.translate_json(
+                    source, language_name, schema=_fields_schema(pending),
+                    instructions=guidance, max_output_tokens=budget, seed=seed,
+                )
+            except ValueError as error:
+                _log_batch_fallback(provider, language_name, pending, str(error))
+    else:
+        raw = provider.translate(json.dumps(source, ensure_ascii=False), language_name, seed=seed, refinement=guidance)
+        try:
+            parsed = _parse_fields_response(raw)
+        except ValueError as error:
+            _log_batch_fallback(provider, language_name, pending, str(error))
+
+    for key, spec in pending.items():
+        value = parsed.get(key)
+        if spec.get("is_keywords") and isinstance(value, list):
+            value = ",".join(split_keywords(clean_translation(str(item), single_line=True) for item in value))
+            if spec.get("max_length"):
+                value = truncate_keywords(value, spec["max_length"])
+        if not isinstance(value, str):
+            continue
+        value = clean_translation(value, single_line=bool(spec.get("single_line")))
+        try:
+            validate_translation(
+                value,
+                field_label=spec.get("field_label", "App Store metadata field"),
+                max_length=spec.get("max_length"),
+                min_length=spec.get("min_length", 1),
+                single_line=bool(spec.get("single_line")),
+                forbid_emoji=bool(spec.get("forbid_emoji")),
+            )
+        except ValueError:
+            continue
+        results[key] = value
+        if cache is not None:
+            cache.set(cache_keys[key], value)
+
+    missing = [key for key in fields if key not in results]
+    if missing:
+        results.update(parallel_map_fields({key: _single(key) for key in missing}))
+    return {key: results[key] for key in fields}
@@ -5,21 +5,83 @@ Provides InquirerPy-based selectors and fallbacks, plus common pickers
 like the App selector. Designed for reuse across workflows.
 """
 
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Tuple
 import os
 import sys
 import tempfile
+import time
 import shlex
 import subprocess
 import platform
+from concurrent.futures import ThreadPoolExecutor
 
 
 class UI:
+    # How long the apps list is reused across app pickers (seconds)
+    _APPS_TTL = 60
+
     def __init__(self):
         self._last_tui_reason: Optional[str] = None
+        # Result of the TTY/env/InquirerPy probe; fixed for the life of the process
+        self._tui_available_cached: Optional[bool] = None
+        # InquirerPy's `inquirer` module, imported on first successful use
+        self._inquirer: Any = None
+        # (client id, cursor or listing key) -> (fetched_at, response), see _get_apps_cached
+        self._apps_cache: Dict[Tuple[int, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+
+    # --- Apps list cache ---
+    def _get_apps_cached(self, asc_client, fetch, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Return `fetch()` for this client/cursor, reusing a response younger than _APPS_TTL."""
+        key = (id(asc_client), cursor)
+        cached = self._apps_cache.get(key)
+        now = time.monotonic()
+        if cached and now - cached[0] < self._APPS_TTL:
+            return cached[1]
+        response = fetch()
+        self._apps_cache[key] = (now, response)
+        return response
+
+    def list_apps(self, asc_client) -> Dict[str, Any]:
+        """Full apps list (up to 200), fetched once per _APPS_TTL and shared by all callers."""
+        return self._get_apps_cached(asc_client, lambda: asc_client.get_apps(limit=200), cursor="__all__")
+
+    def _get_apps_page_cached(self, asc_client, page_size: int, cursor: Optional[str]) -> Dict[str, Any]:
+        """One page of the fallback app pager, through the same cache."""
+        return self._get_apps_cached(
+            asc_client,
+            lambda: asc_client.get_apps_page(limit=page_size, cursor=cursor),
+            cursor=cursor,
+        )
+
+    def app_name(self, asc_client, app_id: str, default: str = "Unknown App") -> str:
+        """Name of `app_id` from the cached apps list (shared with the app picker)."""
+        try:
+            response = self.list_apps(asc_client)
+        except Exception:
+            return default
+        apps_by_id = {app.get("id"): app for app in response.get("data", [])}
+        return (apps_by_id.get(app_id) or {}).get("attributes", {}).get("name") or default
+
+    def list_app_versions(self, asc_client, app_id: str) -> Dict[str, Any]:
+        """App Store versions of `app_id` (newest first), shared by the platform pickers."""
+        return self._get_apps_cached(
+            asc_client,
+            lambda: asc_client._request("GET", f"apps/{app_id}/appStoreVersions"),
+            cursor=f"versions:{app_id}",
+        )
+
+    def invalidate_apps_cache(self) -> None:
+        """Forget cached app lists (e.g. after App Store Connect credentials change)."""
+        self._apps_cache.clear()
 
     # --- TUI primitives ---
     def available(self) -> bool:
+        if self._tui_available_cached is None:
+            self._tui_available_cached = self._probe_tui()
+        return self._tui_available_cached
+
+    @staticmethod
+    def _probe_tui() -> bool:
         if os.environ.get("TRANSLATER_NO_TUI"):
             return False
         if not sys.stdin.isatty() or not sys.stdout.isatty():
@@ -30,10 +92,19 @@ class UI:
         except Exception:
             return False
 
+    def _get_inquirer(self) -> Any:
+        """InquirerPy's `inquirer`, imported once per UI; None when it is not installed."""
+        if self._inquirer is None:
+            try:
+                from InquirerPy import inquirer
+            except Exception:
+                return None
+            self._inquirer = inquirer
+        return self._inquirer
+
     def select(self, message: str, choices: List[dict], add_back: bool = False) -> Optional[str]:
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             if add_back:
@@ -49,9 +120,8 @@ class UI:
             return None
 
     def checkbox(self, message: str, choices: List[dict], add_back: bool = False) -> Optional[List[str]]:
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             if add_back:
@@ -69,9 +139,8 @@ class UI:
             return None
 
     def confirm(self, message: str, default: bool = True) -> Optional[bool]:
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             return bool(inquirer.confirm(message=message, default=default).execute())
@@ -79,9 +148,8 @@ class UI:
             return None
 
     def text(self, message: str) -> Optional[str]:
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             return inquirer.text(message=message).execute()
@@ -89,9 +157,8 @@ class UI:
             return None
 
     def editor(self, message: str, default: str = "") -> Optional[str]:
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             return inquirer.editor(message=message, default=default).execute()
@@ -168,11 +235,20 @@ class UI:
             print("-" * 40)
         print("Enter text. Finish with a line containing only 'EOF'.")
         lines: List[str] = []  # type: ignore
+        # A terminal keeps input()'s line editing; piped text is read line by line directly
+        stdin = sys.stdin
+        interactive = stdin.isatty()
         while True:
-            try:
-                line = input()
-            except EOFError:
-                break
+            if interactive:
+                try:
+                    line = input()
+                except EOFError:
+                    break
+            else:
+                line = stdin.readline()
+                if not line:
+                    break
+                line = line[:-1] if line.endswith("\n") else line
             if line.strip() == 'EOF':
                 break
             lines.append(line)
@@ -182,16 +258,15 @@ class UI:
     # --- App picker ---
     def _fuzzy_app_picker(self, apps: List[Dict[str, Any]]) -> Optional[str]:
         # Fuzzy prompt without back to avoid accidental cancel selections
-        try:
-            from InquirerPy import inquirer
-        except Exception:
+        inquirer = self._get_inquirer()
+        if inquirer is None:
             return None
         try:
             choices: List[dict] = [
                 {"name": "Paste App ID manually...", "value": "__manual__"},
             ]
             for app in apps:
-                attrs = app.get("attributes", {})
+                attrs = app.get("attributes") or {}
                 name = attrs.get("name", "<unknown>")
                 bundle_id = attrs.get("bundleId", "")
                 label = name if not bundle_id else f"{name}  [{bundle_id}]"
@@ -210,7 +285,7 @@ class UI:
         # Try TUI fuzzy first
         if self.available():
             try:
-                response = asc_client.get_apps(limit=200)
+                response = self.list_apps(asc_client)
                 apps = response.get("data", [])
             except Exception as e:
                 self._last_tui_reason = f"failed to fetch apps list: {e}"
@@ -225,15 +300,21 @@ class UI:
         pages: List[Dict[str, Any]] = []
         page_index = 0
         cursor: Optional[str] = None
+        # Fetches the next page while the user reads the current one
+        prefetcher = ThreadPoolExecutor(max_workers=1)
         try:
             while True:
                 if page_index >= len(pages):
-                    resp = asc_client.get_apps_page(limit=page_size, cursor=cursor)
+                    prefetch = pages[-1].get("prefetch") if pages else None
+                    if prefetch is not None:
+                        resp = prefetch.result()
+                    else:
+                        resp = self._get_apps_page_cached(asc_client, page_size, cursor)
                     data = resp.get("data", [])
                     next_cursor = resp.get("next_cursor")
                     items = []
                     for app in data:
-                        attrs = app.get("attributes", {})
+                        attrs = app.get("attributes") or {}
                         name = attrs.get("name", "<unknown>")
                         bundle_id = attrs.get("bundleId", "")
                         items.append((app.get("id"), name, bundle_id))
@@ -243,6 +324,10 @@ class UI:
                         app_id = input("Enter your App ID: ").strip()
                         return app_id or None
                 current = pages[page_index]
+                if current.get("next_cursor") and "prefetch" not in current and page_index + 1 == len(pages):
+                    current["prefetch"] = prefetcher.submit(
+                        self._get_apps_page_cached, asc_client, page_size, current["next_cursor"]
+                    )
                 items = current["items"]
                 total_on_page = len(items)
                 print()
@@ -285,3 +370,5 @@ class UI:
             print(f"Could not fetch apps list: {e}")
             app_id = input("Enter your App ID: ").strip()
             return app_id or None
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
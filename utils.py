@@ -5,18 +5,23 @@ Common helper functions used throughout the application.
 """
 
 import os
+import re
 import sys
+import threading
 import time
+from bisect import bisect_right
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import accumulate
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 
 # App Store locale codes used by this CLI for App Store metadata localizations.
 # Some newer ASC UI languages require region-qualified codes in the API
-# (for example Slovenian uses `sl-SI`, not bare `sl`).
-APP_STORE_LOCALES = {
+# (for example Slovenian uses `sl-SI`, not bare `sl`). Read-only.
+APP_STORE_LOCALES = MappingProxyType({
     "ar-SA": "Arabic",
     "bn-BD": "Bangla",
     "ca": "Catalan",
@@ -67,10 +72,10 @@ APP_STORE_LOCALES = {
     "uk": "Ukrainian",
     "ur-PK": "Urdu",
     "vi": "Vietnamese",
-}
+})
 
-# Character limits for App Store fields
-FIELD_LIMITS = {
+# Character limits for App Store fields (read-only)
+FIELD_LIMITS = MappingProxyType({
     "name": 30,
     "subtitle": 30,
     "description": 4000,
@@ -100,7 +105,35 @@ FIELD_LIMITS = {
     "game_center_activity_description": 200,
     "game_center_challenge_name": 30,
     "game_center_challenge_description": 200,
-}
+})
+
+
+# Leading whitespace, or trailing whitespace and periods, of a keyword (list)
+_KEYWORDS_EDGES = re.compile(r"^\s+|[\s.]+$")
+
+
+def split_keywords(keywords) -> List[str]:
+    """
+    Split keywords into a clean list: trimmed, non-empty, de-duplicated (case-insensitive).
+    
+    Args:
+        keywords: Comma-separated keywords string, or an iterable of keywords
+        
+    Returns:
+        Keywords in their original order
+    """
+    if not keywords:
+        return []
+    items = keywords.split(',') if isinstance(keywords, str) else keywords
+    seen = set()
+    result: List[str] = []
+    for item in items:
+        keyword = _KEYWORDS_EDGES.sub("", str(item))
+        if not keyword or keyword.lower() in seen:
+            continue
+        seen.add(keyword.lower())
+        result.append(keyword)
+    return result
 
 
 def truncate_keywords(keywords: str, max_length: int = 100) -> str:
@@ -116,34 +149,18 @@ def truncate_keywords(keywords: str, max_length: int = 100) -> str:
     """
     if not keywords:
         return keywords
-        
-    # Clean input: remove trailing periods, extra spaces
-    keywords = keywords.strip().rstrip('.')
-    
-    if len(keywords) <= max_length:
-        # Still format properly even if under limit
-        keyword_list = [k.strip() for k in keywords.split(',')]
-        return ','.join(keyword_list)
-    
-    keyword_list = [k.strip() for k in keywords.split(',')]
-    truncated_keywords = []
-    current_length = 0
-    
-    for keyword in keyword_list:
-        # Skip empty keywords
-        if not keyword:
-            continue
-            
-        # Calculate length including comma separator (no space for ASO optimization)
-        new_length = current_length + len(keyword) + (1 if truncated_keywords else 0)
-        
-        if new_length <= max_length:
-            truncated_keywords.append(keyword)
-            current_length = new_length
-        else:
-            break
-    
-    return ','.join(truncated_keywords)
+
+    if ',' not in keywords:
+        # Single keyword: no split needed; it either fits whole or is dropped
+        keyword = _KEYWORDS_EDGES.sub("", keywords)
+        return keyword if len(keyword) <= max_length else ""
+
+    # Trim the ends (and a trailing period), then keep the longest prefix of
+    # whole keywords that fits, counting one comma between them (no spaces for ASO)
+    parts = [kw for kw in (part.strip() for part in _KEYWORDS_EDGES.sub("", keywords).split(',')) if kw]
+    # Length of the first n keywords joined, plus one: running sums of len + 1
+    joined_lengths = list(accumulate(len(kw) + 1 for kw in parts))
+    return ','.join(parts[:bisect_right(joined_lengths, max_length + 1)])
 
 
 def validate_field_length(text: str, field_name: str) -> bool:
@@ -177,6 +194,10 @@ def get_field_limit(field_name: str) -> Optional[int]:
     return FIELD_LIMITS.get(field_name)
 
 
+# Preferred base languages, in order
+BASE_LANGUAGE_PREFERENCE = ("en-US", "en-GB", "en-CA", "en-AU")
+
+
 def detect_base_language(localizations: List[Dict]) -> Optional[str]:
     """
     Detect base language from existing localizations.
@@ -191,22 +212,32 @@ def detect_base_language(localizations: List[Dict]) -> Optional[str]:
     if not localizations:
         return None
     
-    # Preferred base languages in order
-    preferred_locales = ["en-US", "en-GB", "en-CA", "en-AU"]
-    
-    # Extract locale codes from localizations
-    available_locales = [loc.get("attributes", {}).get("locale") for loc in localizations]
-    available_locales = [loc for loc in available_locales if loc]
-    
+    # Extract locale codes once, keeping API order for the fallback
+    available_locales = [
+        locale for locale in ((loc.get("attributes") or {}).get("locale") for loc in localizations) if locale
+    ]
+    available_set = set(available_locales)
+
     # Try preferred locales first
-    for locale in preferred_locales:
-        if locale in available_locales:
+    for locale in BASE_LANGUAGE_PREFERENCE:
+        if locale in available_set:
             return locale
-    
+
     # Return first available locale
     return available_locales[0] if available_locales else None
 
 
+# Minimum seconds between progress line redraws (the final state is always drawn)
+PROGRESS_REDRAW_INTERVAL = 0.1
+
+
+_PROGRESS_BAR_LENGTH = 20
+# Every possible bar, indexed by filled cells (0.._PROGRESS_BAR_LENGTH)
+_PROGRESS_BARS = tuple(
+    '█' * filled + '░' * (_PROGRESS_BAR_LENGTH - filled) for filled in range(_PROGRESS_BAR_LENGTH + 1)
+)
+
+
 def format_progress(current: int, total: int, operation: str = "") -> str:
     """
     Format progress message for display.
@@ -220,13 +251,64 @@ def format_progress(current: int, total: int, operation: str = "") -> str:
         Formatted progress string
     """
     percentage = int((current / total) * 100) if total > 0 else 0
-    bar_length = 20
-    filled_length = int(bar_length * current // total) if total > 0 else 0
-    bar = '█' * filled_length + '░' * (bar_length - filled_length)
+    filled_length = int(_PROGRESS_BAR_LENGTH * current // total) if total > 0 else 0
+    bar = _PROGRESS_BARS[min(max(filled_length, 0), _PROGRESS_BAR_LENGTH)]
     
     return f"[{bar}] {percentage}% ({current}/{total}) {operation}"
 
 
+class ProgressLine:
+    """
+    Single in-place progress line for per-locale loops.
+
+    Redraws are coalesced to at most one every PROGRESS_REDRAW_INTERVAL
+    seconds (the first and final states are always drawn), so long loops
+    don't pay a write and flush per item. Display errors are swallowed:
+    progress output is cosmetic and must never interrupt a workflow.
+    """
+
+    def __init__(self, total: int, label: str = ""):
+        self.total = total
+        self.completed = 0
+        self._last_len = 0
+        self._last_draw = 0.0
+        self._draw(label, force=True)
+
+    def advance(self, label: str = "") -> None:
+        """Count one finished item and redraw if due."""
+        self.completed += 1
+        self._draw(label, force=self.completed >= self.total)
+
+    def clear(self) -> None:
+        """Blank the line so following output starts clean."""
+        try:
+            sys.stdout.write("\r" + (" " * self._last_len) + "\r")
+            sys.stdout.flush()
+        except Exception:
+            pass
+
+    def _draw(self, label: str, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_draw < PROGRESS_REDRAW_INTERVAL:
+            return
+        self._last_draw = now
+        try:
+            line = format_progress(self.completed, self.total, label)
+        except Exception:
+            return
+        try:
+            pad = max(0, self._last_len - len(line))
+            sys.stdout.write("\r" + line + (" " * pad))
+            sys.stdout.flush()
+            self._last_len = len(line)
+        except Exception:
+            # No usable terminal: fall back to plain lines
+            try:
+                print(line)
+            except Exception:
+                pass
+
+
 # --------------------------
 # Translation helpers (shared)
 # --------------------------
@@ -283,6 +365,38 @@ def show_provider_and_source(
         print(source_text)
 
 
+# HTTP statuses that mean every further request will fail the same way
+FAIL_FAST_STATUSES = frozenset({401, 402, 403, 429})
+FAIL_FAST_AFTER_DEFAULT = 3
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, str(default)) or default)
+    except Exception:
+        return default
+
+
+def _fatal_http_status(error: Exception) -> Optional[int]:
+    """The HTTP status of `error` when it is an account-level failure (auth, billing, quota)."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if status in FAIL_FAST_STATUSES else None
+
+
+def locale_worker_count(
+    concurrency_env_var: str = "TRANSLATER_CONCURRENCY",
+    default_workers: Optional[int] = None,
+) -> int:
+    """Worker count for `parallel_map_locales`: the env var, else `default_workers`, else the CPU count."""
+    cpu_default = os.cpu_count() or 4
+    base_default = default_workers if isinstance(default_workers, int) and default_workers > 0 else cpu_default
+    try:
+        env_val = os.environ.get(concurrency_env_var, str(base_default)) or str(base_default)
+        return max(1, int(env_val))
+    except Exception:
+        return base_default
+
+
 def parallel_map_locales(
     target_locales: List[str],
     task_fn,
@@ -301,6 +415,10 @@ def parallel_map_locales(
         default_workers: Default max workers if env not set.
         pacing_seconds: Optional sleep per task after completion (to ease rate limits).
 
+    After TRANSLATER_FAIL_FAST_AFTER (default 3) consecutive failures with the
+    same auth/billing/quota HTTP status, locales that have not started yet are
+    skipped and reported as errors.
+
     Returns:
         (results_by_locale, errors_by_locale)
     """
@@ -323,12 +441,35 @@ def parallel_map_locales(
     if total == 0:
         return results, errors
 
+    # Circuit breaker: after N consecutive failures with the same account-level
+    # HTTP status (bad key, exhausted quota) the remaining locales are skipped
+    # instead of each paying for the same failure.
+    fail_fast_after = _env_int("TRANSLATER_FAIL_FAST_AFTER", FAIL_FAST_AFTER_DEFAULT)
+    tripped = threading.Event()
+    streak_lock = threading.Lock()
+    streak = {"status": None, "count": 0}
+    skipped_error = "skipped after repeated provider/API failures"
+
+    def _record_outcome(status: Optional[int]) -> None:
+        # Runs in the worker so the breaker trips before it picks up the next locale
+        with streak_lock:
+            if status is not None and status == streak["status"]:
+                streak["count"] += 1
+            else:
+                streak["status"], streak["count"] = status, (1 if status is not None else 0)
+            if fail_fast_after > 0 and streak["count"] >= fail_fast_after:
+                tripped.set()
+
     # Wrap the task to apply pacing
     def _runner(loc: str):
+        if tripped.is_set():
+            return (loc, None, skipped_error)
         try:
             val = task_fn(loc)
+            _record_outcome(None)
             return (loc, val, None)
         except Exception as e:  # noqa: BLE001
+            _record_outcome(_fatal_http_status(e))
             return (loc, None, str(e))
         finally:
             if pacing_seconds and pacing_seconds > 0:
@@ -337,29 +478,11 @@ def parallel_map_locales(
                 except Exception:
                     pass
 
-    # Resolve concurrency
-    # Determine default worker count: CPU count if not provided
-    cpu_default = os.cpu_count() or 4
-    base_default = default_workers if isinstance(default_workers, int) and default_workers > 0 else cpu_default
-    try:
-        env_val = os.environ.get(concurrency_env_var, str(base_default)) or str(base_default)
-        max_workers = max(1, min(total, int(env_val)))
-    except Exception:
-        max_workers = min(total, base_default)
+    max_workers = min(total, locale_worker_count(concurrency_env_var, default_workers))
 
-    completed = 0
     # Show initial 0/x progress so users see activity immediately
-    last_len = 0
-    try:
-        line = format_progress(0, total, f"{progress_action}...")
-        sys.stdout.write("\r" + line)
-        sys.stdout.flush()
-        last_len = len(line)
-    except Exception:
-        try:
-            print(format_progress(0, total, f"{progress_action}..."))
-        except Exception:
-            pass
+    progress = ProgressLine(total, f"{progress_action}...")
+    announced = False
     with ThreadPoolExecutor(max_workers=max_workers) as ex:
         future_map = {ex.submit(_runner, loc): loc for loc in target_locales}
         for fut in as_completed(future_map):
@@ -370,30 +493,64 @@ def parallel_map_locales(
             except Exception as e:  # shouldn't happen with wrapper, but safety
                 val, err = None, str(e)
             if err:
-                print_error(f"  ❌ {progress_action} {language} failed: {err}")
+                if err != skipped_error:
+                    print_error(f"  ❌ {progress_action} {language} failed: {err}")
                 errors[loc] = err
             else:
                 results[loc] = val
-            completed += 1
-            # Progress update
-            try:
-                line = format_progress(completed, total, f"{progress_action} {language}")
-                pad = max(0, last_len - len(line))
-                sys.stdout.write("\r" + line + (" " * pad))
-                sys.stdout.flush()
-                last_len = len(line)
-            except Exception:
-                print(format_progress(completed, total, f"{progress_action} {language}"))
-    # Clear progress line
-    try:
-        sys.stdout.write("\r" + (" " * last_len) + "\r")
-        sys.stdout.flush()
-    except Exception:
-        pass
+            if tripped.is_set() and not announced:
+                announced = True
+                print_error(
+                    f"  ❌ Repeated HTTP {streak['status']} failures; skipping the remaining locales "
+                    "(set TRANSLATER_FAIL_FAST_AFTER=0 to disable)"
+                )
+            # Coalesced so fast providers don't flood the terminal
+            progress.advance(f"{progress_action} {language}")
+    progress.clear()
     print()
     return results, errors
 
 
+def parallel_map_fields(
+    field_tasks: Dict[str, Any],
+    concurrency_env_var: str = "TRANSLATER_FIELD_CONCURRENCY",
+    default_workers: int = 4,
+) -> Dict[str, Any]:
+    """Run independent per-field tasks of a single locale concurrently.
+
+    Used inside a `parallel_map_locales` task so the fields of one locale
+    (description, keywords, ...) are translated side by side instead of one
+    after another. Set the env var to 1 to fall back to sequential calls.
+
+    Args:
+        field_tasks: Ordered mapping of field key -> zero-argument callable.
+        concurrency_env_var: Env var name to override the worker count.
+        default_workers: Worker count when the env var is unset or invalid.
+
+    Returns:
+        Dict of field key -> task result, in the order of `field_tasks`.
+
+    Raises:
+        The first exception (in field order) raised by any task, so callers
+        keep the all-or-nothing per-locale semantics of sequential code.
+    """
+    if not field_tasks:
+        return {}
+    try:
+        env_val = os.environ.get(concurrency_env_var, str(default_workers)) or str(default_workers)
+        max_workers = max(1, min(len(field_tasks), int(env_val)))
+    except Exception:
+        max_workers = max(1, min(len(field_tasks), default_workers))
+
+    if max_workers == 1:
+        return {key: fn() for key, fn in field_tasks.items()}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {key: ex.submit(fn) for key, fn in field_tasks.items()}
+        # Resolve in submission order so the first failing field wins
+        return {key: fut.result() for key, fut in futures.items()}
+
+
 # --------------------------
 # Prompt refinement helpers
 # --------------------------
@@ -485,6 +642,44 @@ def print_info(message: str):
     print(f"ℹ️  {message}")
 
 
+def print_translation_previews(previews: List[Tuple[str, str]]) -> None:
+    """Print a framed preview block per (locale, text) pair in a single write.
+
+    Building the whole preview first avoids half a dozen print calls per
+    locale; empty texts get the usual warning line inside their block.
+    """
+    rule = "-" * 60
+    parts: List[str] = []
+    for loc, text in previews:
+        language = APP_STORE_LOCALES.get(loc, loc)
+        parts.extend([rule, f"{language} [{loc}]", rule, text or ""])
+        if not (text or "").strip():
+            parts.append(f"⚠️  Empty translation for {language} [{loc}]")
+        parts.append("")
+    if parts:
+        print("\n".join(parts))
+
+
+def pause_for_enter(message: str = "\nPress Enter to continue...") -> None:
+    """Wait for Enter on an interactive terminal; return at once when scripted."""
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        input(message)
+
+
+# Characters dropped from export file names: keep alphanumerics, "-" and "_" (plus "." in versions)
+_EXPORT_NAME_DROP = re.compile(r"[^\w-]")
+_EXPORT_VERSION_DROP = re.compile(r"[^\w.-]")
+# Export lines per localization, as (label, attribute), in file order
+_EXPORT_FIELDS = (
+    ("Name", "name"),
+    ("Subtitle", "subtitle"),
+    ("Description", "description"),
+    ("Keywords", "keywords"),
+    ("Promotional Text", "promotionalText"),
+    ("What's New", "whatsNew"),
+)
+
+
 def export_existing_localizations(localizations_data: List[Dict[str, Any]], app_name: str = "Unknown App", app_id: str = "unknown", version_string: str = "unknown") -> str:
     """
     Export existing localizations to a timestamped file.
@@ -498,15 +693,17 @@ def export_existing_localizations(localizations_data: List[Dict[str, Any]], app_
     Returns:
         Path to the created export file
     """
-    timestamp = datetime.now().strftime("%d%m%Y_%H.%M")
+    # One clock read, so the file name and the Export Date line always agree
+    exported_at = datetime.now()
+    timestamp = exported_at.strftime("%d%m%Y_%H.%M")
     
     # Clean app name for filename (remove spaces, special characters)
-    clean_app_name = "".join(c.lower() for c in app_name if c.isalnum() or c in "-_")[:20]
+    clean_app_name = _EXPORT_NAME_DROP.sub("", app_name).lower()[:20]
     if not clean_app_name:
         clean_app_name = "unknown_app"
     
     # Clean version string for filename
-    clean_version = "".join(c for c in version_string if c.isalnum() or c in ".-_")
+    clean_version = _EXPORT_VERSION_DROP.sub("", version_string)
     if not clean_version or clean_version == "unknown":
         clean_version = "v_unknown"
     elif not clean_version.startswith('v'):
@@ -515,48 +712,30 @@ def export_existing_localizations(localizations_data: List[Dict[str, Any]], app_
     os.makedirs("existing_localizations", exist_ok=True)
     filename = f"existing_localizations/{clean_app_name}_{app_id}_{clean_version}_{timestamp}.txt"
     
+    out: List[str] = [
+        "=== EXISTING LOCALIZATIONS EXPORT ===\n",
+        f"App: {app_name}\n",
+        f"App ID: {app_id}\n",
+        f"Version: {version_string}\n",
+        f"Export Date: {exported_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+        f"Total Languages: {len(localizations_data)}\n",
+        "=" * 50 + "\n\n",
+    ]
+    for localization in localizations_data:
+        attributes = localization.get("attributes") or {}
+        locale = attributes.get("locale", "Unknown")
+        language_name = APP_STORE_LOCALES.get(locale, "Unknown Language")
+        out.append(f"{language_name} ({locale}):\n")
+        out.append("-" * 30 + "\n")
+        for label, key in _EXPORT_FIELDS:
+            value = attributes.get(key)
+            if value:
+                out.append(f"{label}: {value}\n")
+        out.append("\n")
+
+    # Build the whole export first, then write it in one call
     with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"=== EXISTING LOCALIZATIONS EXPORT ===\n")
-        f.write(f"App: {app_name}\n")
-        f.write(f"App ID: {app_id}\n")
-        f.write(f"Version: {version_string}\n")
-        f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Languages: {len(localizations_data)}\n")
-        f.write("=" * 50 + "\n\n")
-        
-        for localization in localizations_data:
-            attributes = localization.get("attributes", {})
-            locale = attributes.get("locale", "Unknown")
-            language_name = APP_STORE_LOCALES.get(locale, "Unknown Language")
-            
-            f.write(f"{language_name} ({locale}):\n")
-            f.write("-" * 30 + "\n")
-            
-            name = attributes.get("name")
-            if name:
-                f.write(f"Name: {name}\n")
-            
-            subtitle = attributes.get("subtitle") 
-            if subtitle:
-                f.write(f"Subtitle: {subtitle}\n")
-            
-            description = attributes.get("description")
-            if description:
-                f.write(f"Description: {description}\n")
-            
-            keywords = attributes.get("keywords")
-            if keywords:
-                f.write(f"Keywords: {keywords}\n")
-            
-            promotional_text = attributes.get("promotionalText")
-            if promotional_text:
-                f.write(f"Promotional Text: {promotional_text}\n")
-            
-            whats_new = attributes.get("whatsNew")
-            if whats_new:
-                f.write(f"What's New: {whats_new}\n")
-            
-            f.write("\n")
+        f.write("".join(out))
     
     return filename
 
@@ -5,7 +5,8 @@ from __future__ import annotations
 import time
 from typing import Callable, Dict
 
-from utils import APP_STORE_LOCALES, format_progress, print_error
+from app_store_client import ASCConflictError
+from utils import APP_STORE_LOCALES, ProgressLine, print_error
 
 
 def get_event_localizations_with_fallback(asc, event_id: str):
@@ -54,29 +55,8 @@ def save_app_event_localizations(
 ) -> int:
     """Persist translated app event localizations with 409 recovery behavior."""
 
-    total_targets = len(target_locales)
-    completed = 0
     saved = 0
-    last_progress_len = 0
-
-    def _render_progress(done: int, label: str) -> None:
-        nonlocal last_progress_len
-        try:
-            line = format_progress(done, total_targets, label)
-            pad = max(0, last_progress_len - len(line))
-            print("\r" + line + (" " * pad), end="")
-            last_progress_len = len(line)
-        except Exception as exc:
-            # Progress updates are cosmetic and should not interrupt localization saves.
-            debug(f"progress render failed: {exc!r}")
-
-    try:
-        line = format_progress(0, total_targets, "Saving locales...")
-        print(line, end="\r")
-        last_progress_len = len(line)
-    except Exception as exc:
-        # Initial progress paint is also best-effort.
-        debug(f"initial progress render failed: {exc!r}")
+    progress = ProgressLine(len(target_locales), "Saving locales...")
 
     def _refresh_locale_ids() -> Dict[str, str]:
         try:
@@ -113,7 +93,6 @@ def save_app_event_localizations(
                     long_description=data.get("longDescription"),
                 )
             else:
-                time.sleep(0.25)
                 asc.create_app_event_localization(
                     event_id,
                     locale,
@@ -124,13 +103,12 @@ def save_app_event_localizations(
                 _refresh_locale_ids()
 
             saved += 1
-            completed += 1
             saved_this_locale = True
             if loc_id:
                 existing_locale_ids[locale] = loc_id
-            _render_progress(completed, f"Saved {APP_STORE_LOCALES.get(locale, locale)}")
+            progress.advance(f"Saved {APP_STORE_LOCALES.get(locale, locale)}")
         except Exception as err:
-            if "409" in str(err) and not has_validation_error(err):
+            if isinstance(err, ASCConflictError) and not has_validation_error(err):
                 debug_http_error(f"409 while saving locale={locale}", err)
                 recovered = False
                 for attempt in range(4):
@@ -149,16 +127,12 @@ def save_app_event_localizations(
                                     long_description=data.get("longDescription"),
                                 )
                                 saved += 1
-                                completed += 1
                                 existing_locale_ids[locale] = new_id
-                                _render_progress(
-                                    completed,
-                                    f"Saved {APP_STORE_LOCALES.get(locale, locale)}",
-                                )
+                                progress.advance(f"Saved {APP_STORE_LOCALES.get(locale, locale)}")
                                 recovered = True
                                 break
                             except Exception as upd_err:
-                                if "409" in str(upd_err):
+                                if isinstance(upd_err, ASCConflictError):
                                     debug_http_error(
                                         f"409 while updating locale={locale} id={new_id}",
                                         upd_err,
@@ -178,12 +152,8 @@ def save_app_event_localizations(
                                             == data.get("longDescription")
                                         ):
                                             saved += 1
-                                            completed += 1
                                             existing_locale_ids[locale] = new_id
-                                            _render_progress(
-                                                completed,
-                                                f"Saved {APP_STORE_LOCALES.get(locale, locale)}",
-                                            )
+                                            progress.advance(f"Saved {APP_STORE_LOCALES.get(locale, locale)}")
                                             recovered = True
                                             break
                                     except Exception as fetch_err:
@@ -203,10 +173,6 @@ def save_app_event_localizations(
             debug_http_error(f"failed locale={locale}", err)
             print_error(f"  ❌ Failed to save {language_name}: {err}")
 
-    try:
-        print("\r" + (" " * last_progress_len) + "\r", end="")
-    except Exception as exc:
-        # Final terminal line clear is cosmetic.
-        debug(f"progress cleanup failed: {exc!r}")
+    progress.clear()
 
     return saved
@@ -5,7 +5,6 @@ Translates app event localization fields (name, shortDescription, longDescriptio
 to missing locales using the configured AI provider.
 """
 
-import time
 import os
 from typing import Dict, List, Optional
 
@@ -14,14 +13,16 @@ from utils import (
     APP_STORE_LOCALES,
     detect_base_language,
     get_field_limit,
+    parallel_map_fields,
     parallel_map_locales,
     print_error,
     print_info,
     print_success,
     print_warning,
     provider_model_info,
+    pause_for_enter,
 )
-from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, pick_locale_scope
+from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, index_by_locale, pick_locale_scope
 from workflows.app_events_helpers import (
     build_event_locale_id_map,
     get_event_localizations_with_fallback,
@@ -271,10 +272,7 @@ def run(cli) -> bool:
             print_error("Could not detect base locale for this event; skipping")
             continue
 
-        base_attrs = next(
-            (l.get("attributes", {}) for l in localizations if l.get("attributes", {}).get("locale") == base_locale),
-            {},
-        ) or {}
+        base_attrs = (index_by_locale(localizations).get(base_locale) or {}).get("attributes") or {}
         base_name = (base_attrs.get("name") or "").strip()
         base_short = (base_attrs.get("shortDescription") or "").strip()
         base_long = (base_attrs.get("longDescription") or "").strip()
@@ -305,14 +303,14 @@ def run(cli) -> bool:
         existing_minus_base = {k for k in existing_locale_ids.keys() if k and k != base_locale}
         missing = {k for k in supported_minus_base.keys() if k not in existing_locale_ids}
         if scope == "existing":
-            available_targets = {k: supported_minus_base[k] for k in sorted(existing_minus_base) if k in supported_minus_base}
             preferred = sorted(existing_minus_base)
+            available_targets = {k: supported_minus_base[k] for k in preferred if k in supported_minus_base}
         elif scope == "all":
             available_targets = supported_minus_base
             preferred = sorted(existing_minus_base)
         else:
             available_targets = {k: supported_minus_base[k] for k in sorted(missing) if k in supported_minus_base}
-            preferred = sorted(available_targets.keys())
+            preferred = list(available_targets)
 
         target_locales = choose_target_locales(
             ui,
@@ -328,39 +326,42 @@ def run(cli) -> bool:
 
         def _task(loc: str):
             language_name = APP_STORE_LOCALES.get(loc, loc)
-            name_t = _translate_with_min_len(
-                provider,
-                base_name,
-                language_name,
-                max_length=name_limit,
-                seed=seed,
-                refinement=refine_phrase,
-                min_len=1,
-                field_label="name",
-            )
-            short_t = _translate_with_min_len(
-                provider,
-                base_short,
-                language_name,
-                max_length=short_limit,
-                seed=seed,
-                refinement=refine_phrase,
-                min_len=1,
-                field_label="shortDescription",
-            )
-            long_t = _translate_with_min_len(
-                provider,
-                base_long,
-                language_name,
-                max_length=long_limit,
-                seed=seed,
-                refinement=refine_phrase,
-                min_len=2,
-                field_label="longDescription",
-            )
+            # Fields are independent: translate them side by side
+            fields = parallel_map_fields({
+                "name": lambda: _translate_with_min_len(
+                    provider,
+                    base_name,
+                    language_name,
+                    max_length=name_limit,
+                    seed=seed,
+                    refinement=refine_phrase,
+                    min_len=1,
+                    field_label="name",
+                ),
+                "shortDescription": lambda: _translate_with_min_len(
+                    provider,
+                    base_short,
+                    language_name,
+                    max_length=short_limit,
+                    seed=seed,
+                    refinement=refine_phrase,
+                    min_len=1,
+                    field_label="shortDescription",
+                ),
+                "longDescription": lambda: _translate_with_min_len(
+                    provider,
+                    base_long,
+                    language_name,
+                    max_length=long_limit,
+                    seed=seed,
+                    refinement=refine_phrase,
+                    min_len=2,
+                    field_label="longDescription",
+                ),
+            })
+            name_t, short_t, long_t = fields["name"], fields["shortDescription"], fields["longDescription"]
             long_t = _ensure_min_len(long_t, 2) or _ensure_min_len(short_t, 2) or _ensure_min_len(name_t, 2)
             translated = {"name": name_t, "shortDescription": short_t, "longDescription": long_t}
-            time.sleep(1)
             return translated
 
         results, errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
@@ -383,5 +384,5 @@ def run(cli) -> bool:
 
     print()
     print_success(f"In-app events translation finished. Localizations saved: {total_saved}")
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
@@ -4,11 +4,10 @@ Note: App Info is global at the app level (not per platform).
 """
 
 from typing import Dict
-import time
 
-from translation_validation import translate_with_validation
-from utils import APP_STORE_LOCALES, get_field_limit, print_info, print_warning, print_success, print_error, format_progress, parallel_map_locales, provider_model_info
-from workflows.helpers import pick_provider, choose_target_locales, pick_locale_scope
+from translation_validation import translate_fields_with_validation
+from utils import APP_STORE_LOCALES, get_field_limit, print_info, print_warning, print_success, print_error, parallel_map_locales, provider_model_info, pause_for_enter
+from workflows.helpers import pick_provider, choose_target_locales, index_by_locale, pick_locale_scope
 
 
 def run(cli) -> bool:
@@ -29,30 +28,16 @@ def run(cli) -> bool:
         return True
 
     existing_localizations = asc.get_app_info_localizations(app_info_id)
-    loc_map: Dict[str, str] = {}
-    for loc in existing_localizations.get("data", []):
-        loc_map[loc["attributes"]["locale"]] = loc["id"]
-
-    # Base localization
-    base_locale = None
-    base_name = ""
-    base_subtitle = ""
-    for loc in existing_localizations.get("data", []):
-        attrs = loc.get("attributes", {})
-        # Prefer en-US
-        if attrs.get("locale") == "en-US":
-            base_locale = "en-US"
-            base_id = loc["id"]
-            base_attrs = asc.get_app_info_localization(base_id).get("data", {}).get("attributes", {})
-            base_name = base_attrs.get("name", "")
-            base_subtitle = base_attrs.get("subtitle", "")
-            break
-    if not base_locale:
-        # Fallback to first
-        any_id = existing_localizations.get("data", [])[0]["id"]
-        base_attrs = asc.get_app_info_localization(any_id).get("data", {}).get("attributes", {})
-        base_name = base_attrs.get("name", "")
-        base_subtitle = base_attrs.get("subtitle", "")
+    # One pass: locale -> resource, reused for the base lookup and the save step
+    by_locale = index_by_locale(existing_localizations.get("data", []))
+    loc_map: Dict[str, str] = {locale: loc["id"] for locale, loc in by_locale.items()}
+
+    # Base localization: prefer en-US, else the first one
+    base_locale = "en-US" if "en-US" in by_locale else None
+    base_loc = by_locale.get("en-US") or existing_localizations.get("data", [])[0]
+    base_attrs = asc.get_app_info_localization(base_loc["id"]).get("data", {}).get("attributes", {})
+    base_name = base_attrs.get("name", "")
+    base_subtitle = base_attrs.get("subtitle", "")
 
     if not base_name and not base_subtitle:
         print_error("No name or subtitle found in base language")
@@ -68,14 +53,14 @@ def run(cli) -> bool:
     existing_minus_base = {loc for loc in loc_map.keys() if loc and loc != base_locale}
     missing = {loc for loc in supported_minus_base.keys() if loc not in loc_map}
     if scope == "existing":
-        available_targets = {loc: supported_minus_base[loc] for loc in sorted(existing_minus_base) if loc in supported_minus_base}
         preferred = sorted(existing_minus_base)
+        available_targets = {loc: supported_minus_base[loc] for loc in preferred if loc in supported_minus_base}
     elif scope == "all":
         available_targets = supported_minus_base
         preferred = sorted(existing_minus_base)
     else:
         available_targets = {loc: supported_minus_base[loc] for loc in sorted(missing) if loc in supported_minus_base}
-        preferred = sorted(available_targets.keys())
+        preferred = list(available_targets)
     target_locales = choose_target_locales(
         ui,
         available_targets,
@@ -100,19 +85,38 @@ def run(cli) -> bool:
     print_info(f"AI provider: {pname} — model: {pmodel or 'n/a'}{tier_txt} — seed: {seed}")
 
     print_info(f"Starting app name & subtitle translation for {len(target_locales)} languages...")
+    # Both fields in one structured request per locale (see translate_fields_with_validation)
+    field_specs = {}
+    if base_name:
+        field_specs["name"] = {
+            "text": base_name, "max_length": get_field_limit("name"),
+            "field_label": "App name", "single_line": True,
+        }
+    if base_subtitle:
+        field_specs["subtitle"] = {
+            "text": base_subtitle, "max_length": get_field_limit("subtitle"),
+            "field_label": "App subtitle", "single_line": True,
+        }
+
     def _task(loc: str):
         language_name = APP_STORE_LOCALES.get(loc, loc)
-        name_out = translate_with_validation(
-            provider, base_name, language_name, max_length=get_field_limit("name"), seed=seed,
-            refinement=refine_phrase, field_label="App name", single_line=True,
-        ) if base_name else None
-        subtitle_out = translate_with_validation(
-            provider, base_subtitle, language_name, max_length=get_field_limit("subtitle"), seed=seed,
-            refinement=refine_phrase, field_label="App subtitle", single_line=True,
-        ) if base_subtitle else None
-        time.sleep(1)
-        return {"name": name_out, "subtitle": subtitle_out}
+        translated = translate_fields_with_validation(
+            provider, field_specs, language_name, seed=seed, refinement=refine_phrase,
+        ) if field_specs else {}
+        data = {"name": translated.get("name"), "subtitle": translated.get("subtitle")}
+        # Save from the worker so ASC writes overlap with other locales' translations
+        try:
+            # Locales we already know about are updated directly; a create would only 409
+            if loc in loc_map:
+                asc.update_app_info_localization(loc_map[loc], data.get("name"), data.get("subtitle"))
+            else:
+                asc.create_app_info_localization(app_info_id, loc, data.get("name"), data.get("subtitle"))
+            saved.add(loc)
+        except Exception as e:
+            print_error(f"  ❌ Failed to save {language_name}: {str(e)}")
+        return data
 
+    saved = set()
     results, errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
     # Warn on empty translations per locale
@@ -124,15 +128,6 @@ def run(cli) -> bool:
         if not (name_ok or subtitle_ok):
             print_warning(f"Empty translation for {language_name} [{loc}]")
 
-    success = 0
-    for target_locale, data in results.items():
-        try:
-            asc.create_app_info_localization(app_info_id, target_locale, data.get("name"), data.get("subtitle"))
-            success += 1
-        except Exception as e:
-            language_name = APP_STORE_LOCALES.get(target_locale, target_locale)
-            print_error(f"  ❌ Failed to save {language_name}: {str(e)}")
-
-    print_success(f"App name & subtitle translation completed! {success}/{len(target_locales)} languages translated successfully")
-    input("\nPress Enter to continue...")
+    print_success(f"App name & subtitle translation completed! {len(saved)}/{len(target_locales)} languages translated successfully")
+    pause_for_enter()
     return True
@@ -3,14 +3,23 @@ Copy Mode workflow with per-platform selection.
 """
 
 from typing import Dict, List, Optional
-import sys
-import time
 
-from utils import APP_STORE_LOCALES, format_progress, print_info, print_warning, print_success, print_error
+from utils import parallel_map_locales, print_info, print_warning, print_success, print_error, pause_for_enter
+from workflows.helpers import fetch_platform_localizations
+
+
+# Sparse fieldset: the pickers only show platform, version and state
+VERSION_FIELDS = "platform,versionString,appStoreState"
+# Versions listed per platform when picking a source/target
+VERSION_PICK_LIMIT = 20
 
 
 def select_platforms(ui, asc_client, app_id: str) -> Optional[Dict[str, dict]]:
-    versions_response = asc_client._request("GET", f"apps/{app_id}/appStoreVersions")
+    versions_response = asc_client._request(
+        "GET",
+        f"apps/{app_id}/appStoreVersions",
+        params={"fields[appStoreVersions]": VERSION_FIELDS, "limit": 200},
+    )
     versions = versions_response.get("data", [])
     if not versions:
         print_error("No App Store versions found for this app")
@@ -38,21 +47,30 @@ def select_platforms(ui, asc_client, app_id: str) -> Optional[Dict[str, dict]]:
 
 
 def pick_version_for_platform(ui, asc_client, app_id: str, platform: str, prompt: str) -> Optional[dict]:
-    versions_response = asc_client._request("GET", f"apps/{app_id}/appStoreVersions")
+    # Filter server-side so only this platform's most recent versions are transferred
+    versions_response = asc_client._request(
+        "GET",
+        f"apps/{app_id}/appStoreVersions",
+        params={
+            "filter[platform]": platform,
+            "fields[appStoreVersions]": VERSION_FIELDS,
+            "limit": VERSION_PICK_LIMIT,
+        },
+    )
     versions = [v for v in versions_response.get("data", []) if v.get("attributes", {}).get("platform") == platform]
     if not versions:
         print_error(f"No versions found for platform {platform}")
         return None
     if ui.available():
         choices = []
-        for v in versions[:20]:
+        for v in versions[:VERSION_PICK_LIMIT]:
             a = v.get("attributes", {})
             choices.append({"name": f"{a.get('versionString','?')} ({a.get('appStoreState','?')})", "value": v})
         sel = ui.select(prompt, choices, add_back=True)
         return sel
     else:
         print(prompt)
-        for i, v in enumerate(versions[:20], 1):
+        for i, v in enumerate(versions[:VERSION_PICK_LIMIT], 1):
             a = v.get("attributes", {})
             print(f"{i}. {a.get('versionString','?')} ({a.get('appStoreState','?')})")
         raw = input("Select version (number): ").strip()
@@ -95,43 +113,31 @@ def run(cli) -> bool:
             continue
 
         print_info(f"Copying from {source['attributes'].get('versionString')} to {target['attributes'].get('versionString')} ({plat})")
-        # Determine locales in source
-        source_localizations = asc.get_app_store_version_localizations(source["id"]).get("data", [])
+        # Source and target localizations are independent reads; fetch them
+        # side by side once instead of twice per copied locale
+        fetched = fetch_platform_localizations(asc, {"source": source, "target": target})
+        source_localizations = fetched["source"]
+        target_localizations = fetched["target"]
         if not source_localizations:
             print_warning("No localizations found in source version")
             continue
         locales_to_copy: List[str] = [loc["attributes"]["locale"] for loc in source_localizations]
 
-        # Copy loop
-        success = 0
-        last_len = 0
+        def _task(locale: str) -> bool:
+            return asc.copy_localization_from_previous_version(
+                source["id"],
+                target["id"],
+                locale,
+                source_localizations=source_localizations,
+                target_localizations=target_localizations,
+            )
+
+        # Copies touch distinct localizations; the client's rate limiter paces them
+        results, _errors = parallel_map_locales(locales_to_copy, _task, progress_action=f"Copied ({plat})")
+        success = sum(1 for ok in results.values() if ok)
         total = len(locales_to_copy)
-        for i, locale in enumerate(locales_to_copy, 1):
-            language_name = APP_STORE_LOCALES.get(locale, "Unknown")
-            try:
-                line = format_progress(i, total, f"Copying {language_name} ({plat})")
-                pad = max(0, last_len - len(line))
-                sys.stdout.write("\r" + line + (" " * pad))
-                sys.stdout.flush()
-                last_len = len(line)
-            except Exception:
-                print(format_progress(i, total, f"Copying {language_name} ({plat})"))
-            try:
-                ok = asc.copy_localization_from_previous_version(source["id"], target["id"], locale)
-                if ok:
-                    success += 1
-                time.sleep(1)
-            except Exception as e:
-                print_error(f"  ❌ Error copying {language_name}: {str(e)}")
-                continue
-        try:
-            sys.stdout.write("\r" + (" " * last_len) + "\r")
-            sys.stdout.flush()
-        except Exception:
-            pass
-        print()
         print_success(f"{plat}: {success}/{total} localizations copied successfully")
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
 
@@ -2,24 +2,25 @@
 Export Localizations workflow with platform selection.
 """
 
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
-from utils import print_info, print_warning, print_success, export_existing_localizations
+from utils import print_info, print_warning, print_success, export_existing_localizations, pause_for_enter
+from workflows.helpers import fetch_app_versions, index_by_locale
 
 
 def select_platform(ui, asc, app_id: str) -> Dict[str, dict]:
-    versions_resp = asc._request("GET", f"apps/{app_id}/appStoreVersions")
-    versions = versions_resp.get("data", [])
+    versions = fetch_app_versions(ui, asc, app_id)
     latest_by_platform: Dict[str, dict] = {}
     for v in versions:
-        a = v.get("attributes", {})
+        a = v.get("attributes") or {}
         p = a.get("platform", "UNKNOWN")
         if p not in latest_by_platform:
             latest_by_platform[p] = v
     if ui.available():
         choices = []
         for plat, v in latest_by_platform.items():
-            a = v.get("attributes", {})
+            a = v.get("attributes") or {}
             choices.append({"name": f"{a.get('platform')} v{a.get('versionString')} ({a.get('appStoreState')})", "value": plat})
         sel = ui.select("Select platform to export", choices, add_back=True)
         return {sel: latest_by_platform[sel]} if sel else {}
@@ -27,6 +28,30 @@ def select_platform(ui, asc, app_id: str) -> Dict[str, dict]:
         return latest_by_platform
 
 
+def app_info_attrs_by_locale(asc, app_id: str) -> Dict[str, dict]:
+    """Primary app info localization attributes (name, subtitle) keyed by locale; {} when unavailable."""
+    try:
+        app_info_id = asc.find_primary_app_info_id(app_id)
+        if not app_info_id:
+            return {}
+        localizations = asc.get_app_info_localizations(app_info_id).get("data", [])
+    except Exception:
+        return {}
+    return {locale: loc.get("attributes") or {} for locale, loc in index_by_locale(localizations).items()}
+
+
+def with_app_info(version_localizations: List[dict], app_info_by_locale: Dict[str, dict]) -> List[dict]:
+    """Version localizations with the same locale's app name/subtitle merged into their attributes."""
+    merged = []
+    for loc in version_localizations:
+        attrs = loc.get("attributes") or {}
+        app_info = app_info_by_locale.get(attrs.get("locale")) or {}
+        overrides = {k: app_info[k] for k in ("name", "subtitle") if app_info.get(k)}
+        # Copy only when something is merged in; otherwise pass the resource through as is
+        merged.append({**loc, "attributes": {**attrs, **overrides}} if overrides else loc)
+    return merged
+
+
 def run(cli) -> bool:
     ui = cli.ui
     asc = cli.asc_client
@@ -44,19 +69,21 @@ def run(cli) -> bool:
         print_warning("No platform selected")
         return True
 
-    # App name for file
-    apps_response = asc.get_apps(limit=200)
-    app_name = "Unknown App"
-    for app in apps_response.get("data", []):
-        if app["id"] == app_id:
-            app_name = app.get("attributes", {}).get("name", "Unknown App")
-            break
-
-    for plat, ver in selected.items():
-        locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-        filename = export_existing_localizations(locs, app_name=app_name, app_id=app_id, version_string=ver.get("attributes", {}).get("versionString", "unknown"))
-        print_success(f"Exported {len(locs)} localizations to {filename}")
+    # Name/subtitle live on app info (fetched once, joined in by locale); that
+    # lookup is independent of the version localizations, so run it alongside
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        app_info_future = pool.submit(app_info_attrs_by_locale, asc, app_id)
+        # App name for file (usually already cached by the app picker)
+        app_name = ui.app_name(asc, app_id)
+        for plat, ver in selected.items():
+            version_locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
+            locs = with_app_info(version_locs, app_info_future.result())
+            filename = export_existing_localizations(locs, app_name=app_name, app_id=app_id, version_string=ver.get("attributes", {}).get("versionString", "unknown"))
+            print_success(f"Exported {len(locs)} localizations to {filename}")
+    finally:
+        pool.shutdown(wait=True)
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
 
@@ -3,15 +3,31 @@ Full Setup Mode: translate missing languages across selected platforms.
 """
 
 from typing import Dict
-import time
 
-from translation_validation import translate_with_validation
+from translation_validation import translate_fields_with_validation
 from utils import (
     APP_STORE_LOCALES, detect_base_language, get_field_limit, truncate_keywords,
-    print_info, print_warning, print_success, print_error, format_progress,
+    print_info, print_warning, print_success, print_error,
     parallel_map_locales, provider_model_info,
+    pause_for_enter,
+)
+from workflows.helpers import (
+    choose_target_locales,
+    fetch_platform_localizations,
+    index_by_locale,
+    pick_locale_scope,
+    pick_provider,
+    select_platform_versions,
+)
+
+
+# Translated fields as (ASC attribute, field limit key, label)
+SETUP_FIELDS = (
+    ("description", "description", "App description"),
+    ("keywords", "keywords", "App keywords"),
+    ("promotionalText", "promotional_text", "Promotional text"),
+    ("whatsNew", "whats_new", "What's New"),
 )
-from workflows.helpers import pick_provider, select_platform_versions, choose_target_locales, pick_locale_scope
 
 
 def run(cli) -> bool:
@@ -32,9 +48,9 @@ def run(cli) -> bool:
         print_warning("No platforms selected")
         return True
 
-    # Determine base and existing locales
-    first_ver = next(iter(selected.values()))
-    locs = asc.get_app_store_version_localizations(first_ver["id"]).get("data", [])
+    # Determine base and existing locales (one fetch per platform, reused below)
+    localizations_by_platform = fetch_platform_localizations(asc, selected)
+    locs = localizations_by_platform[next(iter(selected))]
     if not locs:
         print_error("No localizations found")
         return True
@@ -44,20 +60,17 @@ def run(cli) -> bool:
         return True
     print_info(f"Base language: {base_locale} ({APP_STORE_LOCALES.get(base_locale, 'Unknown')})")
 
-    base_attrs = {}
-    for l in locs:
-        if l["attributes"]["locale"] == base_locale:
-            base_attrs = l["attributes"]
-            break
-    if not any([base_attrs.get("description"), base_attrs.get("keywords"), base_attrs.get("promotionalText"), base_attrs.get("whatsNew")]):
+    attrs_by_locale = {l["attributes"]["locale"]: l["attributes"] for l in locs}
+    base_attrs = attrs_by_locale.get(base_locale) or {}
+    if not any(base_attrs.get(attr) for attr, _limit_key, _label in SETUP_FIELDS):
         print_error("Base localization has no content to translate")
         return True
 
     # Missing locales union
+    existing_by_platform = {plat: index_by_locale(ls) for plat, ls in localizations_by_platform.items()}
     union_existing = set()
-    for plat, ver in selected.items():
-        ls = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-        union_existing |= {x["attributes"]["locale"] for x in ls}
+    for by_locale in existing_by_platform.values():
+        union_existing |= by_locale.keys()
     supported_minus_base = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
     existing_minus_base = {loc for loc in union_existing if loc and loc != base_locale}
     missing = [loc for loc in supported_minus_base.keys() if loc not in union_existing]
@@ -68,14 +81,14 @@ def run(cli) -> bool:
         return True
 
     if scope == "existing":
-        available_targets = {loc: supported_minus_base[loc] for loc in sorted(existing_minus_base) if loc in supported_minus_base}
         preferred = sorted(existing_minus_base)
+        available_targets = {loc: supported_minus_base[loc] for loc in preferred if loc in supported_minus_base}
     elif scope == "all":
         available_targets = supported_minus_base
         preferred = sorted(existing_minus_base)
     else:
         available_targets = {loc: supported_minus_base[loc] for loc in sorted(missing) if loc in supported_minus_base}
-        preferred = sorted(available_targets.keys())
+        preferred = list(available_targets)
 
     if not available_targets:
         print_info("No locales available for that selection")
@@ -107,35 +120,44 @@ def run(cli) -> bool:
     print_info(f"AI provider: {pname} — model: {pmodel or 'n/a'}{tier_txt} — seed: {seed}")
 
     print_info(f"Starting full setup for {len(target_locales)} languages across {len(selected)} platform(s)...")
+    # Field specs for one structured request per locale (see translate_fields_with_validation)
+    field_specs = {}
+    for attr, limit_key, label in SETUP_FIELDS:
+        if not base_attrs.get(attr):
+            continue
+        spec = {"text": base_attrs[attr], "max_length": get_field_limit(limit_key), "field_label": label}
+        if attr == "keywords":
+            spec.update(is_keywords=True, single_line=True)
+        field_specs[attr] = spec
+
     def _task(loc: str):
         language_name = APP_STORE_LOCALES.get(loc, loc)
-        translated = {}
-        if base_attrs.get("description"):
-            translated["description"] = translate_with_validation(
-                provider, base_attrs["description"], language_name,
-                max_length=get_field_limit("description"), seed=seed, refinement=refine_phrase,
-                field_label="App description",
-            )
-        if base_attrs.get("keywords"):
-            kw = translate_with_validation(
-                provider, base_attrs["keywords"], language_name,
-                max_length=get_field_limit("keywords"), is_keywords=True, seed=seed,
-                refinement=refine_phrase, field_label="App keywords", single_line=True,
-            )
-            translated["keywords"] = truncate_keywords(kw)
-        if base_attrs.get("promotionalText"):
-            translated["promotionalText"] = translate_with_validation(
-                provider, base_attrs["promotionalText"], language_name,
-                max_length=get_field_limit("promotional_text"), seed=seed, refinement=refine_phrase,
-                field_label="Promotional text",
-            )
-        if base_attrs.get("whatsNew"):
-            translated["whatsNew"] = translate_with_validation(
-                provider, base_attrs["whatsNew"], language_name,
-                max_length=get_field_limit("whats_new"), seed=seed, refinement=refine_phrase,
-                field_label="What's New",
+        translated = translate_fields_with_validation(
+            provider, field_specs, language_name, seed=seed, refinement=refine_phrase,
+        ) if field_specs else {}
+        if "keywords" in translated:
+            translated["keywords"] = truncate_keywords(translated["keywords"])
+        # Save from the worker so ASC writes overlap with other locales' translations
+        for plat, ver in selected.items():
+            existing = existing_by_platform[plat].get(loc)
+            if existing:
+                # Known from the initial fetch: update instead of a create that would 409
+                asc.update_app_store_version_localization(
+                    localization_id=existing["id"],
+                    description=translated.get("description"),
+                    keywords=translated.get("keywords"),
+                    promotional_text=translated.get("promotionalText"),
+                    whats_new=translated.get("whatsNew"),
+                )
+                continue
+            asc.create_app_store_version_localization(
+                version_id=ver["id"],
+                locale=loc,
+                description=translated.get("description", ""),
+                keywords=translated.get("keywords"),
+                promotional_text=translated.get("promotionalText"),
+                whats_new=translated.get("whatsNew"),
             )
-        time.sleep(1)
         return translated
 
     results, errs = parallel_map_locales(target_locales, _task, progress_action="Setup", pacing_seconds=0.0)
@@ -148,17 +170,6 @@ def run(cli) -> bool:
         if not has_any:
             print_warning(f"Empty translation for {language_name} [{loc}]")
 
-    for target_locale, translated in results.items():
-        for plat, ver in selected.items():
-            asc.create_app_store_version_localization(
-                version_id=ver["id"],
-                locale=target_locale,
-                description=translated.get("description", ""),
-                keywords=translated.get("keywords"),
-                promotional_text=translated.get("promotionalText"),
-                whats_new=translated.get("whatsNew"),
-            )
-
     print_success("✅ Full setup completed!")
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
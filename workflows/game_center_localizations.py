@@ -4,13 +4,13 @@ Game Center localization workflow.
 Translates Game Center localizations (achievements, leaderboards, activities, challenges).
 """
 
-import time
 import os
 from urllib.parse import urlparse
 
 import requests
 from typing import Dict, List, Optional, Tuple
 
+from app_store_client import ASCConflictError
 from translation_validation import translate_with_validation
 from utils import (
     APP_STORE_LOCALES,
@@ -20,11 +20,12 @@ from utils import (
     print_warning,
     print_error,
     print_success,
+    parallel_map_fields,
     parallel_map_locales,
     provider_model_info,
-    format_progress,
+    ProgressLine,
 )
-from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, pick_locale_scope
+from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, index_by_locale, pick_locale_scope
 
 
 def _choose_resource_types(ui) -> List[str]:
@@ -626,7 +627,7 @@ def run(cli) -> bool:
             "version_label": version_label,
         })
         all_localizations.extend(localizations)
-        locales = {l.get("attributes", {}).get("locale") for l in localizations if l.get("attributes", {}).get("locale")}
+        locales = set(index_by_locale(localizations))
         if locales:
             locale_sets.append(locales)
 
@@ -651,30 +652,29 @@ def run(cli) -> bool:
         return True
     print_info(f"Base locale: {base_locale} ({APP_STORE_LOCALES.get(base_locale, 'Unknown')})")
 
-    supported_locales = set(APP_STORE_LOCALES.keys())
+    # Set algebra against one frozen key set instead of rescanning every supported locale per item
+    supported_minus_base = frozenset(APP_STORE_LOCALES) - {base_locale}
     missing_union = set()
     existing_union = set()
     for record in item_records:
-        existing = {l.get("attributes", {}).get("locale") for l in record["localizations"] if l.get("attributes", {}).get("locale")}
-        existing_union.update({loc for loc in existing if loc and loc != base_locale})
-        missing = {loc for loc in supported_locales if loc != base_locale and loc not in existing}
-        missing_union.update(missing)
+        existing = index_by_locale(record["localizations"]).keys()
+        existing_union.update(existing - {base_locale})
+        missing_union |= supported_minus_base - existing
 
     scope = pick_locale_scope(ui, default="missing", prompt="Which locales do you want to include?")
     if scope == "back":
         print_warning("Cancelled")
         return True
 
-    supported_minus_base = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
     if scope == "existing":
-        available_targets = {loc: supported_minus_base[loc] for loc in sorted(existing_union) if loc in supported_minus_base}
         preferred = sorted(existing_union)
+        available_targets = {loc: APP_STORE_LOCALES[loc] for loc in preferred if loc in supported_minus_base}
     elif scope == "all":
-        available_targets = supported_minus_base
+        available_targets = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
         preferred = sorted(existing_union)
     else:
-        available_targets = {loc: supported_minus_base[loc] for loc in sorted(missing_union) if loc in supported_minus_base}
-        preferred = sorted(available_targets.keys())
+        available_targets = {loc: APP_STORE_LOCALES[loc] for loc in sorted(missing_union)}
+        preferred = list(available_targets)
 
     if not available_targets:
         print_warning("No locales available for that selection")
@@ -699,14 +699,9 @@ def run(cli) -> bool:
         print()
         print_info(f"({idx}/{len(item_records)}) Processing {label}")
 
-        base_attrs = next(
-            (l.get("attributes", {}) for l in localizations if l.get("attributes", {}).get("locale") == base_locale),
-            None,
-        )
-        base_loc = next(
-            (l for l in localizations if l.get("attributes", {}).get("locale") == base_locale),
-            None,
-        )
+        by_locale = index_by_locale(localizations)
+        base_loc = by_locale.get(base_locale)
+        base_attrs = base_loc.get("attributes", {}) if base_loc else None
         base_loc_id = base_loc.get("id") if isinstance(base_loc, dict) else None
         if not base_attrs:
             print_warning(f"Base locale {base_locale} not found for {label}; skipping")
@@ -734,9 +729,7 @@ def run(cli) -> bool:
                 print_warning(f"Image copy skipped for {label}: {status}")
 
         existing_locale_ids: Dict[str, str] = {
-            l.get("attributes", {}).get("locale"): l.get("id")
-            for l in localizations
-            if l.get("id") and l.get("attributes", {}).get("locale")
+            locale: l.get("id") for locale, l in by_locale.items() if l.get("id")
         }
         missing_locales = [loc for loc in target_locales if loc not in existing_locale_ids]
         if not missing_locales:
@@ -757,8 +750,9 @@ def run(cli) -> bool:
 
             def _task(loc: str):
                 language_name = APP_STORE_LOCALES.get(loc, loc)
-                translated = {
-                    "name": _translate_required(
+                # Fields are independent: translate them side by side
+                return parallel_map_fields({
+                    "name": lambda: _translate_required(
                         provider,
                         base_name,
                         language_name,
@@ -767,7 +761,7 @@ def run(cli) -> bool:
                         "name",
                         max_length=name_limit,
                     ),
-                    "before": _translate_required(
+                    "before": lambda: _translate_required(
                         provider,
                         base_before,
                         language_name,
@@ -776,7 +770,7 @@ def run(cli) -> bool:
                         "before-earned description",
                         max_length=before_limit,
                     ),
-                    "after": _translate_required(
+                    "after": lambda: _translate_required(
                         provider,
                         base_after,
                         language_name,
@@ -785,23 +779,13 @@ def run(cli) -> bool:
                         "after-earned description",
                         max_length=after_limit,
                     ),
-                }
-                time.sleep(1)
-                return translated
+                })
 
             results, errs = parallel_map_locales(missing_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
             success_count = 0
             total_targets = len(missing_locales)
-            completed = 0
-            last_progress_len = 0
-            try:
-                line = format_progress(0, total_targets, "Saving locales...")
-                print(line, end="\r")
-                last_progress_len = len(line)
-            except Exception:
-                # Ignore progress display errors (e.g., broken pipes, non-interactive output)
-                pass
+            progress = ProgressLine(total_targets, "Saving locales...")
 
             for loc, data in results.items():
                 name = (data.get("name") or "").strip()
@@ -810,15 +794,7 @@ def run(cli) -> bool:
                 if not (name and before and after):
                     language_name = APP_STORE_LOCALES.get(loc, loc)
                     print_error(f"  ❌ Skipping {language_name}: required fields are empty")
-                    completed += 1
-                    try:
-                        line = format_progress(completed, total_targets, f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
-                        pad = max(0, last_progress_len - len(line))
-                        print("\r" + line + (" " * pad), end="")
-                        last_progress_len = len(line)
-                    except Exception:
-                        # Ignore progress display errors so they don't interrupt the main workflow
-                        pass
+                    progress.advance(f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
                     continue
 
                 language_name = APP_STORE_LOCALES.get(loc, loc)
@@ -835,7 +811,7 @@ def run(cli) -> bool:
                     target_loc_id = created.get("data", {}).get("id") or target_loc_id
                     saved = True
                 except Exception as e:
-                    if "409" in str(e):
+                    if isinstance(e, ASCConflictError):
                         try:
                             refreshed = asc.get_game_center_achievement_localizations(item_id)
                             refreshed_map = {l.get("attributes", {}).get("locale"): l.get("id") for l in refreshed.get("data", [])}
@@ -865,25 +841,13 @@ def run(cli) -> bool:
                     elif result not in ("upload_complete", "target_has_image", "commit_failed"):
                         detail = f" ({err})" if err else ""
                         print_warning(f"  ⚠️  Image copy skipped for {language_name}: {result}{detail}")
-                completed += 1
-                try:
-                    status = "Saved" if saved else "Failed"
-                    line = format_progress(completed, total_targets, f"{status} {language_name}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    # Ignore progress display errors so they don't interrupt the main workflow
-                    pass
+                status = "Saved" if saved else "Failed"
+                progress.advance(f"{status} {language_name}")
 
             if errs:
                 print()
                 print_warning(f"{len(errs)} locales failed for {label}")
-            try:
-                print("\r" + (" " * last_progress_len) + "\r", end="")
-            except Exception:
-                # Ignore errors clearing progress line
-                pass
+            progress.clear()
             total_translated += success_count
             print_success(f"Saved {success_count}/{len(missing_locales)} locales for {label}")
 
@@ -902,8 +866,9 @@ def run(cli) -> bool:
 
             def _task(loc: str):
                 language_name = APP_STORE_LOCALES.get(loc, loc)
-                translated = {
-                    "name": _translate_required(
+                # Fields are independent: translate them side by side
+                return parallel_map_fields({
+                    "name": lambda: _translate_required(
                         provider,
                         base_name,
                         language_name,
@@ -912,41 +877,25 @@ def run(cli) -> bool:
                         "name",
                         max_length=name_limit,
                     ),
-                    "description": _translate_required(
+                    "description": lambda: _translate_required(
                         provider, base_desc, language_name, refine_phrase, seed,
                         "leaderboard description", max_length=desc_limit,
-                    )
-                    if base_desc
-                    else "",
-                    "formatterSuffix": _translate_required(
+                    ) if base_desc else "",
+                    "formatterSuffix": lambda: _translate_required(
                         provider, base_suffix, language_name, refine_phrase, seed,
                         "formatter suffix",
-                    )
-                    if base_suffix
-                    else "",
-                    "formatterSuffixSingular": _translate_required(
+                    ) if base_suffix else "",
+                    "formatterSuffixSingular": lambda: _translate_required(
                         provider, base_suffix_singular, language_name, refine_phrase, seed,
                         "singular formatter suffix",
-                    )
-                    if base_suffix_singular
-                    else "",
-                }
-                time.sleep(1)
-                return translated
+                    ) if base_suffix_singular else "",
+                })
 
             results, errs = parallel_map_locales(missing_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
             success_count = 0
             total_targets = len(missing_locales)
-            completed = 0
-            last_progress_len = 0
-            try:
-                line = format_progress(0, total_targets, "Saving locales...")
-                print(line, end="\r")
-                last_progress_len = len(line)
-            except Exception:
-                # Ignore progress display errors (e.g., broken pipes, non-interactive output)
-                pass
+            progress = ProgressLine(total_targets, "Saving locales...")
 
             for loc, data in results.items():
                 name = (data.get("name") or "").strip()
@@ -956,15 +905,7 @@ def run(cli) -> bool:
                 if not name:
                     language_name = APP_STORE_LOCALES.get(loc, loc)
                     print_error(f"  ❌ Skipping {language_name}: name is empty (required)")
-                    completed += 1
-                    try:
-                        line = format_progress(completed, total_targets, f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
-                        pad = max(0, last_progress_len - len(line))
-                        print("\r" + line + (" " * pad), end="")
-                        last_progress_len = len(line)
-                    except Exception:
-                        # Ignore progress display errors so they don't interrupt the main workflow
-                        pass
+                    progress.advance(f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
                     continue
 
                 language_name = APP_STORE_LOCALES.get(loc, loc)
@@ -983,7 +924,7 @@ def run(cli) -> bool:
                     target_loc_id = created.get("data", {}).get("id") or target_loc_id
                     saved = True
                 except Exception as e:
-                    if "409" in str(e):
+                    if isinstance(e, ASCConflictError):
                         try:
                             refreshed = asc.get_game_center_leaderboard_localizations(item_id)
                             refreshed_map = {l.get("attributes", {}).get("locale"): l.get("id") for l in refreshed.get("data", [])}
@@ -1015,25 +956,13 @@ def run(cli) -> bool:
                     elif result not in ("upload_complete", "target_has_image", "commit_failed"):
                         detail = f" ({err})" if err else ""
                         print_warning(f"  ⚠️  Image copy skipped for {language_name}: {result}{detail}")
-                completed += 1
-                try:
-                    status = "Saved" if saved else "Failed"
-                    line = format_progress(completed, total_targets, f"{status} {language_name}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    # Ignore progress display errors so they don't interrupt the main workflow
-                    pass
+                status = "Saved" if saved else "Failed"
+                progress.advance(f"{status} {language_name}")
 
             if errs:
                 print()
                 print_warning(f"{len(errs)} locales failed for {label}")
-            try:
-                print("\r" + (" " * last_progress_len) + "\r", end="")
-            except Exception:
-                # Ignore errors clearing progress line
-                pass
+            progress.clear()
             total_translated += success_count
             print_success(f"Saved {success_count}/{len(missing_locales)} locales for {label}")
         else:
@@ -1055,8 +984,9 @@ def run(cli) -> bool:
 
             def _task(loc: str):
                 language_name = APP_STORE_LOCALES.get(loc, loc)
-                translated = {
-                    "name": _translate_required(
+                # Fields are independent: translate them side by side
+                return parallel_map_fields({
+                    "name": lambda: _translate_required(
                         provider,
                         base_name,
                         language_name,
@@ -1065,29 +995,17 @@ def run(cli) -> bool:
                         "name",
                         max_length=name_limit,
                     ),
-                    "description": _translate_required(
+                    "description": lambda: _translate_required(
                         provider, base_desc, language_name, refine_phrase, seed,
                         f"{kind} description", max_length=desc_limit,
-                    )
-                    if base_desc
-                    else "",
-                }
-                time.sleep(1)
-                return translated
+                    ) if base_desc else "",
+                })
 
             results, errs = parallel_map_locales(missing_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
             success_count = 0
             total_targets = len(missing_locales)
-            completed = 0
-            last_progress_len = 0
-            try:
-                line = format_progress(0, total_targets, "Saving locales...")
-                print(line, end="\r")
-                last_progress_len = len(line)
-            except Exception:
-                # Ignore progress display errors (e.g., broken pipes, non-interactive output)
-                pass
+            progress = ProgressLine(total_targets, "Saving locales...")
 
             for loc, data in results.items():
                 name = (data.get("name") or "").strip()
@@ -1095,15 +1013,7 @@ def run(cli) -> bool:
                 if not name:
                     language_name = APP_STORE_LOCALES.get(loc, loc)
                     print_error(f"  ❌ Skipping {language_name}: name is empty (required)")
-                    completed += 1
-                    try:
-                        line = format_progress(completed, total_targets, f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
-                        pad = max(0, last_progress_len - len(line))
-                        print("\r" + line + (" " * pad), end="")
-                        last_progress_len = len(line)
-                    except Exception:
-                        # Ignore progress display errors so they don't interrupt the main workflow
-                        pass
+                    progress.advance(f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
                     continue
 
                 language_name = APP_STORE_LOCALES.get(loc, loc)
@@ -1127,7 +1037,7 @@ def run(cli) -> bool:
                     target_loc_id = created.get("data", {}).get("id") or target_loc_id
                     saved = True
                 except Exception as e:
-                    if "409" in str(e):
+                    if isinstance(e, ASCConflictError):
                         try:
                             if kind == "activity":
                                 refreshed = asc.get_game_center_activity_version_localizations(version_id)
@@ -1166,25 +1076,13 @@ def run(cli) -> bool:
                     elif result not in ("upload_complete", "target_has_image", "commit_failed"):
                         detail = f" ({err})" if err else ""
                         print_warning(f"  ⚠️  Image copy skipped for {language_name}: {result}{detail}")
-                completed += 1
-                try:
-                    status = "Saved" if saved else "Failed"
-                    line = format_progress(completed, total_targets, f"{status} {language_name}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    # Ignore progress display errors so they don't interrupt the main workflow
-                    pass
+                status = "Saved" if saved else "Failed"
+                progress.advance(f"{status} {language_name}")
 
             if errs:
                 print()
                 print_warning(f"{len(errs)} locales failed for {label}")
-            try:
-                print("\r" + (" " * last_progress_len) + "\r", end="")
-            except Exception:
-                # Ignore errors clearing progress line
-                pass
+            progress.clear()
             total_translated += success_count
             print_success(f"Saved {success_count}/{len(missing_locales)} locales for {label}")
 
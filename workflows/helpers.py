@@ -2,9 +2,10 @@
 Shared workflow helpers for selection prompts and provider setup.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from utils import APP_STORE_LOCALES, print_error, print_info
+from utils import APP_STORE_LOCALES, print_error, print_info, print_warning
 
 
 def pick_locale_scope(
@@ -105,6 +106,16 @@ def pick_provider(
     return provider, selected_provider
 
 
+def _parse_locale_list(raw: str, available_targets: Dict[str, str]) -> List[str]:
+    """Parse comma-separated locales, keeping entry order and warning once about unknown codes."""
+    # Order-preserving de-duplication: a repeated locale would be translated twice
+    entered = dict.fromkeys(s.strip() for s in raw.split(",") if s.strip())
+    unknown = entered.keys() - available_targets.keys()
+    if unknown:
+        print_warning(f"Ignoring unavailable locales: {', '.join(sorted(unknown))}")
+    return [loc for loc in entered if loc in available_targets]
+
+
 def choose_target_locales(
     ui,
     available_targets: Dict[str, str],
@@ -141,7 +152,7 @@ def choose_target_locales(
             raw = input("Enter target locales (comma-separated): ").strip()
             if not raw:
                 return []
-            return [s.strip() for s in raw.split(",") if s.strip() in available_targets]
+            return _parse_locale_list(raw, available_targets)
         if selected:
             return [s for s in selected if s in available_targets]
         return []
@@ -163,7 +174,7 @@ def choose_target_locales(
         return []
     if raw.lower() in ("all", "*"):
         return [loc for loc in available_targets.keys() if loc != base_locale]
-    selected = [s.strip() for s in raw.split(',') if s.strip() in available_targets]
+    selected = _parse_locale_list(raw, available_targets)
     if selected:
         return selected
     if strict_invalid:
@@ -172,17 +183,26 @@ def choose_target_locales(
     return default_list
 
 
+def fetch_app_versions(ui, asc_client, app_id: str) -> List[dict]:
+    """App Store versions of an app, newest first (via the UI's listing cache when it has one)."""
+    list_app_versions = getattr(ui, "list_app_versions", None)
+    if callable(list_app_versions):
+        versions_resp = list_app_versions(asc_client, app_id)
+    else:
+        versions_resp = asc_client._request("GET", f"apps/{app_id}/appStoreVersions")
+    return versions_resp.get("data", [])
+
+
 def select_platform_versions(ui, asc_client, app_id: str):
     """Select latest version per platform for an app."""
-    versions_resp = asc_client._request("GET", f"apps/{app_id}/appStoreVersions")
-    versions = versions_resp.get("data", [])
+    versions = fetch_app_versions(ui, asc_client, app_id)
     if not versions:
         print_error("No App Store versions found for this app")
         return None, None, None
 
     latest_by_platform: Dict[str, dict] = {}
     for v in versions:
-        attrs = v.get("attributes", {})
+        attrs = v.get("attributes") or {}
         plat = attrs.get("platform", "UNKNOWN")
         if plat not in latest_by_platform:
             latest_by_platform[plat] = v
@@ -193,7 +213,7 @@ def select_platform_versions(ui, asc_client, app_id: str):
     if ui.available():
         choices = []
         for plat, v in latest_by_platform.items():
-            attrs = v.get("attributes", {})
+            attrs = v.get("attributes") or {}
             name = f"{plat_label.get(plat, plat)} v{attrs.get('versionString', 'Unknown')} ({attrs.get('appStoreState', 'Unknown')})"
             choices.append({"name": name, "value": plat, "enabled": True})
         picked = ui.checkbox("Select platforms (Space to toggle, Enter to confirm)", choices, add_back=True)
@@ -206,7 +226,7 @@ def select_platform_versions(ui, asc_client, app_id: str):
         print("Available platforms:")
         plats = list(latest_by_platform.keys())
         for i, plat in enumerate(plats, 1):
-            attrs = latest_by_platform[plat].get("attributes", {})
+            attrs = latest_by_platform[plat].get("attributes") or {}
             print(f"{i}. {plat_label.get(plat, plat)} v{attrs.get('versionString', 'Unknown')} ({attrs.get('appStoreState', 'Unknown')})")
         raw = input("Select platforms (comma numbers) or Enter for all, 'b' to back: ").strip().lower()
         if raw == 'b':
@@ -228,13 +248,48 @@ def select_platform_versions(ui, asc_client, app_id: str):
     return selected_versions, latest_by_platform, plat_label
 
 
+def fetch_platform_localizations(asc_client, selected_versions: Dict[str, dict]) -> Dict[str, List[dict]]:
+    """Fetch version localizations for every selected platform concurrently.
+
+    The requests are independent, so issuing them side by side costs one
+    round-trip instead of one per platform. Errors propagate to the caller.
+    """
+    if not selected_versions:
+        return {}
+
+    def _fetch(ver: dict) -> List[dict]:
+        return asc_client.get_app_store_version_localizations(ver["id"]).get("data", [])
+
+    if len(selected_versions) == 1:
+        plat, ver = next(iter(selected_versions.items()))
+        return {plat: _fetch(ver)}
+    with ThreadPoolExecutor(max_workers=len(selected_versions)) as ex:
+        futures = {plat: ex.submit(_fetch, ver) for plat, ver in selected_versions.items()}
+        return {plat: fut.result() for plat, fut in futures.items()}
+
+
+def index_by_locale(localizations: Iterable[dict]) -> Dict[str, dict]:
+    """Map locale code -> localization resource in a single pass.
+
+    Resources without a locale are skipped; the first resource wins if a
+    locale repeats. Lets callers derive locale sets, id maps, and base
+    attributes without re-walking the list for each.
+    """
+    indexed: Dict[str, dict] = {}
+    for loc in localizations:
+        locale = (loc.get("attributes") or {}).get("locale")
+        if locale and locale not in indexed:
+            indexed[locale] = loc
+    return indexed
+
+
 def get_app_locales(asc_client, app_id: str) -> set:
     """Return locales available on the latest App Store version (if any)."""
     try:
         latest_ver = asc_client.get_latest_app_store_version(app_id)
         if latest_ver:
             locs = asc_client.get_app_store_version_localizations(latest_ver).get("data", [])
-            return {l.get("attributes", {}).get("locale") for l in locs if l.get("attributes", {}).get("locale")}
+            return set(index_by_locale(locs))
     except Exception:
         return set()
     return set()
@@ -5,9 +5,9 @@ Translates IAP display name and description to missing locales using the
 configured AI provider.
 """
 
-import time
 from typing import Dict, List, Optional, Tuple
 
+from app_store_client import ASCConflictError
 from translation_validation import translate_with_validation
 from utils import (
     APP_STORE_LOCALES,
@@ -17,11 +17,13 @@ from utils import (
     print_warning,
     print_error,
     print_success,
+    parallel_map_fields,
     parallel_map_locales,
     provider_model_info,
-    format_progress,
+    ProgressLine,
+    pause_for_enter,
 )
-from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, pick_locale_scope
+from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, index_by_locale, pick_locale_scope
 
 
 def _select_iaps(ui, asc, app_id: str) -> List[Dict]:
@@ -83,15 +85,16 @@ def _build_iap_locale_plan(base_locale: str, existing_locale_ids: Dict[str, str]
     supported_minus_base = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
     existing_minus_base = {k for k in existing_locale_ids.keys() if k and k != base_locale}
     missing = {k for k in supported_minus_base.keys() if k not in existing_locale_ids}
+    existing_sorted = sorted(existing_minus_base)
     options = {
-        "existing": {k: supported_minus_base[k] for k in sorted(existing_minus_base) if k in supported_minus_base},
+        "existing": {k: supported_minus_base[k] for k in existing_sorted if k in supported_minus_base},
         "missing": {k: supported_minus_base[k] for k in sorted(missing) if k in supported_minus_base},
         "all": supported_minus_base,
     }
     preferred = {
-        "existing": sorted(existing_minus_base),
-        "missing": sorted(options["missing"].keys()),
-        "all": sorted(existing_minus_base),
+        "existing": existing_sorted,
+        "missing": list(options["missing"]),
+        "all": existing_sorted,
     }
     return options, preferred
 
@@ -154,7 +157,8 @@ def run(cli) -> bool:
             print_info(f"({idx}/{len(selected_iaps)}) Processing {label}")
             print_error("Could not detect base language for this IAP; skipping")
             continue
-        base_attrs = next((l.get("attributes", {}) for l in localizations if l.get("attributes", {}).get("locale") == base_locale), {})
+        by_locale = index_by_locale(localizations)
+        base_attrs = (by_locale.get(base_locale) or {}).get("attributes", {})
         base_name = base_attrs.get("name", "")
         base_description = base_attrs.get("description", "")
         if not (base_name or "").strip():
@@ -163,7 +167,7 @@ def run(cli) -> bool:
             print_info(f"({idx}/{len(selected_iaps)}) Processing {label}")
             print_error("Base localization is missing required name; skipping")
             continue
-        existing_locale_ids: Dict[str, str] = {l.get("attributes", {}).get("locale"): l.get("id") for l in localizations if l.get("id")}
+        existing_locale_ids: Dict[str, str] = {locale: l.get("id") for locale, l in by_locale.items() if l.get("id")}
         locale_options, preferred_locales = _build_iap_locale_plan(base_locale, existing_locale_ids, app_locales)
         prepared_iaps.append(
             {
@@ -253,46 +257,32 @@ def run(cli) -> bool:
 
         def _task(loc: str):
             language_name = APP_STORE_LOCALES.get(loc, loc)
-            translated = {
-                "name": translate_with_validation(
+            field_tasks = {
+                "name": lambda: translate_with_validation(
                     provider, base_name, language_name, max_length=name_limit, seed=seed,
                     refinement=refine_phrase, field_label="In-app purchase display name",
                     single_line=True,
                 )
             }
             if base_description:
-                translated["description"] = translate_with_validation(
+                field_tasks["description"] = lambda: translate_with_validation(
                     provider, base_description, language_name, max_length=desc_limit, seed=seed,
                     refinement=refine_phrase, field_label="In-app purchase description",
                     single_line=True,
                 )
-            time.sleep(1)
+            translated = parallel_map_fields(field_tasks)
             return translated
 
         results, errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
         success_count = 0
         total_targets = len(target_locales)
-        completed = 0
-        last_progress_len = 0
-        try:
-            line = format_progress(0, total_targets, "Saving locales...")
-            print(line, end="\r")
-            last_progress_len = len(line)
-        except Exception:
-            pass
+        progress = ProgressLine(total_targets, "Saving locales...")
         for loc, data in results.items():
             if not (data.get("name") or "").strip():
                 language_name = APP_STORE_LOCALES.get(loc, loc)
                 print_error(f"  ❌ Skipping {language_name}: translated name is empty (required)")
-                completed += 1
-                try:
-                    line = format_progress(completed, total_targets, f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    pass
+                progress.advance(f"Skipped {APP_STORE_LOCALES.get(loc, loc)}")
                 continue
             loc_id = existing_locale_ids.get(loc)
             try:
@@ -306,17 +296,10 @@ def run(cli) -> bool:
                         data.get("description"),
                     )
                 success_count += 1
-                completed += 1
-                try:
-                    line = format_progress(completed, total_targets, f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    pass
+                progress.advance(f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
             except Exception as e:
                 # If creation conflicted, try to refresh and update instead
-                if "409" in str(e) and not loc_id:
+                if isinstance(e, ASCConflictError) and not loc_id:
                     try:
                         refreshed = asc.get_in_app_purchase_localizations(iap.get("id"))
                         refreshed_map = {l.get("attributes", {}).get("locale"): l.get("id") for l in refreshed.get("data", [])}
@@ -325,28 +308,18 @@ def run(cli) -> bool:
                             asc.update_in_app_purchase_localization(new_id, data.get("name"), data.get("description"))
                             success_count += 1
                             existing_locale_ids[loc] = new_id
-                            completed += 1
-                            try:
-                                line = format_progress(completed, total_targets, f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
-                                pad = max(0, last_progress_len - len(line))
-                                print("\r" + line + (" " * pad), end="")
-                                last_progress_len = len(line)
-                            except Exception:
-                                pass
+                            progress.advance(f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
                             continue
                     except Exception:
                         pass
                 language_name = APP_STORE_LOCALES.get(loc, loc)
                 print_error(f"  ❌ Failed to save {language_name}: {e}")
 
-        try:
-            print("\r" + (" " * last_progress_len) + "\r", end="")
-        except Exception:
-            pass
+        progress.clear()
         total_translated += success_count
         print_success(f"Saved {success_count}/{len(target_locales)} locales for {label}")
 
     print()
     print_success(f"In-App Purchase translation finished. Localizations saved: {total_translated}")
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
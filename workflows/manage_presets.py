@@ -116,7 +116,7 @@ def _create_preset(cli) -> None:
         )
         return txt
 
-    translated, errors = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=1.0)
+    translated, errors = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
     print()
     if errors:
         print_error("Unable to create preset; some translations failed:")
@@ -13,8 +13,9 @@ from utils import (
     show_provider_and_source,
     build_refinement_template,
     parse_refinement_template,
+    pause_for_enter,
 )
-from workflows.helpers import pick_provider, select_platform_versions
+from workflows.helpers import fetch_platform_localizations, pick_provider, select_platform_versions
 from workflows.promo_helpers import (
     apply_promotional_updates,
     edit_promotional_translations,
@@ -103,10 +104,9 @@ def run(cli) -> bool:
     per_version_locales: Dict[str, Dict[str, dict]] = {}
     base_locale: Optional[str] = None
     base_promotional = ""
-    for plat, ver in selected_versions.items():
-        vid = ver.get("id")
-        locs_resp = asc.get_app_store_version_localizations(vid)
-        locs = locs_resp.get("data", [])
+    localizations_by_platform = fetch_platform_localizations(asc, selected_versions)
+    for plat in selected_versions:
+        locs = localizations_by_platform.get(plat, [])
         locale_map: Dict[str, dict] = {}
         for loc in locs:
             attrs = loc.get("attributes", {})
@@ -303,5 +303,5 @@ def run(cli) -> bool:
     except Exception:
         pass
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
@@ -10,6 +10,7 @@ from utils import (
     parallel_map_locales,
     print_info,
     print_success,
+    print_translation_previews,
     print_warning,
 )
 
@@ -41,7 +42,7 @@ def generate_promotional_translations(
         target_locales,
         _task,
         progress_action="Translated",
-        pacing_seconds=1.0,
+        pacing_seconds=0.0,
     )
     return translations
 
@@ -50,16 +51,7 @@ def preview_promotional_translations(target_locales: List[str], translations: Di
     """Print a preview of translated promotional text for each locale."""
 
     print_info("Preview generated promotional text:")
-    for loc in target_locales:
-        language = APP_STORE_LOCALES.get(loc, loc)
-        print("-" * 60)
-        print(f"{language} [{loc}]")
-        print("-" * 60)
-        txt = translations.get(loc, "")
-        print(txt)
-        if not (txt or "").strip():
-            print_warning(f"Empty translation for {language} [{loc}]")
-        print()
+    print_translation_previews([(loc, translations.get(loc, "")) for loc in target_locales])
 
 
 def edit_promotional_translations(
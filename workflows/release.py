@@ -2,15 +2,15 @@
 Release Mode workflow: create and translate What's New notes, multi-platform.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import sys
 import textwrap
 
 from translation_validation import strip_emoji, translate_with_validation
 from release_presets import list_presets, ReleaseNotePreset
 
-from utils import APP_STORE_LOCALES, get_field_limit, print_info, print_warning, print_success, print_error, parallel_map_locales, show_provider_and_source, build_refinement_template, parse_refinement_template
-from workflows.helpers import pick_provider, select_platform_versions
+from utils import APP_STORE_LOCALES, get_field_limit, print_info, print_warning, print_success, print_error, print_translation_previews, parallel_map_locales, show_provider_and_source, build_refinement_template, parse_refinement_template, pause_for_enter
+from workflows.helpers import fetch_platform_localizations, pick_provider, select_platform_versions
 
 
 def _preset_preview_text(preset: ReleaseNotePreset, base_locale: str) -> str:
@@ -103,10 +103,9 @@ def run(cli) -> bool:
     per_version_locales: Dict[str, Dict[str, dict]] = {}
     base_locale = None
     base_whats_new = ""
-    for plat, ver in selected_versions.items():
-        vid = ver.get("id")
-        locs_resp = asc.get_app_store_version_localizations(vid)
-        locs = locs_resp.get("data", [])
+    localizations_by_platform = fetch_platform_localizations(asc, selected_versions)
+    for plat in selected_versions:
+        locs = localizations_by_platform.get(plat, [])
         locale_map: Dict[str, dict] = {}
         for loc in locs:
             attrs = loc.get("attributes", {})
@@ -252,26 +251,25 @@ def run(cli) -> bool:
             selected_preset = None
 
     # Determine empty locales
-    empty_by_platform: Dict[str, List[str]] = {}
-    filled_by_platform: Dict[str, List[str]] = {}
-    union_empty: List[str] = []
-    union_filled: List[str] = []
+    # Sets per platform for membership checks; ordered dicts keep first-seen order for display
+    empty_by_platform: Dict[str, Set[str]] = {}
+    filled_by_platform: Dict[str, Set[str]] = {}
+    union_empty: Dict[str, None] = {}
+    union_filled: Dict[str, None] = {}
     base_missing_platforms: List[str] = []
     for plat, locale_map in per_version_locales.items():
-        empties: List[str] = []
-        filled: List[str] = []
+        empties: Set[str] = set()
+        filled: Set[str] = set()
         for locale, data in locale_map.items():
             if locale == base_locale:
                 continue
             wn = (data.get("whatsNew") or "").strip()
             if not wn:
-                empties.append(locale)
-                if locale not in union_empty:
-                    union_empty.append(locale)
+                empties.add(locale)
+                union_empty[locale] = None
             else:
-                filled.append(locale)
-                if locale not in union_filled:
-                    union_filled.append(locale)
+                filled.add(locale)
+                union_filled[locale] = None
         empty_by_platform[plat] = empties
         filled_by_platform[plat] = filled
         base_here = (locale_map.get(base_locale, {}).get("whatsNew") or "").strip()
@@ -290,11 +288,10 @@ def run(cli) -> bool:
         return True
 
     # Select target locales
-    candidate_locales = list(union_empty)
+    candidates = dict(union_empty)
     if include_existing:
-        for loc in union_filled:
-            if loc not in candidate_locales:
-                candidate_locales.append(loc)
+        candidates.update(union_filled)
+    candidate_locales = list(candidates)
 
     if candidate_locales:
         if ui.available():
@@ -320,7 +317,7 @@ def run(cli) -> bool:
             if raw.lower() == 'b':
                 print_info("Cancelled")
                 return True
-            target_locales = candidate_locales if not raw else [s.strip() for s in raw.split(',') if s.strip() in candidate_locales]
+            target_locales = candidate_locales if not raw else [s.strip() for s in raw.split(',') if s.strip() in candidates]
             if not target_locales:
                 print_warning("No valid locales selected")
                 return True
@@ -380,7 +377,7 @@ def run(cli) -> bool:
                 )
                 return txt
 
-            translations, _errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=1.0)
+            translations, _errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
         else:
             translations = {}
 
@@ -405,16 +402,10 @@ def run(cli) -> bool:
 
         if preview_locales:
             print_info("Preview generated release notes:")
-            for loc in preview_locales:
-                language = APP_STORE_LOCALES.get(loc, loc)
-                print("-" * 60)
-                print(f"{language} [{loc}]")
-                print("-" * 60)
-                txt = source_notes if loc == base_locale and selected_preset is not None else translations.get(loc, "")
-                print(txt)
-                if not (txt or "").strip():
-                    print_warning(f"Empty translation for {language} [{loc}]")
-                print()
+            print_translation_previews([
+                (loc, source_notes if loc == base_locale and selected_preset is not None else translations.get(loc, ""))
+                for loc in preview_locales
+            ])
 
         # Next step selection (apply / edit locales / re-enter source / cancel)
         do_edit = False
@@ -570,8 +561,8 @@ def run(cli) -> bool:
         if plat not in selected_versions:
             continue
         plat_name = plat_label.get(plat, plat)
-        locales_for_platform = empty_by_platform.get(plat, [])
-        filled_for_platform = filled_by_platform.get(plat, [])
+        locales_for_platform = empty_by_platform.get(plat, set())
+        filled_for_platform = filled_by_platform.get(plat, set())
         base_needs_update = plat in base_missing_platforms
         apply_locales = [
             loc
@@ -626,8 +617,8 @@ def run(cli) -> bool:
             verify_locales = [
                 loc
                 for loc in translated_locales
-                if loc in empty_by_platform.get(plat, [])
-                or (include_existing and loc in filled_by_platform.get(plat, []))
+                if loc in empty_by_platform.get(plat, set())
+                or (include_existing and loc in filled_by_platform.get(plat, set()))
             ]
             for loc in verify_locales:
                 data = asc.get_app_store_version_localization(locale_map[loc]["id"]) or {}
@@ -639,5 +630,5 @@ def run(cli) -> bool:
     except Exception:
         pass
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
@@ -5,7 +5,6 @@ Translates subscription name and description to missing locales.
 """
 
 import json
-import time
 from typing import Dict, List, Tuple
 
 from translation_validation import translate_with_validation
@@ -17,11 +16,13 @@ from utils import (
     print_warning,
     print_error,
     print_success,
+    parallel_map_fields,
     parallel_map_locales,
     provider_model_info,
-    format_progress,
+    ProgressLine,
+    pause_for_enter,
 )
-from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, pick_locale_scope
+from workflows.helpers import pick_provider, choose_target_locales, get_app_locales, index_by_locale, pick_locale_scope
 
 
 SUBSCRIPTION_LOCALIZATION_LOCKED_STATES = {
@@ -131,8 +132,8 @@ def _translate_locale_fields(provider, base_name: str, base_desc: str,
                              language_name: str, name_limit: int, desc_limit: int,
                              seed, refinement: str, *, group_scope: bool,
                              submission_retry: bool = False) -> Dict[str, str]:
-    translated = {
-        "name": translate_with_validation(
+    field_tasks = {
+        "name": lambda: translate_with_validation(
             provider, base_name, language_name, max_length=name_limit, seed=seed,
             refinement=refinement,
             field_label="Subscription display name",
@@ -143,7 +144,7 @@ def _translate_locale_fields(provider, base_name: str, base_desc: str,
     }
     if base_desc:
         field = "customAppName" if group_scope else "description"
-        translated[field] = translate_with_validation(
+        field_tasks[field] = lambda: translate_with_validation(
             provider, base_desc, language_name, max_length=desc_limit, seed=seed,
             refinement=refinement,
             field_label=("Subscription group app name" if group_scope else "Subscription description"),
@@ -151,7 +152,7 @@ def _translate_locale_fields(provider, base_name: str, base_desc: str,
             forbid_emoji=True,
             submission_retry=submission_retry,
         )
-    return translated
+    return parallel_map_fields(field_tasks)
 
 
 def _build_subscription_locale_plan(base_locale: str, existing_locale_ids: Dict[str, str]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, List[str]]]:
@@ -159,15 +160,16 @@ def _build_subscription_locale_plan(base_locale: str, existing_locale_ids: Dict[
     supported_minus_base = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
     existing_minus_base = {k for k in existing_locale_ids.keys() if k and k != base_locale}
     missing = {k for k in supported_minus_base.keys() if k not in existing_locale_ids}
+    existing_sorted = sorted(existing_minus_base)
     options = {
-        "existing": {k: supported_minus_base[k] for k in sorted(existing_minus_base) if k in supported_minus_base},
+        "existing": {k: supported_minus_base[k] for k in existing_sorted if k in supported_minus_base},
         "missing": {k: supported_minus_base[k] for k in sorted(missing) if k in supported_minus_base},
         "all": supported_minus_base,
     }
     preferred = {
-        "existing": sorted(existing_minus_base),
-        "missing": sorted(options["missing"].keys()),
-        "all": sorted(existing_minus_base),
+        "existing": existing_sorted,
+        "missing": list(options["missing"]),
+        "all": existing_sorted,
     }
     return options, preferred
 
@@ -357,7 +359,8 @@ def run(cli) -> bool:
                 print_error("Could not detect base language; skipping")
                 continue
 
-            base_attrs = next((l.get("attributes", {}) for l in locs if l.get("attributes", {}).get("locale") == base_locale), {})
+            by_locale = index_by_locale(locs)
+            base_attrs = (by_locale.get(base_locale) or {}).get("attributes", {})
             base_name = base_attrs.get("name", "")
             base_desc = base_attrs.get("description", "")
             if not base_name:
@@ -366,8 +369,8 @@ def run(cli) -> bool:
                 print_error("Base subscription name missing; skipping")
                 continue
 
-            existing_locale_ids: Dict[str, str] = {l.get("attributes", {}).get("locale"): l.get("id") for l in locs if l.get("id")}
-            existing_locale_attrs: Dict[str, Dict] = {l.get("attributes", {}).get("locale"): (l.get("attributes", {}) or {}) for l in locs if l.get("attributes")}
+            existing_locale_ids: Dict[str, str] = {locale: l.get("id") for locale, l in by_locale.items() if l.get("id")}
+            existing_locale_attrs: Dict[str, Dict] = {locale: l["attributes"] for locale, l in by_locale.items()}
             locale_options, preferred_locales = _build_subscription_locale_plan(base_locale, existing_locale_ids)
             prepared_subs.append(
                 {
@@ -457,7 +460,8 @@ def run(cli) -> bool:
                 print_error("Could not detect base language; skipping")
                 continue
 
-            base_attrs = next((l.get("attributes", {}) for l in locs if l.get("attributes", {}).get("locale") == base_locale), {})
+            by_locale = index_by_locale(locs)
+            base_attrs = (by_locale.get(base_locale) or {}).get("attributes", {})
             base_name = base_attrs.get("name", "")
             base_desc = base_attrs.get("customAppName", "")
             if not base_name:
@@ -466,8 +470,8 @@ def run(cli) -> bool:
                 print_error("Base subscription name missing; skipping")
                 continue
 
-            existing_locale_ids = {l.get("attributes", {}).get("locale"): l.get("id") for l in locs if l.get("id")}
-            existing_locale_attrs = {l.get("attributes", {}).get("locale"): (l.get("attributes", {}) or {}) for l in locs if l.get("attributes")}
+            existing_locale_ids = {locale: l.get("id") for locale, l in by_locale.items() if l.get("id")}
+            existing_locale_attrs = {locale: l["attributes"] for locale, l in by_locale.items()}
             locale_options, preferred_locales = _build_subscription_locale_plan(base_locale, existing_locale_ids)
             prepared_groups.append(
                 {
@@ -585,7 +589,6 @@ def run(cli) -> bool:
                 refine_phrase,
                 group_scope=scope != "sub",
             )
-            time.sleep(1)
             return translated
 
         results, errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
@@ -596,14 +599,7 @@ def run(cli) -> bool:
 
         success = 0
         total_targets = len(target_locales)
-        completed = 0
-        last_progress_len = 0
-        try:
-            line = format_progress(0, total_targets, "Saving locales...")
-            print(line, end="\r")
-            last_progress_len = len(line)
-        except Exception:
-            pass
+        progress = ProgressLine(total_targets, "Saving locales...")
         def _unique_root_match(loc_map: Dict[str, str], locale_code: str) -> str:
             # Never map region/script locales like en-AU to a different variant like en-US.
             # Only allow root matching when the requested locale has no region/script (e.g., fi vs fi-FI).
@@ -628,21 +624,13 @@ def run(cli) -> bool:
                 desired_desc = data.get("description") if scope == "sub" else data.get("customAppName")
                 if current_name == desired_name and (desired_desc is None or current_desc == desired_desc):
                     success += 1
-                    completed += 1
-                    try:
-                        line = format_progress(completed, total_targets, f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
-                        pad = max(0, last_progress_len - len(line))
-                        print("\r" + line + (" " * pad), end="")
-                        last_progress_len = len(line)
-                    except Exception:
-                        pass
+                    progress.advance(f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
                     continue
             try:
                 if scope == "sub":
                     if loc_id:
                         saved = asc.update_subscription_localization(loc_id, data.get("name"), data.get("description"))
                     else:
-                        time.sleep(0.25)
                         saved = asc.create_subscription_localization(sub.get("id"), loc, data.get("name", ""), data.get("description"))
                     saved_id = _require_saved_resource(saved, data, group_scope=False)
                     existing_locale_ids[loc] = saved_id
@@ -651,20 +639,12 @@ def run(cli) -> bool:
                     if loc_id:
                         saved = asc.update_subscription_group_localization(loc_id, data.get("name"), data.get("customAppName"))
                     else:
-                        time.sleep(0.25)
                         saved = asc.create_subscription_group_localization(sub.get("id"), loc, data.get("name", ""), data.get("customAppName"))
                     saved_id = _require_saved_resource(saved, data, group_scope=True)
                     existing_locale_ids[loc] = saved_id
                     existing_locale_attrs[loc] = {"name": data.get("name"), "customAppName": data.get("customAppName")}
                 success += 1
-                completed += 1
-                try:
-                    line = format_progress(completed, total_targets, f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
-                    pad = max(0, last_progress_len - len(line))
-                    print("\r" + line + (" " * pad), end="")
-                    last_progress_len = len(line)
-                except Exception:
-                    pass
+                progress.advance(f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
             except Exception as e:
                 language_name = APP_STORE_LOCALES.get(loc, loc)
                 if not _is_localization_validation_error(e):
@@ -717,7 +697,7 @@ def run(cli) -> bool:
                     saved_id = _require_saved_resource(saved, retry_data, group_scope=scope != "sub")
                     existing_locale_ids[loc] = saved_id
                     success += 1
-                    completed += 1
+                    progress.advance(f"Saved {APP_STORE_LOCALES.get(loc, loc)}")
                 except Exception as retry_error:
                     print_error(
                         f"Failed to save {language_name} after forced retranslation: "
@@ -725,11 +705,8 @@ def run(cli) -> bool:
                         f"(original error: {original_error})"
                     )
 
-        try:
-            print("\r" + (" " * last_progress_len) + "\r", end="")
-        except Exception:
-            pass
+        progress.clear()
         print_success(f"Saved {success}/{len(target_locales)} locales for {label}")
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
@@ -3,9 +3,10 @@ Translation Mode workflow with multi-platform handling.
 """
 
 from typing import Dict
-import time
 
-from translation_validation import translate_with_validation
+from batch_translation import batch_api_enabled, translate_locales_via_batch
+from source_state import load_source_state, translation_fingerprint, unchanged_fields
+from translation_validation import translate_fields_with_validation
 from utils import (
     APP_STORE_LOCALES,
     get_field_limit,
@@ -16,8 +17,15 @@ from utils import (
     detect_base_language,
     parallel_map_locales,
     provider_model_info,
+    pause_for_enter,
+)
+from workflows.helpers import (
+    choose_target_locales,
+    fetch_platform_localizations,
+    pick_locale_scope,
+    pick_provider,
+    select_platform_versions,
 )
-from workflows.helpers import pick_provider, select_platform_versions, choose_target_locales, pick_locale_scope
 
 
 def run(cli) -> bool:
@@ -60,11 +68,10 @@ def run(cli) -> bool:
     if not selected_versions:
         return True
 
-    # Use first platform to derive base + localizations
-    first_ver = next(iter(selected_versions.values()))
-    vid = first_ver["id"]
-    localizations_response = asc.get_app_store_version_localizations(vid)
-    localizations = localizations_response.get("data", [])
+    # Fetch every platform's localizations at once; the first platform derives base + localizations
+    localizations_by_platform = fetch_platform_localizations(asc, selected_versions)
+    first_plat = next(iter(selected_versions))
+    localizations = localizations_by_platform[first_plat]
     if not localizations:
         print_error("No existing localizations found")
         return True
@@ -76,61 +83,55 @@ def run(cli) -> bool:
     print_info(f"Detected base language: {base_locale} ({APP_STORE_LOCALES.get(base_locale, 'Unknown')})")
 
     # Source base data
-    base_data = None
-    for loc in localizations:
-        if loc["attributes"]["locale"] == base_locale:
-            base_data = loc["attributes"]
-            break
+    attrs_by_locale = {loc["attributes"]["locale"]: loc["attributes"] for loc in localizations}
+    base_data = attrs_by_locale.get(base_locale)
     if not base_data:
         print_error("Could not find base localization data")
         return True
 
     # Target languages (union across selected platforms)
     existing_by_platform: Dict[str, set] = {}
+    # locale -> localization id per platform, reused when applying translations
+    loc_ids_by_platform: Dict[str, Dict[str, str]] = {}
     locales_with_empty_description = set()
-    for plat, ver in selected_versions.items():
-        locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-        locale_codes = set()
+    for plat in selected_versions:
+        locs = localizations_by_platform.get(plat, [])
+        loc_ids: Dict[str, str] = {}
         for loc in locs:
             attrs = loc.get("attributes", {})
             locale_code = attrs.get("locale")
             if not locale_code:
                 continue
-            locale_codes.add(locale_code)
+            loc_ids[locale_code] = loc.get("id")
             if not (attrs.get("description") or "").strip():
                 locales_with_empty_description.add(locale_code)
-        existing_by_platform[plat] = locale_codes
+        existing_by_platform[plat] = set(loc_ids)
+        loc_ids_by_platform[plat] = loc_ids
 
     union_existing = set()
     for locales in existing_by_platform.values():
         union_existing.update(locales)
 
-    def _is_locale_available(loc: str) -> bool:
-        if loc == base_locale:
-            return False
-        if loc not in union_existing:
-            return True
-        return loc in locales_with_empty_description
-
     # Locale scope (existing/missing/all)
     scope = pick_locale_scope(ui, default="missing", prompt="Which locales do you want to translate?")
     if scope == "back":
         print_info("Cancelled")
         return True
 
-    supported_minus_base = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
-    existing_minus_base = {loc for loc in union_existing if loc and loc != base_locale}
-    missing_or_empty = {loc for loc in supported_minus_base.keys() if _is_locale_available(loc)}
+    # Set algebra over locale codes; display dicts are only built for the chosen scope
+    supported_minus_base = APP_STORE_LOCALES.keys() - {base_locale}
+    existing_minus_base = union_existing & supported_minus_base
+    missing_or_empty = (supported_minus_base - union_existing) | (locales_with_empty_description & supported_minus_base)
 
     if scope == "existing":
-        available_targets = {k: supported_minus_base[k] for k in sorted(existing_minus_base) if k in supported_minus_base}
         preferred = sorted(existing_minus_base)
+        available_targets = {k: APP_STORE_LOCALES[k] for k in preferred}
     elif scope == "all":
-        available_targets = supported_minus_base
+        available_targets = {k: v for k, v in APP_STORE_LOCALES.items() if k != base_locale}
         preferred = sorted(existing_minus_base)
     else:
-        available_targets = {k: supported_minus_base[k] for k in sorted(missing_or_empty) if k in supported_minus_base}
-        preferred = sorted(available_targets.keys())
+        available_targets = {k: APP_STORE_LOCALES[k] for k in sorted(missing_or_empty)}
+        preferred = list(available_targets)
 
     if not available_targets:
         print_warning("No locales available for that selection")
@@ -163,45 +164,94 @@ def run(cli) -> bool:
 
     # Translate and create per platform (parallel by locale)
     print_info(f"Starting translation for {len(target_locales)} languages across {len(selected_versions)} platform(s)...")
+    fields = {}
+    if base_data.get("description"):
+        fields["description"] = {
+            "text": base_data["description"], "max_length": get_field_limit("description"),
+            "field_label": "App description",
+        }
+    if base_data.get("keywords"):
+        fields["keywords"] = {
+            "text": base_data["keywords"], "max_length": get_field_limit("keywords"),
+            "field_label": "App keywords", "is_keywords": True, "single_line": True,
+        }
+    if base_data.get("promotionalText"):
+        fields["promotionalText"] = {
+            "text": base_data["promotionalText"], "max_length": get_field_limit("promotional_text"),
+            "field_label": "Promotional text",
+        }
+    if base_data.get("whatsNew"):
+        fields["whatsNew"] = {
+            "text": base_data["whatsNew"], "max_length": get_field_limit("whats_new"),
+            "field_label": "What's New",
+        }
+
+    # Skip fields already written from identical base text, with the same
+    # provider, model and refinement, on every platform (see source_state.py)
+    base_texts = {key: spec["text"] for key, spec in fields.items()}
+    fingerprint = translation_fingerprint(provider, refine_phrase)
+    states = {
+        plat: load_source_state(app_id, ver["id"], base_locale, fingerprint)
+        for plat, ver in selected_versions.items()
+    }
+    skipped: Dict[str, set] = {}
+    for loc in target_locales:
+        if not all(loc in loc_ids_by_platform.get(plat, {}) for plat in selected_versions):
+            continue
+        current = attrs_by_locale.get(loc) or {}
+        unchanged = {
+            key for key in unchanged_fields(states.values(), loc, base_texts)
+            if (current.get(key) or "").strip()
+        }
+        if unchanged:
+            skipped[loc] = unchanged
+            print_info(f"{APP_STORE_LOCALES.get(loc, loc)} [{loc}]: unchanged {', '.join(sorted(unchanged))}")
+    if skipped and ui.confirm(f"Skip unchanged fields in {len(skipped)} locale(s)?", default=True) is False:
+        skipped = {}
+    fields_by_locale = {
+        loc: {key: spec for key, spec in fields.items() if key not in skipped.get(loc, ())}
+        for loc in target_locales
+    }
+    fully_skipped = {loc for loc in skipped if not fields_by_locale[loc]}
+
+    # Large jobs can go through the provider's batch API (opt-in); anything it
+    # does not return validly is translated directly below.
+    prefilled: Dict[str, Dict[str, str]] = {}
+    batch_locales = [loc for loc in target_locales if loc not in fully_skipped]
+    if fields and batch_api_enabled(provider, len(batch_locales)):
+        try:
+            prefilled = translate_locales_via_batch(
+                provider, fields, batch_locales, seed=seed, refinement=refine_phrase,
+            )
+        except Exception as e:
+            print_warning(f"Batch API unavailable ({e}); translating directly")
+
     def _task(loc: str):
         language_name = APP_STORE_LOCALES.get(loc, loc)
-        translated = {}
-        if base_data.get("description"):
-            translated["description"] = translate_with_validation(
-                provider, base_data["description"], language_name,
-                max_length=get_field_limit("description"), seed=seed, refinement=refine_phrase,
-                field_label="App description",
-            )
-        if base_data.get("keywords"):
-            kw = translate_with_validation(
-                provider, base_data["keywords"], language_name,
-                max_length=get_field_limit("keywords"), is_keywords=True, seed=seed,
-                refinement=refine_phrase, field_label="App keywords", single_line=True,
-            )
-            translated["keywords"] = truncate_keywords(kw)
-        if base_data.get("promotionalText"):
-            translated["promotionalText"] = translate_with_validation(
-                provider, base_data["promotionalText"], language_name,
-                max_length=get_field_limit("promotional_text"), seed=seed, refinement=refine_phrase,
-                field_label="Promotional text",
-            )
-        if base_data.get("whatsNew"):
-            translated["whatsNew"] = translate_with_validation(
-                provider, base_data["whatsNew"], language_name,
-                max_length=get_field_limit("whats_new"), seed=seed, refinement=refine_phrase,
-                field_label="What's New",
-            )
+        loc_fields = fields_by_locale[loc]
+        done = prefilled.get(loc, {})
+        remaining = {key: spec for key, spec in loc_fields.items() if key not in done}
+        translated = dict(done)
+        if remaining:
+            # One structured request per locale; invalid fields fall back to single calls
+            translated.update(translate_fields_with_validation(
+                provider, remaining, language_name, seed=seed, refinement=refine_phrase,
+            ))
+        translated = {key: translated[key] for key in loc_fields if key in translated}
+        if "keywords" in translated:
+            translated["keywords"] = truncate_keywords(translated["keywords"])
         if base_data.get("marketingUrl"):
             translated["marketingUrl"] = base_data["marketingUrl"]
         if base_data.get("supportUrl"):
             translated["supportUrl"] = base_data["supportUrl"]
-        time.sleep(1)
         return translated
 
     results, errs = parallel_map_locales(target_locales, _task, progress_action="Translated", pacing_seconds=0.0)
 
     # Warn on empty translations per locale
     for loc in target_locales:
+        if loc in fully_skipped:
+            continue
         language_name = APP_STORE_LOCALES.get(loc, loc)
         data = results.get(loc) or {}
         has_any = any((v or "").strip() for v in data.values() if isinstance(v, str))
@@ -209,11 +259,12 @@ def run(cli) -> bool:
             print_warning(f"Empty translation for {language_name} [{loc}]")
 
     for target_locale, translated_data in results.items():
+        if target_locale in fully_skipped:
+            continue
+        written = {key: base_texts[key] for key in fields if (translated_data.get(key) or "").strip()}
         for plat, ver in selected_versions.items():
-            locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-            exists = any(l["attributes"]["locale"] == target_locale for l in locs)
-            if exists:
-                loc_id = next(l["id"] for l in locs if l["attributes"]["locale"] == target_locale)
+            loc_id = loc_ids_by_platform.get(plat, {}).get(target_locale)
+            if loc_id:
                 asc.update_app_store_version_localization(
                     localization_id=loc_id,
                     description=translated_data.get("description"),
@@ -234,10 +285,20 @@ def run(cli) -> bool:
                     marketing_url=translated_data.get("marketingUrl"),
                     support_url=translated_data.get("supportUrl"),
                 )
+            if states.get(plat) is not None:
+                states[plat].record(target_locale, written)
+    for state in states.values():
+        if state is not None:
+            state.save()
 
-    # Optional: App name/subtitle
+    # App name/subtitle live on a different endpoint; translated once the
+    # version localizations above are written
     if include_app_info:
-        print_warning("App name/subtitle translation for multi-platform is not yet implemented in this refactor.")
+        translate_app_info = getattr(cli, "_translate_app_info", None)
+        if translate_app_info is None:
+            print_warning("App name/subtitle translation is not available here; skipping")
+        else:
+            translate_app_info(app_id, list(target_locales), provider, refinement=refine_phrase)
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True
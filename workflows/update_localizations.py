@@ -2,16 +2,32 @@
 Update Mode workflow with multi-platform handling.
 """
 
-from typing import Dict
-import time
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
-from translation_validation import translate_with_validation
+from translation_validation import translate_fields_with_validation
 from utils import (
     APP_STORE_LOCALES, detect_base_language, get_field_limit, truncate_keywords,
-    print_info, print_warning, print_error, format_progress,
+    print_info, print_warning, print_error,
     parallel_map_locales, provider_model_info,
+    pause_for_enter,
 )
-from workflows.helpers import choose_target_locales, pick_provider, select_platform_versions
+from workflows.helpers import (
+    choose_target_locales,
+    fetch_platform_localizations,
+    index_by_locale,
+    pick_provider,
+    select_platform_versions,
+)
+
+
+# Update Mode field key -> (display label, App Store version localization attribute)
+UPDATE_FIELDS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "description": ("Description", "description"),
+    "keywords": ("Keywords", "keywords"),
+    "promotional_text": ("Promotional Text", "promotionalText"),
+    "whats_new": ("What's New", "whatsNew"),
+})
 
 
 def run(cli) -> bool:
@@ -31,11 +47,10 @@ def run(cli) -> bool:
     if not selected_versions:
         return True
 
-    # Use first platform to find base and content
-    first_ver = next(iter(selected_versions.values()))
-    vid = first_ver["id"]
-    localizations_response = asc.get_app_store_version_localizations(vid)
-    localizations = localizations_response.get("data", [])
+    # Fetch every platform's localizations once; reused for base detection, scope and apply.
+    # The first platform provides base language and content.
+    localizations_by_platform = fetch_platform_localizations(asc, selected_versions)
+    localizations = localizations_by_platform[next(iter(selected_versions))]
     if not localizations:
         print_error("No existing localizations found")
         return True
@@ -46,20 +61,22 @@ def run(cli) -> bool:
         return True
     print_info(f"Detected base language: {base_locale} ({APP_STORE_LOCALES.get(base_locale, 'Unknown')})")
 
-    base_data = None
-    for loc in localizations:
-        if loc["attributes"]["locale"] == base_locale:
-            base_data = loc["attributes"]
-            break
+    # One pass per platform: locale -> localization resource. The first
+    # platform's index also supplies the base content.
+    index_by_platform = {
+        plat: index_by_locale(localizations_by_platform.get(plat, [])) for plat in selected_versions
+    }
+    base_data = (index_by_platform[next(iter(selected_versions))].get(base_locale) or {}).get("attributes")
     if not base_data:
         print_error("Could not find base localization data")
         return True
 
     # Choose languages to update (existing, missing, or both)
-    existing_by_platform: Dict[str, set] = {}
-    for plat, ver in selected_versions.items():
-        locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-        existing_by_platform[plat] = {l["attributes"]["locale"] for l in locs}
+    # locale -> localization id per platform, reused when applying translations
+    loc_ids_by_platform: Dict[str, Dict[str, str]] = {
+        plat: {locale: loc["id"] for locale, loc in indexed.items()} for plat, indexed in index_by_platform.items()
+    }
+    existing_by_platform: Dict[str, set] = {plat: set(indexed) for plat, indexed in index_by_platform.items()}
     union_existing = set().union(*existing_by_platform.values())
     existing_locales = [l for l in union_existing if l != base_locale]
 
@@ -132,20 +149,14 @@ def run(cli) -> bool:
     }
 
     # Fields to update (available in base)
-    field_mapping = {
-        "description": ("Description", base_data.get("description")),
-        "keywords": ("Keywords", base_data.get("keywords")),
-        "promotional_text": ("Promotional Text", base_data.get("promotionalText")),
-        "whats_new": ("What's New", base_data.get("whatsNew")),
-    }
+    field_mapping = {field: (label, base_data.get(attr)) for field, (label, attr) in UPDATE_FIELDS.items()}
     available_fields = [k for k, (_, v) in field_mapping.items() if v]
     if not available_fields:
         print_error("No content found in base language to translate")
         return True
 
     if ui.available():
-        name_map = {"description": "Description", "keywords": "Keywords", "promotional_text": "Promotional Text", "whats_new": "What's New"}
-        choices = [{"name": name_map[f], "value": f} for f in available_fields]
+        choices = [{"name": field_mapping[f][0], "value": f} for f in available_fields]
         selected_fields = ui.checkbox("Select fields to update (Space to toggle, Enter to confirm)", choices, add_back=True)
         if not selected_fields:
             print_warning("No fields selected")
@@ -190,34 +201,38 @@ def run(cli) -> bool:
         return True
 
     print_info(f"Starting updates for {len(target_locales)} languages across {len(selected_versions)} platform(s)...")
+    # Field specs for one structured request per locale (see translate_fields_with_validation)
+    field_specs = {}
+    for field, (label, source_content) in field_mapping.items():
+        if not source_content:
+            continue
+        spec = {
+            "text": source_content,
+            "max_length": get_field_limit(field),
+            "field_label": label,
+        }
+        if field == "keywords":
+            spec.update(is_keywords=True, single_line=True)
+        field_specs[field] = spec
+
+    # Resolve the per-locale spec sets once: selected fields, plus description
+    # for locales that will be created (ASC requires it on create)
+    update_specs = {field: spec for field, spec in field_specs.items() if field in selected_fields}
+    create_specs = {
+        field: spec for field, spec in field_specs.items()
+        if field in selected_fields or field == "description"
+    }
+
     def _task(loc: str):
         language_name = APP_STORE_LOCALES.get(loc, loc)
-        translated = {}
-        fields_to_translate = set(selected_fields)
-        if allow_create_missing and needs_creation.get(loc):
-            # Creating a new App Store version localization requires a description attribute.
-            fields_to_translate.add("description")
-        for field in fields_to_translate:
-            field_name, source_content = field_mapping[field]
-            if not source_content:
-                continue
-            is_keywords = field == "keywords"
-            max_length = get_field_limit(field.replace("_", ""))
-            out = translate_with_validation(
-                provider,
-                source_content,
-                language_name,
-                max_length=max_length,
-                is_keywords=is_keywords,
-                seed=seed,
-                refinement=refine_phrase,
-                field_label=field.replace("_", " ").title(),
-                single_line=is_keywords,
-            )
-            if is_keywords:
-                out = truncate_keywords(out.strip())
-            translated[field] = out
-        time.sleep(1)
+        specs = create_specs if allow_create_missing and needs_creation.get(loc) else update_specs
+        if not specs:
+            return {}
+        translated = translate_fields_with_validation(
+            provider, specs, language_name, seed=seed, refinement=refine_phrase,
+        )
+        if "keywords" in translated:
+            translated["keywords"] = truncate_keywords(translated["keywords"].strip())
         return translated
 
     results, errs = parallel_map_locales(target_locales, _task, progress_action="Updated", pacing_seconds=0.0)
@@ -230,16 +245,11 @@ def run(cli) -> bool:
         if not has_any:
             print_warning(f"Empty translation for {language_name} [{loc}]")
 
-    # Apply translations per platform
+    # Apply translations per platform (localization ids from the initial fetch)
     for target_locale, translated in results.items():
         language_name = APP_STORE_LOCALES.get(target_locale, target_locale)
         for plat, ver in selected_versions.items():
-            locs = asc.get_app_store_version_localizations(ver["id"]).get("data", [])
-            loc_id = None
-            for l in locs:
-                if l["attributes"]["locale"] == target_locale:
-                    loc_id = l["id"]
-                    break
+            loc_id = loc_ids_by_platform.get(plat, {}).get(target_locale)
             if not loc_id:
                 if not allow_create_missing:
                     print_warning(f"  Locale {language_name} not found for platform {plat}; skipping")
@@ -266,8 +276,15 @@ def run(cli) -> bool:
             if locale_scope == "missing":
                 continue
 
-            update_payload = {field: translated.get(field) for field in selected_fields if field in translated}
+            # Only send fields that came back non-empty; an empty payload means no PATCH at all
+            update_payload = {
+                field: translated[field]
+                for field in selected_fields
+                if (translated.get(field) or "").strip()
+            }
+            if not update_payload:
+                continue
             asc.update_app_store_version_localization(localization_id=loc_id, **update_payload)
 
-    input("\nPress Enter to continue...")
+    pause_for_enter()
     return True